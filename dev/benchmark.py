@@ -0,0 +1,528 @@
+#! /usr/bin/env python
+
+"""
+Time various natsort operations.
+
+Give the names of the benchmarks to run on the command line,
+or no names to run them all.
+INTENDED TO BE CALLED FROM PROJECT ROOT, NOT FROM dev/!
+"""
+
+import os
+import random
+import re
+import sqlite3
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from functools import partial
+from pathlib import PurePath
+
+sys.path.insert(0, ".")
+
+from natsort import (  # noqa: E402
+    NatSortedList,
+    bisect_left,
+    index_natsorted,
+    natrank,
+    natsort_keygen,
+    natsort_lazy_keygen,
+    natsorted,
+    ns,
+)
+from natsort import sqlite, utils  # noqa: E402
+from natsort.utils import NumericalRegularExpressions  # noqa: E402
+
+
+def report(label, seconds, number):
+    """Print the time per call of a timed statement."""
+    print("{:<50} {:>12.3f} us".format(label, seconds / number * 1e6))
+
+
+def bench_keygen():
+    """Generating a key, with and without the key cache."""
+    number = 10000
+    for alg in (ns.DEFAULT, ns.REAL, ns.PATH | ns.IGNORECASE):
+
+        def uncached(_alg=alg):
+            natsort_keygen.cache_clear()
+            natsort_keygen(alg=_alg)
+
+        report(
+            "natsort_keygen(alg={}) uncached".format(alg),
+            timeit.timeit(uncached, number=number),
+            number,
+        )
+        report(
+            "natsort_keygen(alg={}) cached".format(alg),
+            timeit.timeit(lambda _alg=alg: natsort_keygen(alg=_alg), number=number),
+            number,
+        )
+    small = ["a10", "a2", "a1"]
+    report(
+        "natsorted(3 elements)",
+        timeit.timeit(lambda: natsorted(small), number=number),
+        number,
+    )
+
+
+def bench_regex():
+    """Generating an uncached key, with and without compiled regexes."""
+    number = 200
+
+    def cold():
+        natsort_keygen.cache_clear()
+        NumericalRegularExpressions._construct_regex.cache_clear()
+        re.purge()
+        natsort_keygen()
+
+    def warm():
+        natsort_keygen.cache_clear()
+        natsort_keygen()
+
+    report(
+        "natsort_keygen() compiling the regex",
+        timeit.timeit(cold, number=number),
+        number,
+    )
+    report(
+        "natsort_keygen() with compiled regex",
+        timeit.timeit(warm, number=number),
+        number,
+    )
+
+
+def bench_import():
+    """Importing natsort and its largest submodules, as per -X importtime."""
+    modules = ["natsort", "natsort.utils", "natsort.unicode_numbers"]
+    number = 20
+    totals = dict.fromkeys(modules, 0)
+    for _ in range(number):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import natsort"],
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            # Format is "import time: self [us] | cumulative | imported package"
+            _, cumulative, name = line.split("|")
+            if name.strip() in totals:
+                totals[name.strip()] += int(cumulative) * 1e-6
+    for name in modules:
+        report("import {} (cumulative)".format(name), totals[name], number)
+
+
+def bench_ascii():
+    """Parsing ASCII input (fast path) versus similar non-ASCII input."""
+    number = 100000
+    inputs = [
+        ("ASCII", "/usr/share/data/file_name_version_12_part3.tar.gz"),
+        ("non-ASCII", "/usr/share/data/f\u00efle_name_version_12_part3.tar.gz"),
+    ]
+    for alg in (ns.DEFAULT, ns.REAL):
+        key = natsort_keygen(alg=alg)
+        for label, value in inputs:
+            report(
+                "natsort_keygen(alg={}), {} input".format(alg, label),
+                timeit.timeit(partial(key, value), number=number),
+                number,
+            )
+
+
+def chained_natsort_keygen(alg):
+    """
+    Build a natsort key where the string parsing is a chain of iterators.
+
+    This is how parse_string_factory used to work, and is used as a
+    reference point for the single-pass version. PATH and locale-aware
+    algorithms are not supported.
+    """
+    sep = ""
+    splitter = utils.regex_chooser(alg).split
+    ascii_splitter = utils.regex_chooser(alg, ascii_only=True).split
+    normalize_input = utils._normalize_input_factory(alg)
+    input_transform = utils.input_string_transform_factory(alg)
+    component_transform = utils.string_component_transform_factory(alg)
+    final_transform = utils.final_data_transform_factory(alg, sep, sep)
+
+    def string_func(x):
+        if x.isascii():
+            x, original = input_transform(x), input_transform(x)
+            x = ascii_splitter(x)
+        else:
+            x = normalize_input(x)
+            x, original = input_transform(x), input_transform(x)
+            x = splitter(x)
+        x = filter(None, x)
+        x = map(component_transform, x)
+        x = utils.sep_inserter(x, sep)
+        return final_transform(x, original)
+
+    return partial(
+        utils.natsort_key,
+        key=None,
+        string_func=string_func,
+        bytes_func=utils.parse_bytes_factory(alg),
+        num_func=utils.parse_number_factory(alg, sep, sep),
+    )
+
+
+def bench_fused():
+    """Sorting 1M strings with chained versus single-pass string parsing."""
+    size = 1000000
+    rng = random.Random(0)
+    data = [
+        "{}{}_v{}.{}".format(
+            rng.choice(["file", "Image", "log-"]),
+            rng.randrange(10000),
+            rng.randrange(100),
+            rng.choice(["txt", "tar.gz", "5e3"]),
+        )
+        for _ in range(size)
+    ]
+    algs = [
+        ns.DEFAULT,
+        ns.FLOAT,
+        ns.REAL,
+        ns.IGNORECASE,
+        ns.LOWERCASEFIRST | ns.GROUPLETTERS,
+        ns.REAL | ns.NOEXP | ns.NANLAST,
+    ]
+    for alg in algs:
+        for label, key in [
+            ("chained", chained_natsort_keygen(alg)),
+            ("single-pass", natsort_keygen(alg=alg)),
+        ]:
+            report(
+                "sorted(1M strings, alg={}), {}".format(alg, label),
+                timeit.timeit(partial(sorted, data, key=key), number=1),
+                1,
+            )
+
+
+def exception_natsort_key(val, key, string_func, bytes_func, num_func):
+    """
+    The natsort_key implementation that tries each path in turn.
+
+    This is how natsort_key used to work, and is used as a reference
+    point for dispatching on the input type.
+    """
+    if key is not None:
+        val = key(val)
+    try:
+        return string_func(val)
+    except (TypeError, AttributeError):
+        if type(val) in (bytes,):
+            return bytes_func(val)
+        try:
+            return tuple(
+                exception_natsort_key(x, None, string_func, bytes_func, num_func)
+                for x in val
+            )
+        except TypeError:
+            return num_func(val)
+
+
+def bench_dispatch():
+    """Sorting numeric and mixed-type input, with and without type dispatch."""
+    size = 200000
+    rng = random.Random(0)
+    numbers = [rng.randrange(10 ** 9) for _ in range(size)]
+    floats = [rng.random() for _ in range(size)]
+    mixed = [
+        rng.choice([rng.randrange(1000), rng.random(), "a{}".format(rng.random())])
+        for _ in range(size)
+    ]
+    rows = [(rng.randrange(1000), "b{}".format(rng.randrange(10))) for _ in range(size)]
+    reference = natsort_keygen()
+    exception_key = partial(exception_natsort_key, **reference.keywords)
+    for label, data in [
+        ("ints", numbers),
+        ("floats", floats),
+        ("mixed", mixed),
+        ("tuples", rows),
+    ]:
+        for key_label, key in [("exceptions", exception_key), ("dispatch", reference)]:
+            report(
+                "sorted(200k {}), {}".format(label, key_label),
+                timeit.timeit(partial(sorted, data, key=key), number=1),
+                1,
+            )
+
+
+def bench_homogeneous():
+    """Sorting all-number and all-digit input, with and without the fast path."""
+    size = 200000
+    rng = random.Random(0)
+    numbers = [rng.randrange(10 ** 9) for _ in range(size)]
+    floats = [
+        rng.random() if rng.random() > 0.01 else float("nan") for _ in range(size)
+    ]
+    digits = [str(x) for x in numbers]
+    reference = natsort_keygen()
+    for label, data in [("ints", numbers), ("floats", floats), ("digits", digits)]:
+        report(
+            "sorted(200k {}, key=natsort_key)".format(label),
+            timeit.timeit(partial(sorted, data, key=reference), number=1),
+            1,
+        )
+        report(
+            "natsorted(200k {})".format(label),
+            timeit.timeit(partial(natsorted, data), number=1),
+            1,
+        )
+
+
+def bench_sqlite():
+    """Ordering a 1M-row SQLite table naturally, in SQL and in Python."""
+    random.seed(0)
+    names = [
+        "{}{}-v{}.{}".format(
+            random.choice(["file", "File", "img_", "track "]),
+            random.randint(0, 100000),
+            random.randint(0, 20),
+            random.choice(["txt", "png", "flac"]),
+        )
+        for _ in range(1000000)
+    ]
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE files (name TEXT)")
+    conn.executemany("INSERT INTO files VALUES (?)", ((x,) for x in names))
+    sqlite.create_key_function(conn)
+
+    natkey = natsort_keygen()
+
+    def uncached(a, b, _natkey=natkey):
+        a, b = _natkey(a), _natkey(b)
+        return (a > b) - (a < b)
+
+    conn.create_collation("UNCACHED", uncached)
+
+    def query(sql):
+        return conn.execute(sql).fetchall()
+
+    def python_natsorted():
+        return natsorted(x for x, in query("SELECT name FROM files"))
+
+    def collation():
+        # Include registration, so each run starts with an empty cache.
+        sqlite.create_collation(conn)
+        return query("SELECT name FROM files ORDER BY name COLLATE NATSORT")
+
+    report("1M rows: SELECT + natsorted", timeit.timeit(python_natsorted, number=1), 1)
+    expected = python_natsorted()
+    select = "SELECT name FROM files ORDER BY "
+    for label, func in [
+        ("name COLLATE NATSORT", collation),
+        ("NATSORT_KEY(name)", partial(query, select + "NATSORT_KEY(name)")),
+        ("name COLLATE UNCACHED", partial(query, select + "name COLLATE UNCACHED")),
+    ]:
+        assert [x for x, in func()] == expected
+        report("1M rows: ORDER BY " + label, timeit.timeit(func, number=1), 1)
+
+
+def bench_cache():
+    """Sorting 1M strings with many repeats, with and without a key cache."""
+    random.seed(0)
+    for distinct in (100, 10000, 1000000):
+        values = ["host-{}.rack{}".format(i, i % 7) for i in range(distinct)]
+        data = [random.choice(values) for _ in range(1000000)]
+        for cache in (None, True):
+            report(
+                "natsorted(1M, {} distinct, cache={})".format(distinct, cache),
+                timeit.timeit(partial(natsorted, data, cache=cache), number=1),
+                1,
+            )
+        natkey = natsort_keygen(cache=True)
+        data.sort(key=natkey)
+        print("    {}".format(natkey.cache_info()))
+
+
+def bench_dedupe():
+    """Argsorting 5M strings with 10k distinct values, with and without dedupe."""
+    random.seed(0)
+    values = ["SKU-{}-{}".format(random.choice("ABC"), i) for i in range(10000)]
+    data = [random.choice(values) for _ in range(5000000)]
+    for dedupe in (False, True):
+        report(
+            "index_natsorted(5M, dedupe={})".format(dedupe),
+            timeit.timeit(partial(index_natsorted, data, dedupe=dedupe), number=1),
+            1,
+        )
+    report("natrank(5M)", timeit.timeit(partial(natrank, data), number=1), 1)
+
+
+def bench_parallel():
+    """Sorting 1M strings serially and with worker processes."""
+    random.seed(0)
+    data = [
+        "file{}-{}.txt".format(random.randint(0, 10 ** 6), random.random())
+        for _ in range(1000000)
+    ]
+    print("    {} CPUs".format(os.cpu_count()))
+    for workers in (None, 2, 4, 8):
+        report(
+            "natsorted(1M, workers={})".format(workers),
+            timeit.timeit(partial(natsorted, data, workers=workers), number=1),
+            1,
+        )
+
+
+def bench_paginate():
+    """Getting one 100-element page of 1M sorted strings, by page position."""
+    random.seed(0)
+    data = [
+        "file{}-{}.txt".format(random.randint(0, 10 ** 6), random.random())
+        for _ in range(1000000)
+    ]
+    report("natsorted(1M)", timeit.timeit(partial(natsorted, data), number=1), 1)
+    for offset in (0, 1000, 100000, 500000, 999900):
+        report(
+            "natsorted(1M, offset={}, limit=100)".format(offset),
+            timeit.timeit(partial(natsorted, data, offset=offset, limit=100), number=1),
+            1,
+        )
+
+
+def bench_sortedlist():
+    """Adding and removing strings one at a time in a list of 100k."""
+    random.seed(0)
+    data = ["file{}.txt".format(random.randint(0, 10 ** 6)) for _ in range(100000)]
+    new = ["file{}.txt".format(random.randint(0, 10 ** 6)) for _ in range(1000)]
+    number = len(new)
+
+    def resort():
+        a = list(data)
+        for x in new[:20]:
+            a.append(x)
+            a = natsorted(a)
+
+    a = NatSortedList(data)
+
+    def sortedlist():
+        for x in new:
+            a.add(x)
+        for x in new:
+            a.remove(x)
+
+    report("natsorted after each append", timeit.timeit(resort, number=1), 20)
+    report("NatSortedList add + remove", timeit.timeit(sortedlist, number=1), number)
+    ordered = natsorted(data)
+    keys = list(map(natsort_keygen(), ordered))
+    report(
+        "bisect_left(100k)",
+        timeit.timeit(lambda: [bisect_left(ordered, x) for x in new], number=1),
+        number,
+    )
+    report(
+        "bisect_left(100k, keys=keys)",
+        timeit.timeit(
+            lambda: [bisect_left(ordered, x, keys=keys) for x in new], number=1
+        ),
+        number,
+    )
+
+
+def bench_lazy():
+    """Sorting 20k 2 KB log lines with eager and lazy keys."""
+    random.seed(0)
+    body = " ".join("field{}={}".format(i, random.random()) for i in range(80))
+    data = [
+        "2020-01-{:02d} host{} {}".format(random.randint(1, 31), i, body)
+        for i in range(20000)
+    ]
+    for name, keygen in (("eager", natsort_keygen), ("lazy", natsort_lazy_keygen)):
+        seconds = timeit.timeit(partial(sorted, data, key=keygen()), number=1)
+        report("sorted(20k log lines, {} keys)".format(name), seconds, 1)
+        # Memory is measured separately, since tracing slows the sort.
+        tracemalloc.start()
+        ordered = sorted(data, key=keygen())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del ordered
+        print("    peak memory {:.1f} MB".format(peak / 1e6))
+
+
+def bench_key_prefix():
+    """Sorting long URLs and log lines, with full and prefix keys."""
+    random.seed(0)
+    query = "&".join("p{}={}".format(i, random.random()) for i in range(40))
+    urls = [
+        "https://host{}.example.com/v{}/items/{}?{}".format(
+            random.randint(0, 99),
+            random.randint(1, 3),
+            random.randint(0, 10 ** 6),
+            query,
+        )
+        for _ in range(20000)
+    ]
+    body = " ".join("field{}={}".format(i, random.random()) for i in range(80))
+    logs = [
+        "2020-01-{:02d} host{} {}".format(random.randint(1, 31), i, body)
+        for i in range(20000)
+    ]
+    for name, data in (("URLs", urls), ("log lines", logs)):
+        for key_prefix in (None, True):
+            sort = partial(natsorted, data, key_prefix=key_prefix)
+            label = "natsorted(20k {}, key_prefix={})".format(name, key_prefix)
+            report(label, timeit.timeit(sort, number=1), 1)
+            tracemalloc.start()
+            sort()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("    peak memory {:.1f} MB".format(peak / 1e6))
+
+
+def bench_path():
+    """Splitting and sorting 200k paths given as str and as PurePath."""
+    random.seed(0)
+    data = [
+        "/data/shot_{}/take{}/frame_{}.{}.exr".format(
+            random.randint(0, 99), random.randint(1, 9), random.randint(0, 9999), i
+        )
+        for i in range(200000)
+    ]
+    paths = list(map(PurePath, data))
+
+    def split(values):
+        return [tuple(utils.path_splitter(x)) for x in values]
+
+    for name, values in (("str", data), ("PurePath", paths)):
+        report(
+            "path_splitter(200k {})".format(name),
+            timeit.timeit(partial(split, values), number=1),
+            1,
+        )
+        report(
+            "natsorted(200k {}, alg=ns.PATH)".format(name),
+            timeit.timeit(partial(natsorted, values, alg=ns.PATH), number=1),
+            1,
+        )
+
+
+benchmarks = {
+    "keygen": bench_keygen,
+    "regex": bench_regex,
+    "import": bench_import,
+    "ascii": bench_ascii,
+    "fused": bench_fused,
+    "dispatch": bench_dispatch,
+    "homogeneous": bench_homogeneous,
+    "sqlite": bench_sqlite,
+    "cache": bench_cache,
+    "dedupe": bench_dedupe,
+    "parallel": bench_parallel,
+    "paginate": bench_paginate,
+    "sortedlist": bench_sortedlist,
+    "lazy": bench_lazy,
+    "key_prefix": bench_key_prefix,
+    "path": bench_path,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or benchmarks:
+        print("*** {} ***".format(name))
+        benchmarks[name]()
@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+
+"""
+Add the unicode numeric strings for this Python's unicode database
+version to natsort/unicode_numeric_tables.py.
+INTENDED TO BE CALLED FROM PROJECT ROOT, NOT FROM dev/!
+"""
+
+import pathlib
+import sys
+import unicodedata
+
+sys.path.insert(0, ".")
+
+from natsort.unicode_numbers import construct_numeric_strings  # noqa: E402
+from natsort.unicode_numeric_tables import numeric_tables  # noqa: E402
+
+# Maximum length of the escaped text on each line of the output.
+WIDTH = 72
+
+header = '''\
+# -*- coding: utf-8 -*-
+"""
+Pre-built unicode decimal, digit, and numeric strings.
+
+This file is generated by dev/generate_unicode_tables.py - do not edit.
+"""
+
+# Rather than query unicodedata for every numeric character at import time,
+# the strings built by natsort.unicode_numbers.construct_numeric_strings are
+# stored for each unicode database version. The values are tuples of the
+# decimal, digit, and numeric strings, in that order.
+numeric_tables = {
+'''
+
+
+def format_string(s):
+    """Format a string as an implicitly concatenated, escaped literal."""
+    lines = [""]
+    for c in s:
+        escaped = ascii(c)[1:-1]
+        if len(lines[-1]) + len(escaped) > WIDTH:
+            lines.append("")
+        lines[-1] += escaped
+    lines = ['            "{}"'.format(line) for line in lines]
+    return "(\n" + "\n".join(lines) + "\n        )"
+
+
+tables = dict(numeric_tables)
+tables[unicodedata.unidata_version] = construct_numeric_strings()
+
+output = [header]
+for version in sorted(tables, key=lambda x: tuple(map(int, x.split(".")))):
+    output.append('    "{}": (\n'.format(version))
+    for s in tables[version]:
+        output.append("        {},\n".format(format_string(s)))
+    output.append("    ),\n")
+output.append("}\n")
+
+pathlib.Path("natsort", "unicode_numeric_tables.py").write_text("".join(output))
@@ -1,21 +1,36 @@
 # -*- coding: utf-8 -*-
 
+from natsort.binary_key import (
+    decode_natsort_key,
+    encode_natsort_key,
+    natsort_bytes_keygen,
+)
+from natsort.external import external_sort
+from natsort.index import NatIndex
 from natsort.natsort import (
     as_ascii,
     as_utf8,
     decoder,
     humansorted,
     index_humansorted,
+    index_natmerge,
     index_natsorted,
     index_realsorted,
+    natlargest,
+    natmerge,
+    natrank,
+    natsmallest,
     natsort_key,
     natsort_keygen,
+    natsort_lazy_keygen,
     natsorted,
     ns,
     numeric_regex_chooser,
     order_by_index,
     realsorted,
 )
+from natsort.sorted_list import NatSortedList, bisect_left, bisect_right, insort
+from natsort.text_key import normalized_string
 from natsort.utils import chain_functions
 
 __version__ = "7.0.1"
@@ -23,6 +38,7 @@ __version__ = "7.0.1"
 __all__ = [
     "natsort_key",
     "natsort_keygen",
+    "natsort_lazy_keygen",
     "natsorted",
     "humansorted",
     "realsorted",
@@ -30,12 +46,27 @@ __all__ = [
     "index_humansorted",
     "index_realsorted",
     "order_by_index",
+    "natrank",
+    "natmerge",
+    "index_natmerge",
+    "natsmallest",
+    "natlargest",
+    "external_sort",
+    "bisect_left",
+    "bisect_right",
+    "insort",
+    "NatSortedList",
+    "NatIndex",
     "decoder",
     "as_ascii",
     "as_utf8",
     "ns",
     "chain_functions",
     "numeric_regex_chooser",
+    "natsort_bytes_keygen",
+    "encode_natsort_key",
+    "decode_natsort_key",
+    "normalized_string",
 ]
 
 # Add the ns keys to this namespace for convenience.
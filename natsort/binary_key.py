@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""
+Encode natsort keys as bytes that sort in the same order as the keys.
+
+The keys returned by natsort_keygen are (possibly nested) tuples
+of str, bytes, int, and float. Comparing two encoded keys bytewise
+(e.g. with memcmp, or as a database or key-value store would) gives
+the same result as comparing the original tuples.
+
+THE ENCODING.
+
+Each element of a tuple is written as a one-byte type tag followed by
+a self-delimiting body, and a nested tuple is closed with a zero byte.
+The top-level tuple is not closed, so a key that is a prefix of another
+key sorts before it, just as with tuples. The tags are ordered so that
+numbers compare by value; the relative order of the other types is
+arbitrary because Python cannot compare them anyway.
+
+- str and bytes: the UTF-8 (or raw) bytes, with each zero byte
+  escaped as 0x00 0xFF, followed by a zero byte.
+- Zero and infinities: the tag alone.
+- Other numbers: the binary exponent of the number as a length-prefixed
+  integer, followed by the bits after the leading one bit in groups of
+  seven, each group shifted left with a low bit that is set if more
+  groups follow. Equal int and float values have identical encodings.
+  The body of a negative number is the bitwise complement of the body
+  of its absolute value.
+
+"""
+
+from natsort.natsort import natsort_keygen
+from natsort.ns_enum import ns
+
+# Type tags. Their order determines the sort order of the types.
+_END = 0x00
+_BYTES = 0x01
+_STR = 0x02
+_NEG_INF = 0x03
+_NEG = 0x04
+_ZERO = 0x05
+_POS = 0x06
+_POS_INF = 0x07
+_TUPLE = 0x08
+
+# Numbers that are encoded with only a tag.
+_CONSTANTS = {_ZERO: 0, _POS_INF: float("inf"), _NEG_INF: float("-inf")}
+
+
+def _escape(b):
+    """Make a bytes object self-delimiting, keeping its order."""
+    return b.replace(b"\x00", b"\x00\xff") + b"\x00"
+
+
+def _encode_int(n, out):
+    """Append a length-prefixed, order-preserving signed int to *out*."""
+    size = (abs(n).bit_length() + 7) // 8
+    if size > 126:  # pragma: no cover
+        raise OverflowError("number is too large to encode")
+    magnitude = abs(n).to_bytes(size, "big")
+    if n >= 0:
+        out.append(0x80 + size)
+        out += magnitude
+    else:
+        out.append(0x7F - size)
+        out += bytes(0xFF - x for x in magnitude)
+
+
+def _encode_positive(numerator, exponent):
+    """
+    Encode the positive number numerator * 2 ** exponent.
+
+    The result is prefix-free, and is ordered the same as the number.
+    """
+    # Make the numerator odd, so each number has one representation.
+    trailing_zeros = (numerator & -numerator).bit_length() - 1
+    numerator >>= trailing_zeros
+    exponent += trailing_zeros
+
+    # The bits after the leading one bit, in groups of seven.
+    nbits = numerator.bit_length() - 1
+    fraction = numerator ^ (1 << nbits)
+    ngroups = max((nbits + 6) // 7, 1)
+    fraction <<= ngroups * 7 - nbits
+
+    out = bytearray()
+    _encode_int(nbits + exponent, out)
+    for i in range(ngroups - 1, -1, -1):
+        out.append(((fraction >> (7 * i)) & 0x7F) << 1 | (i > 0))
+    return out
+
+
+def _encode_number(x, nan, out):
+    """Append the tag and body of a number to *out*."""
+    if x != x:
+        x = nan
+    if x == 0:
+        out.append(_ZERO)
+    elif x == float("inf"):
+        out.append(_POS_INF)
+    elif x == float("-inf"):
+        out.append(_NEG_INF)
+    else:
+        if isinstance(x, float):
+            numerator, denominator = abs(x).as_integer_ratio()
+        else:
+            numerator, denominator = abs(x), 1
+        body = _encode_positive(numerator, 1 - denominator.bit_length())
+        if x > 0:
+            out.append(_POS)
+            out += body
+        else:
+            out.append(_NEG)
+            out += bytes(0xFF - b for b in body)
+
+
+def _encode_elements(elements, nan, out):
+    """Append each element of a tuple, with its tag, to *out*."""
+    for x in elements:
+        if type(x) is str:
+            out.append(_STR)
+            out += _escape(x.encode("utf-8", "surrogatepass"))
+        elif type(x) is tuple:
+            out.append(_TUPLE)
+            _encode_elements(x, nan, out)
+            out.append(_END)
+        elif isinstance(x, (int, float)):
+            _encode_number(x, nan, out)
+        elif isinstance(x, bytes):
+            out.append(_BYTES)
+            out += _escape(x)
+        else:
+            msg = "encode_natsort_key: cannot encode an object of type {}"
+            raise TypeError(msg.format(type(x).__name__))
+
+
+def encode_natsort_key(natkey, alg=ns.DEFAULT):
+    """
+    Encode a natsort key as bytes that sort in the same order as the key.
+
+    Parameters
+    ----------
+    natkey : tuple
+        A key returned by a function created by :func:`natsort_keygen`.
+        It may contain `str`, `bytes`, `int`, `float`, and (nested)
+        `tuple` objects.
+
+    alg : ns enum, optional
+        Only used to place any NaN in *natkey*; with ``ns.NANLAST`` it
+        is encoded as +Infinity, otherwise as -Infinity. Keys generated
+        by :func:`natsort_keygen` never contain NaN.
+
+    Returns
+    -------
+    out : bytes
+        For any two keys *a* and *b* that can be compared,
+        ``encode_natsort_key(a) < encode_natsort_key(b)`` if and only
+        if ``a < b``, and likewise for ``==``.
+
+    Raises
+    ------
+    TypeError
+        *natkey* contains an object of a type that cannot be encoded.
+
+    See Also
+    --------
+    decode_natsort_key
+    natsort_bytes_keygen
+
+    Examples
+    --------
+
+        >>> key = natsort_keygen()
+        >>> a, b = key("num10"), key("num9")
+        >>> a > b
+        True
+        >>> encode_natsort_key(a) > encode_natsort_key(b)
+        True
+
+    """
+    nan = float("+inf") if alg & ns.NANLAST else float("-inf")
+    out = bytearray()
+    _encode_elements(natkey, nan, out)
+    return bytes(out)
+
+
+def _decode_int(data, pos, flip):
+    """Decode a length-prefixed signed int, returning it and the new position."""
+    prefix = data[pos] ^ flip
+    negative = prefix < 0x80
+    size = 0x7F - prefix if negative else prefix - 0x80
+    start, end = pos + 1, pos + 1 + size
+    magnitude = bytes(b ^ flip for b in data[start:end])
+    if negative:
+        magnitude = bytes(0xFF - b for b in magnitude)
+    n = int.from_bytes(magnitude, "big")
+    return -n if negative else n, end
+
+
+def _decode_positive(data, pos, flip=0):
+    """
+    Decode a positive number, returning it and the new position.
+
+    With *flip* set to 0xFF the body is complemented before decoding.
+    """
+    exponent, pos = _decode_int(data, pos, flip)
+    fraction, nbits = 0, 0
+    while True:
+        byte = data[pos] ^ flip
+        pos += 1
+        fraction = fraction << 7 | byte >> 1
+        nbits += 7
+        if not byte & 1:
+            break
+    numerator = fraction | 1 << nbits
+    trailing_zeros = (numerator & -numerator).bit_length() - 1
+    numerator >>= trailing_zeros
+    exponent += trailing_zeros - nbits
+    if exponent >= 0:
+        return numerator << exponent, pos
+    else:
+        return numerator / (1 << -exponent), pos
+
+
+def _decode_string(data, pos):
+    """Decode an escaped bytes object, returning it and the new position."""
+    out = bytearray()
+    while True:
+        end = data.index(b"\x00", pos)
+        out += data[pos:end]
+        if data.startswith(b"\xff", end + 1):
+            out.append(0)
+            pos = end + 2
+        else:
+            return bytes(out), end + 1
+
+
+def _decode_elements(data, pos, nested):
+    """Decode tuple elements, returning them and the new position."""
+    elements = []
+    while pos < len(data):
+        tag = data[pos]
+        pos += 1
+        if tag == _END and nested:
+            return tuple(elements), pos
+        elif tag == _STR:
+            value, pos = _decode_string(data, pos)
+            elements.append(value.decode("utf-8", "surrogatepass"))
+        elif tag == _BYTES:
+            value, pos = _decode_string(data, pos)
+            elements.append(value)
+        elif tag == _TUPLE:
+            value, pos = _decode_elements(data, pos, True)
+            elements.append(value)
+        elif tag in _CONSTANTS:
+            elements.append(_CONSTANTS[tag])
+        elif tag == _POS:
+            value, pos = _decode_positive(data, pos)
+            elements.append(value)
+        elif tag == _NEG:
+            value, pos = _decode_positive(data, pos, 0xFF)
+            elements.append(-value)
+        else:
+            raise ValueError("decode_natsort_key: invalid tag {}".format(tag))
+    if nested:
+        raise ValueError("decode_natsort_key: unterminated tuple")
+    return tuple(elements), pos
+
+
+def decode_natsort_key(data):
+    """
+    Decode bytes created by :func:`encode_natsort_key` back to a key.
+
+    Parameters
+    ----------
+    data : bytes
+        The output of :func:`encode_natsort_key`.
+
+    Returns
+    -------
+    out : tuple
+        A key that compares equal to the key that was encoded.
+        Numbers that were equal to an integer are returned as `int`
+        and all others as `float`, since the encoding does not
+        distinguish between the two.
+
+    Raises
+    ------
+    ValueError
+        *data* is not a valid encoded key.
+
+    See Also
+    --------
+    encode_natsort_key
+
+    Examples
+    --------
+
+        >>> decode_natsort_key(encode_natsort_key(("a", 5.5, "b", 5.0)))
+        ('a', 5.5, 'b', 5)
+
+    """
+    return _decode_elements(bytes(data), 0, False)[0]
+
+
+def natsort_bytes_keygen(key=None, alg=ns.DEFAULT):
+    """
+    Generate a key that returns natsort keys encoded as bytes.
+
+    This is the composition of :func:`natsort_keygen` and
+    :func:`encode_natsort_key`. The encoded keys are compact, cheap
+    to compare, and sort in natural order when compared bytewise,
+    so they are useful to store in a database or key-value store.
+
+    Parameters
+    ----------
+    key : callable, optional
+        A key used to manipulate the input value before parsing for
+        numbers. It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : function
+        A function that accepts a single value and returns `bytes`.
+
+    See Also
+    --------
+    natsort_keygen
+    encode_natsort_key
+
+    Examples
+    --------
+
+        >>> a = ['num5.10', 'num-3', 'num5.3', 'num2']
+        >>> a.sort(key=natsort_bytes_keygen(alg=ns.REAL))
+        >>> a
+        ['num-3', 'num2', 'num5.10', 'num5.3']
+
+    """
+    natkey = natsort_keygen(key, alg)
+
+    def func(val, _natkey=natkey, _alg=alg):
+        return encode_natsort_key(_natkey(val), _alg)
+
+    return func
@@ -4,7 +4,31 @@ Interface for natsort to access fastnumbers functions without
 having to worry if it is actually installed.
 """
 
-from distutils.version import StrictVersion
+import re
+
+
+def is_supported_fastnumbers(fastnumbers_version, minimum=(2, 0, 0)):
+    """
+    Check if the given fastnumbers version is new enough for natsort.
+
+    Parameters
+    ----------
+    fastnumbers_version : str
+        The version of fastnumbers, e.g. "2.2.1" or "3.0.0a1".
+    minimum : tuple, optional
+        The minimum supported (major, minor, patch) version.
+
+    Returns
+    -------
+    bool
+
+    """
+    match = re.match(r"(\d+)\.(\d+)(?:\.(\d+))?", fastnumbers_version)
+    if match is None:
+        return False
+    version = tuple(int(x or 0) for x in match.groups())
+    return version >= minimum
+
 
 # If the user has fastnumbers installed, they will get great speed
 # benefits. If not, we use the simulated functions that come with natsort.
@@ -13,7 +37,7 @@ try:
     from fastnumbers import fast_float, fast_int, __version__ as fn_ver
 
     # Require >= version 2.0.0.
-    if StrictVersion(fn_ver) < StrictVersion("2.0.0"):
+    if not is_supported_fastnumbers(fn_ver):
         raise ImportError  # pragma: no cover
 except ImportError:
     from natsort.compat.fake_fastnumbers import fast_float, fast_int  # noqa: F401
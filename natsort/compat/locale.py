@@ -5,7 +5,12 @@ having to worry about if it is using PyICU or the built-in locale.
 """
 
 # Std. lib imports.
+import locale
 import sys
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+from locale import getlocale, strxfrm
 
 # This string should be sorted after any other byte string because
 # it contains the max unicode character repeated 20 times.
@@ -14,102 +19,128 @@ null_string = ""
 null_string_max = chr(sys.maxunicode) * 20
 
 # strxfrm can be buggy (especially on BSD-based systems),
-# so prefer icu if available.
-try:  # noqa: C901
-    import icu
-    from locale import getlocale
-
+# so prefer icu if available. PyICU is slow to import, so here we only
+# check that it is installed and do not import it until it is first used.
+if find_spec("icu") is not None:
     null_string_locale = b""
 
     # This string should in theory be sorted after any other byte
     # string because it contains the max byte char repeated many times.
     # You would need some odd data to come after that.
     null_string_locale_max = b"x7f" * 50
+else:
+    null_string_locale = null_string
+    null_string_locale_max = null_string_max
 
-    def dumb_sort():
-        return False
 
-    # If using icu, get the locale from the current global locale,
-    def get_icu_locale():
+@lru_cache(maxsize=None)
+def _icu():
+    """
+    Import icu the first time it is needed.
+
+    Returns `None` if icu is not installed, or if it is installed but
+    cannot be imported (e.g. it was built against another libicu), in
+    which case the built-in locale is used and the null strings are
+    reset to match.
+    """
+    global null_string_locale, null_string_locale_max
+    if find_spec("icu") is not None:
         try:
-            return icu.Locale(".".join(getlocale()))
-        except TypeError:  # pragma: no cover
-            return icu.Locale()
+            return import_module("icu")
+        except ImportError:
+            pass
+    null_string_locale = null_string
+    null_string_locale_max = null_string_max
+    return None
 
-    def get_strxfrm():
-        return icu.Collator.createInstance(get_icu_locale()).getSortKey
 
-    def get_thousands_sep():
-        sep = icu.DecimalFormatSymbols.kGroupingSeparatorSymbol
-        return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
+def get_null_string_locale():
+    """Return the null strings to use in locale-aware keys, as a pair."""
+    _icu()
+    return null_string_locale, null_string_locale_max
 
-    def get_decimal_point():
-        sep = icu.DecimalFormatSymbols.kDecimalSeparatorSymbol
-        return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
 
+# If using icu, get the locale from the current global locale,
+def get_icu_locale():
+    icu = _icu()
+    try:
+        return icu.Locale(".".join(getlocale()))
+    except TypeError:  # pragma: no cover
+        return icu.Locale()
 
-except ImportError:
-    import locale
-    from locale import strxfrm
 
-    null_string_locale = null_string
-    null_string_locale_max = null_string_max
+# On some systems, locale is broken and does not sort in the expected
+# order. We will try to detect this and compensate.
+def dumb_sort():
+    if _icu() is not None:
+        return False
+    return strxfrm("A") < strxfrm("a")
 
-    # On some systems, locale is broken and does not sort in the expected
-    # order. We will try to detect this and compensate.
-    def dumb_sort():
-        return strxfrm("A") < strxfrm("a")
 
-    def get_strxfrm():
+def get_strxfrm():
+    icu = _icu()
+    if icu is None:
         return strxfrm
+    return icu.Collator.createInstance(get_icu_locale()).getSortKey
+
+
+def get_thousands_sep():
+    icu = _icu()
+    if icu is not None:
+        sep = icu.DecimalFormatSymbols.kGroupingSeparatorSymbol
+        return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
 
-    def get_thousands_sep():
-        sep = locale.localeconv()["thousands_sep"]
-        # If this locale library is broken, some of the thousands separator
-        # characters are incorrectly blank. Here is a lookup table of the
-        # corrections I am aware of.
-        if dumb_sort():
-            try:
-                loc = ".".join(locale.getlocale())
-            except TypeError:  # No locale loaded, default to ','
-                return ","
-            return {
-                "de_DE.ISO8859-15": ".",
-                "es_ES.ISO8859-1": ".",
-                "de_AT.ISO8859-1": ".",
-                "de_at": "\xa0",
-                "nl_NL.UTF-8": ".",
-                "es_es": ".",
-                "fr_CH.ISO8859-15": "\xa0",
-                "fr_CA.ISO8859-1": "\xa0",
-                "de_CH.ISO8859-1": ".",
-                "fr_FR.ISO8859-15": "\xa0",
-                "nl_NL.ISO8859-1": ".",
-                "ca_ES.UTF-8": ".",
-                "nl_NL.ISO8859-15": ".",
-                "de_ch": "'",
-                "ca_es": ".",
-                "de_AT.ISO8859-15": ".",
-                "ca_ES.ISO8859-1": ".",
-                "de_AT.UTF-8": ".",
-                "es_ES.UTF-8": ".",
-                "fr_fr": "\xa0",
-                "es_ES.ISO8859-15": ".",
-                "de_DE.ISO8859-1": ".",
-                "nl_nl": ".",
-                "fr_ch": "\xa0",
-                "fr_ca": "\xa0",
-                "de_DE.UTF-8": ".",
-                "ca_ES.ISO8859-15": ".",
-                "de_CH.ISO8859-15": ".",
-                "fr_FR.ISO8859-1": "\xa0",
-                "fr_CH.ISO8859-1": "\xa0",
-                "de_de": ".",
-                "fr_FR.UTF-8": "\xa0",
-                "fr_CA.ISO8859-15": "\xa0",
-            }.get(loc, sep)
-        else:
-            return sep
-
-    def get_decimal_point():
-        return locale.localeconv()["decimal_point"]
+    sep = locale.localeconv()["thousands_sep"]
+    # If this locale library is broken, some of the thousands separator
+    # characters are incorrectly blank. Here is a lookup table of the
+    # corrections I am aware of.
+    if dumb_sort():
+        try:
+            loc = ".".join(locale.getlocale())
+        except TypeError:  # No locale loaded, default to ','
+            return ","
+        return {
+            "de_DE.ISO8859-15": ".",
+            "es_ES.ISO8859-1": ".",
+            "de_AT.ISO8859-1": ".",
+            "de_at": "\xa0",
+            "nl_NL.UTF-8": ".",
+            "es_es": ".",
+            "fr_CH.ISO8859-15": "\xa0",
+            "fr_CA.ISO8859-1": "\xa0",
+            "de_CH.ISO8859-1": ".",
+            "fr_FR.ISO8859-15": "\xa0",
+            "nl_NL.ISO8859-1": ".",
+            "ca_ES.UTF-8": ".",
+            "nl_NL.ISO8859-15": ".",
+            "de_ch": "'",
+            "ca_es": ".",
+            "de_AT.ISO8859-15": ".",
+            "ca_ES.ISO8859-1": ".",
+            "de_AT.UTF-8": ".",
+            "es_ES.UTF-8": ".",
+            "fr_fr": "\xa0",
+            "es_ES.ISO8859-15": ".",
+            "de_DE.ISO8859-1": ".",
+            "nl_nl": ".",
+            "fr_ch": "\xa0",
+            "fr_ca": "\xa0",
+            "de_DE.UTF-8": ".",
+            "ca_ES.ISO8859-15": ".",
+            "de_CH.ISO8859-15": ".",
+            "fr_FR.ISO8859-1": "\xa0",
+            "fr_CH.ISO8859-1": "\xa0",
+            "de_de": ".",
+            "fr_FR.UTF-8": "\xa0",
+            "fr_CA.ISO8859-15": "\xa0",
+        }.get(loc, sep)
+    else:
+        return sep
+
+
+def get_decimal_point():
+    icu = _icu()
+    if icu is not None:
+        sep = icu.DecimalFormatSymbols.kDecimalSeparatorSymbol
+        return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
+    return locale.localeconv()["decimal_point"]
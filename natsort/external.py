@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Natural sorting of inputs that are too large to fit in memory.
+"""
+
+import heapq
+import sys
+from contextlib import ExitStack
+from itertools import chain, islice
+
+from natsort.natsort import natsort_keygen, natsorted
+from natsort.ns_enum import ns
+
+# The default memory budget for external_sort, in bytes.
+EXTERNAL_SORT_MEMORY = 256 * 1024 * 1024
+
+# The most temporary files that are merged at once.
+EXTERNAL_SORT_MAX_FILES = 128
+
+# The smallest number of bytes of elements pickled together in a
+# temporary file, which limits how many files are merged at once.
+_MIN_BATCH_MEMORY = 4096
+
+
+def _strip_newline(x):
+    """Remove one trailing newline from a line of text or bytes."""
+    if isinstance(x, str) and x.endswith("\n"):
+        return x[:-1]
+    elif isinstance(x, bytes) and x.endswith(b"\n"):
+        return x[:-1]
+    else:
+        return x
+
+
+def _read_input(iterable_or_path, encoding):
+    """Yield the elements of the input, without trailing newlines."""
+    if isinstance(iterable_or_path, (str, bytes)) or hasattr(
+        iterable_or_path, "__fspath__"
+    ):
+        with open(iterable_or_path, encoding=encoding) as f:
+            yield from map(_strip_newline, f)
+    else:
+        yield from map(_strip_newline, iterable_or_path)
+
+
+def _runs(items, max_memory):
+    """Split *items* into lists using about *max_memory* with their keys."""
+    run, size = [], 0
+    for x in items:
+        run.append(x)
+        # The element, its key tuple, and the key's components take
+        # roughly three times the size of the element itself.
+        size += 3 * sys.getsizeof(x)
+        if size >= max_memory:
+            yield run
+            run, size = [], 0
+    if run:
+        yield run
+
+
+def _spill(items, tmpdir, batch_memory):
+    """
+    Write *items* to a new temporary file, rewound to the start.
+
+    The items are pickled in batches of at most *batch_memory* bytes
+    (or a single item, if it is larger), as they are read back.
+    """
+    # Imported here, as they are only needed for inputs that do not fit
+    # in memory, and would otherwise slow down importing natsort.
+    import pickle
+    import tempfile
+
+    f = tempfile.TemporaryFile(dir=tmpdir)
+    batch, size = [], 0
+    for x in items:
+        item_size = sys.getsizeof(x)
+        if batch and size + item_size > batch_memory:
+            pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+            batch, size = [], 0
+        batch.append(x)
+        size += item_size
+    if batch:
+        pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _unspill(f):
+    """Yield the items written to a file by :func:`_spill`."""
+    import pickle
+
+    while True:
+        try:
+            batch = pickle.load(f)
+        except EOFError:
+            return
+        yield from batch
+
+
+def _sorted_stream(iterable_or_path, key, reverse, alg, max_memory, tmpdir, encoding):
+    """Yield the input in natural order, spilling sorted runs to disk."""
+    natkey = natsort_keygen(key, alg)
+
+    # Merging reads one batch from each file and writes one batch, so
+    # fewer files are merged at once, and in smaller batches, the less
+    # memory there is. Together they stay within max_memory.
+    max_files = max_memory // _MIN_BATCH_MEMORY
+    max_files = max(2, min(EXTERNAL_SORT_MAX_FILES, max_files))
+    batch_memory = max_memory // (max_files + 1)
+
+    items = _read_input(iterable_or_path, encoding)
+    runs = _runs(items, max_memory)
+    run = natsorted(next(runs, []), key=key, reverse=reverse, alg=alg)
+
+    # If everything fits in one run, there is no need for the disk.
+    # Peek one element ahead, rather than reading the whole next run,
+    # so that the first run is spilled before the next one is read.
+    peeked = list(islice(items, 1))
+    if not peeked:
+        yield from run
+        return
+
+    with ExitStack() as stack:
+        files = [stack.enter_context(_spill(run, tmpdir, batch_memory))]
+        # Drop each run before reading the next, to stay within max_memory.
+        # Replacing runs also drops its reference to the first run.
+        run = None
+        runs = _runs(chain(peeked, items), max_memory)
+        following = next(runs, None)
+        while following is not None:
+            run = natsorted(following, key=key, reverse=reverse, alg=alg)
+            following = None
+            files.append(stack.enter_context(_spill(run, tmpdir, batch_memory)))
+            run = None
+
+            # Merge the runs so far if there would be too many open files.
+            if len(files) >= max_files:
+                merged = heapq.merge(*map(_unspill, files), key=natkey, reverse=reverse)
+                merged = stack.enter_context(_spill(merged, tmpdir, batch_memory))
+                for f in files:
+                    f.close()
+                files = [merged]
+
+            following = next(runs, None)
+
+        yield from heapq.merge(*map(_unspill, files), key=natkey, reverse=reverse)
+
+
+def external_sort(
+    iterable_or_path,
+    out=None,
+    key=None,
+    reverse=False,
+    alg=ns.DEFAULT,
+    max_memory=EXTERNAL_SORT_MEMORY,
+    tmpdir=None,
+    encoding="utf-8",
+):
+    """
+    Sorts an input that may be too large to fit in memory naturally.
+
+    The input is read in runs that fit in *max_memory*. Each run is
+    sorted with :func:`natsorted` and written to a temporary file, and
+    then the runs are merged with :func:`heapq.merge`.
+
+    Parameters
+    ----------
+    iterable_or_path : iterable, str, bytes, or path-like
+        The input to sort. A `str`, `bytes`, or path-like object is the
+        path of a text file to read. Otherwise this is an iterable, such
+        as a file object opened in text or binary mode. One trailing
+        newline is removed from each `str` or `bytes` element, so lines
+        are sorted without their line endings.
+
+    out : str, path-like, or file object, optional
+        Where to write the sorted elements, one per line. A `str` or
+        path-like object is the path of a file to create, in binary
+        mode if the elements are `bytes` and otherwise in text mode
+        with *encoding*. A file object should be opened in the mode
+        that matches the elements. The default of `None` returns a
+        generator of the sorted elements instead.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the input.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Return the elements in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    max_memory : int, optional
+        The approximate number of bytes to use for each sorted run,
+        including the keys, and for the batches read while merging the
+        runs. The default is 256 MiB.
+
+    tmpdir : str, optional
+        The directory for the temporary files. The default is chosen
+        by :mod:`tempfile`.
+
+    encoding : str, optional
+        The encoding of text files named by *iterable_or_path* or *out*.
+        The default is "utf-8".
+
+    Returns
+    -------
+    out : generator or None
+        A generator of the sorted elements if *out* is `None`,
+        otherwise `None`.
+
+    See Also
+    --------
+    natsorted
+
+    Notes
+    -----
+    The order, including the order of equal elements, is the same as
+    that of :func:`natsorted`. The elements must be picklable to be
+    written to the temporary files. The temporary files of a generator
+    are removed when it is exhausted or closed.
+
+    The sorted runs are merged by reading a batch of elements from each
+    temporary file at a time. The number of files merged at once is at
+    most ``EXTERNAL_SORT_MAX_FILES`` (128), and fewer for a small
+    *max_memory*, so that the batches also fit in *max_memory*. If there
+    are more runs than that, the runs so far are first merged into a
+    single file.
+
+    Examples
+    --------
+
+        >>> lines = ['file10.txt', 'file9.txt', 'file1.txt']
+        >>> list(external_sort(lines, max_memory=100))
+        ['file1.txt', 'file9.txt', 'file10.txt']
+
+    """
+    stream = _sorted_stream(
+        iterable_or_path, key, reverse, alg, max_memory, tmpdir, encoding
+    )
+    if out is None:
+        return stream
+
+    first = next(stream, None)
+    newline = b"\n" if isinstance(first, bytes) else "\n"
+    with ExitStack() as stack:
+        if not hasattr(out, "write"):
+            if isinstance(first, bytes):
+                out = stack.enter_context(open(out, "wb"))
+            else:
+                out = stack.enter_context(open(out, "w", encoding=encoding))
+        if first is not None:
+            for x in chain([first], stream):
+                out.write(x)
+                out.write(newline)
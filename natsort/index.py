@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+A read-only index of values in natural order, for range and prefix queries.
+"""
+
+import bisect
+from operator import itemgetter
+
+from natsort.binary_key import encode_natsort_key
+from natsort.natsort import natsort_keygen
+from natsort.ns_enum import ns
+
+# Incremented whenever the format written by NatIndex.save changes.
+_FORMAT_VERSION = 1
+
+
+def _prefix_end(prefix):
+    """Return the smallest bytes greater than all bytes starting with *prefix*."""
+    prefix = prefix.rstrip(b"\xff")
+    if not prefix:
+        return None
+    return prefix[:-1] + bytes([prefix[-1] + 1])
+
+
+class NatIndex(object):
+    """
+    An index of values in natural order, for range and prefix queries.
+
+    The index is built once from a sequence. The natsort key of each
+    value is stored encoded as `bytes` (see :func:`encode_natsort_key`),
+    which takes much less memory than the key itself, and sorts in the
+    same order. Each query computes the key of its arguments only, and
+    finds the matching values with a binary search, so it takes
+    O(log n + k) time to return k values.
+
+    Parameters
+    ----------
+    seq : iterable
+        The values to index.
+
+    key : callable, optional
+        A key used to determine how to sort each value.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    See Also
+    --------
+    natsorted
+    NatSortedList
+
+    Notes
+    -----
+    The index can be written to a file with :meth:`save` and read
+    back with :meth:`load`, if the values and *key* can be pickled.
+    Keys of locale-aware algorithms depend on the locale, so an
+    index using ``ns.LOCALE`` should be loaded under the same locale
+    that it was built with.
+
+    Examples
+    --------
+
+        >>> index = NatIndex(['shot_2/frame_10', 'shot_10/frame_1', 'shot_2/frame_9'])
+        >>> list(index)
+        ['shot_2/frame_9', 'shot_2/frame_10', 'shot_10/frame_1']
+        >>> index.range('shot_2/frame_10', 'shot_10/frame_0')
+        ['shot_2/frame_10']
+        >>> index.prefix('shot_2/')
+        ['shot_2/frame_9', 'shot_2/frame_10']
+        >>> index.floor('shot_3'), index.ceiling('shot_3')
+        ('shot_2/frame_10', 'shot_10/frame_1')
+
+    """
+
+    def __init__(self, seq, key=None, alg=ns.DEFAULT):
+        natkey = natsort_keygen(key, alg)
+        items = [(encode_natsort_key(natkey(x), alg), x) for x in seq]
+        items.sort(key=itemgetter(0))
+        self._keys = [k for k, _ in items]
+        self._values = [x for _, x in items]
+        self.key = key
+        self.alg = alg
+
+    def _encode(self, value):
+        """Return the encoded key of *value*."""
+        return encode_natsort_key(natsort_keygen(self.key, self.alg)(value), self.alg)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __reversed__(self):
+        return reversed(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __contains__(self, value):
+        k = self._encode(value)
+        lo = bisect.bisect_left(self._keys, k)
+        hi = bisect.bisect_right(self._keys, k, lo)
+        return value in self._values[lo:hi]
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self._values)
+
+    def bisect_left(self, value):
+        """Return the position of the first value not less than *value*."""
+        return bisect.bisect_left(self._keys, self._encode(value))
+
+    def bisect_right(self, value):
+        """Return the position of the first value greater than *value*."""
+        return bisect.bisect_right(self._keys, self._encode(value))
+
+    def range(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Return the values from *lo* to *hi* in natural order.
+
+        Either bound may be `None` to leave that end open. Whether
+        values equal to each bound (in natural order) are included
+        is controlled by *inclusive*.
+        """
+        if lo is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(lo)
+        else:
+            start = self.bisect_right(lo)
+        if hi is None:
+            stop = len(self._keys)
+        elif inclusive[1]:
+            stop = self.bisect_right(hi)
+        else:
+            stop = self.bisect_left(hi)
+        return self._values[start:stop]
+
+    def prefix(self, prefix):
+        """
+        Return the values whose natsort key starts with that of *prefix*.
+
+        Numbers in *prefix* must match whole numbers, so ``'shot_01'``
+        matches ``'shot_1/a'`` and ``'shot_01b'`` but not ``'shot_010'``.
+        Text at the end of *prefix* may be the start of longer text, so
+        ``'shot_1/fr'`` matches ``'shot_1/frame_5'`` (except with
+        ``ns.LOCALEALPHA``, where text must also match whole).
+
+        With ``ns.PATH``, each path component must match whole, so
+        ``'a/b'`` matches ``'a/b/c'`` and ``'a/b.txt'``, but not
+        ``'a/bc'``. This makes a directory listing a single range.
+        """
+        natkey = natsort_keygen(self.key, self.alg)(prefix)
+        start_key = encode_natsort_key(natkey, self.alg)
+        if natkey and type(natkey[-1]) is str and not self.alg & ns.LOCALEALPHA:
+            # Drop the terminator of the trailing text so it can be continued.
+            start_key = start_key[:-1]
+        start = bisect.bisect_left(self._keys, start_key)
+        end_key = _prefix_end(start_key)
+        if end_key is None:
+            return self._values[start:]
+        stop = bisect.bisect_left(self._keys, end_key, start)
+        return self._values[start:stop]
+
+    def floor(self, value, default=None):
+        """Return the last value not greater than *value*, or *default*."""
+        i = self.bisect_right(value)
+        return self._values[i - 1] if i else default
+
+    def ceiling(self, value, default=None):
+        """Return the first value not less than *value*, or *default*."""
+        i = self.bisect_left(value)
+        return self._values[i] if i < len(self._values) else default
+
+    def save(self, path):
+        """Write the index to a file, which can be read with :meth:`load`."""
+        import pickle
+
+        state = (_FORMAT_VERSION, self.key, self.alg, self._keys, self._values)
+        with open(path, "wb") as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an index written by :meth:`save`.
+
+        .. warning::
+
+            The file is read with :mod:`pickle`, which can run arbitrary
+            code while loading. Only load files from a trusted source.
+
+        """
+        import pickle
+
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state[0] != _FORMAT_VERSION:
+            msg = "NatIndex.load: unsupported format version {} in {}"
+            raise ValueError(msg.format(state[0], path))
+        index = cls.__new__(cls)
+        _, index.key, index.alg, index._keys, index._values = state
+        return index
@@ -6,13 +6,35 @@ natsort public API.
 The majority of the "work" is defined in utils.py.
 """
 
-from functools import partial
-from operator import itemgetter
+import heapq
+import os
+from functools import lru_cache, partial
+from itertools import chain, count, groupby, islice, repeat
+from locale import LC_ALL, setlocale
+from operator import attrgetter, itemgetter, methodcaller
+from types import BuiltinFunctionType, ModuleType
 
 import natsort.compat.locale
 from natsort import utils
 from natsort.ns_enum import NS_DUMB, ns
 
+# The maximum number of keys remembered by natsort_keygen.
+KEYGEN_CACHE_SIZE = 128
+
+# Types of keys for which natsort_keygen caches the natsort key, besides
+# None and built-in functions. type(str.lower) is that of unbound methods.
+_CACHEABLE_KEY_TYPES = (type, type(str.lower), itemgetter, attrgetter, methodcaller)
+
+# The number of parsed path components remembered by each ns.PATH key.
+PATH_COMPONENT_CACHE_SIZE = 4096
+
+# Inputs shorter than this are always sorted in a single process,
+# since starting the worker processes would take longer.
+PARALLEL_MIN_SIZE = 100000
+
+# The number of elements sampled to choose the length of prefix keys.
+KEY_PREFIX_SAMPLE_SIZE = 1000
+
 
 def decoder(encoding):
     """
@@ -101,7 +123,7 @@ def as_utf8(s):
     return utils.do_decoding(s, "utf-8")
 
 
-def natsort_keygen(key=None, alg=ns.DEFAULT):
+def natsort_keygen(key=None, alg=ns.DEFAULT, cache=None):
     """
     Generate a key to sort strings and numbers naturally.
 
@@ -124,18 +146,59 @@ def natsort_keygen(key=None, alg=ns.DEFAULT):
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    cache : {{None, True, int, mapping}}, optional
+        Remember the key of each value, so that equal values are parsed
+        only once and share a single key. Use `True` to remember every
+        key, an `int` to remember that many of the most recently used
+        keys, or a mutable mapping (such as a `dict`) to store the keys
+        in, indexed by ``(type(value), value)``. A mapping may be reused
+        between keys with the same *key* and *alg*. The default of
+        `None` does not cache.
+
     Returns
     -------
     out : function
         A function that parses input for natural sorting that is
         suitable for passing as the `key` argument to functions
-        such as `sorted`.
+        such as `sorted`. If *cache* is given, its statistics are
+        available from ``out.cache_info()``, and it can be emptied
+        with ``out.cache_clear()``.
 
     See Also
     --------
     natsorted
     natsort_key
 
+    Notes
+    -----
+    The generated key can be pickled (if *key* can be pickled and no
+    *cache* is given), so it
+    can be sent to other processes, e.g. with :mod:`multiprocessing`.
+    It is rebuilt with `natsort_keygen` when it is unpickled, so
+    locale-aware keys use the locale of the process that unpickles them.
+
+    Generated keys are cached per *key*, *alg*, and (for locale-aware
+    algorithms) the current locale, so calling `natsort_keygen` repeatedly
+    with the same arguments is cheap. Up to ``KEYGEN_CACHE_SIZE`` keys are
+    remembered. Cache statistics are available from
+    ``natsort_keygen.cache_info()``, and the cache can be emptied with
+    ``natsort_keygen.cache_clear()``. Only keys for a *key* of `None`, a
+    built-in function or method (such as `len` or `str.lower`), a class,
+    or an `operator.itemgetter`, `operator.attrgetter`, or
+    `operator.methodcaller` are cached. Other callables, such as a
+    `lambda` made anew for each call, would rarely be seen again and
+    would keep the data they refer to alive in the cache.
+
+    This is separate from the *cache* option, which caches the keys of
+    the values being sorted. That saves time and memory when the input
+    has many repeated values. Values that are not hashable are parsed
+    without caching.
+
+    With ``ns.PATH``, the key also remembers the parsed form of up to
+    ``PATH_COMPONENT_CACHE_SIZE`` recently used path components, so
+    directory names shared by many paths are parsed once, and their
+    keys share the same tuple.
+
     Examples
     --------
     `natsort_keygen` is a convenient way to create a custom key
@@ -146,6 +209,14 @@ def natsort_keygen(key=None, alg=ns.DEFAULT):
         >>> a
         ['num-3', 'num2', 'num5.10', 'num5.3']
 
+    With a cache, repeated values are parsed only once::
+
+        >>> natkey = natsort_keygen(cache=True)
+        >>> sorted(['b2', 'a10', 'b2', 'a10', 'b2'], key=natkey)
+        ['a10', 'a10', 'b2', 'b2', 'b2']
+        >>> natkey.cache_info().hits
+        3
+
     """
     try:
         ns.DEFAULT | alg
@@ -157,20 +228,41 @@ def natsort_keygen(key=None, alg=ns.DEFAULT):
     if alg & ns.LOCALEALPHA and natsort.compat.locale.dumb_sort():
         alg |= NS_DUMB
 
+    # Keys for locale-aware algorithms capture locale-dependent data
+    # when they are built, so the current locale is part of the cache key.
+    current_locale = setlocale(LC_ALL) if alg & ns.LOCALE else None
+
+    if _is_cacheable_key(key):
+        natkey = _cached_natsort_key_factory(key, alg, current_locale)
+    else:
+        natkey = _natsort_key_factory(key, alg)
+
+    if cache is None or cache is False:
+        return natkey
+    return utils.key_cache_factory(natkey, cache)
+
+
+def _natsort_key_factory(key, alg):
+    """
+    Build the natsort key for *key* and *alg*.
+
+    This does the actual work of :func:`natsort_keygen`, assuming
+    *alg* has already been validated.
+    """
     # Set some variables that will be passed to the factory functions
+    if alg & ns.LOCALEALPHA:
+        null, null_max = natsort.compat.locale.get_null_string_locale()
+    else:
+        null = natsort.compat.locale.null_string
+        null_max = natsort.compat.locale.null_string_max
     if alg & ns.NUMAFTER:
-        if alg & ns.LOCALEALPHA:
-            sep = natsort.compat.locale.null_string_locale_max
-        else:
-            sep = natsort.compat.locale.null_string_max
+        sep = null_max
         pre_sep = natsort.compat.locale.null_string_max
     else:
-        if alg & ns.LOCALEALPHA:
-            sep = natsort.compat.locale.null_string_locale
-        else:
-            sep = natsort.compat.locale.null_string
+        sep = null
         pre_sep = natsort.compat.locale.null_string
     regex = utils.regex_chooser(alg)
+    ascii_regex = utils.regex_chooser(alg, ascii_only=True)
 
     # Create the functions that will be used to split strings.
     input_transform = utils.input_string_transform_factory(alg)
@@ -179,25 +271,283 @@ def natsort_keygen(key=None, alg=ns.DEFAULT):
 
     # Create the high-level parsing functions for strings, bytes, and numbers.
     string_func = utils.parse_string_factory(
-        alg, sep, regex.split, input_transform, component_transform, final_transform
+        alg,
+        sep,
+        regex.split,
+        input_transform,
+        component_transform,
+        final_transform,
+        ascii_regex.split,
     )
+    # The lazy parser is attached to the key for natsort_lazy_keygen.
+    # A final transform that changes the tuple cannot be applied lazily.
+    if alg & ns.UNGROUPLETTERS and alg & ns.LOCALEALPHA:
+        lazy_string_func = None
+    else:
+        lazy_string_func = utils.parse_string_lazy_factory(
+            alg, sep, regex, input_transform, component_transform, ascii_regex
+        )
     if alg & ns.PATH:
+        # Directory names repeat across many paths, so each is parsed once
+        # and the paths share the resulting (immutable) tuple.
+        string_func = lru_cache(maxsize=PATH_COMPONENT_CACHE_SIZE)(string_func)
+        lazy_string_func = partial(_lazy_path_components, string_func)
         string_func = utils.parse_path_factory(string_func)
     bytes_func = utils.parse_bytes_factory(alg)
     num_func = utils.parse_number_factory(alg, sep, pre_sep)
 
     # Return the natsort key with the parsing path pre-chosen.
-    return partial(
+    natkey = _NatsortKey(
         utils.natsort_key,
         key=key,
         string_func=string_func,
         bytes_func=bytes_func,
         num_func=num_func,
     )
+    natkey.alg = alg & ~NS_DUMB
+    natkey.lazy_string_func = lazy_string_func
+    return natkey
+
+
+def _lazy_path_components(str_split, x):
+    """Parse each component of the path *x* only when it is needed."""
+    return map(str_split, utils.path_splitter(x))
+
+
+class _NatsortKey(partial):
+    """
+    A natsort key, as returned by :func:`natsort_keygen`.
+
+    The parsing functions are closures that cannot be pickled, so the
+    key pickles as the arguments to :func:`natsort_keygen` instead.
+    Unpickling calls :func:`natsort_keygen`, which (for a cacheable
+    *key*) rebuilds the key only the first time in each process and
+    then uses its cache.
+    """
+
+    def __reduce__(self):
+        return natsort_keygen, (self.keywords["key"], self.alg)
+
+
+def _is_cacheable_key(key):
+    """
+    Return whether natsort keys built for *key* should be cached.
+
+    These keys hold no data of their own beyond a few names or
+    indexes, and are usually the same object on each call.
+    """
+    if key is None:
+        return True
+    if isinstance(key, BuiltinFunctionType):
+        # A bound method such as {}.get holds its object alive.
+        return key.__self__ is None or isinstance(key.__self__, ModuleType)
+    return isinstance(key, _CACHEABLE_KEY_TYPES)
+
+
+@lru_cache(maxsize=KEYGEN_CACHE_SIZE)
+def _cached_natsort_key_factory(key, alg, current_locale):
+    """
+    Memoized version of :func:`_natsort_key_factory`.
+
+    *current_locale* is not used directly but ensures a key built
+    under one locale is never returned for another.
+    """
+    return _natsort_key_factory(key, alg)
+
+
+# Expose the cache statistics and control through the public function.
+natsort_keygen.cache_info = _cached_natsort_key_factory.cache_info
+natsort_keygen.cache_clear = _cached_natsort_key_factory.cache_clear
+
+
+def natsort_lazy_keygen(key=None, alg=ns.DEFAULT):
+    """
+    Generate a key that parses strings only as far as comparisons need.
+
+    The keys sort in the same order as the keys from
+    :func:`natsort_keygen`, but a string is split into its numeric and
+    non-numeric components only as far as needed to decide each
+    comparison. The components are remembered by the key, so each
+    is parsed only once. This saves time and memory when sorting
+    long strings (such as log lines or URLs) that usually differ
+    within their first few components.
+
+    Parameters
+    ----------
+    key : callable, optional
+        A key used to manipulate the input value before parsing for
+        numbers. It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : function
+        A function that accepts a single value and returns a key that
+        can be compared with other keys it returns, but not with the
+        tuples returned by :func:`natsort_keygen`.
+
+    See Also
+    --------
+    natsort_keygen
+
+    Notes
+    -----
+    Transformations of the whole string (e.g. unicode normalization
+    or case folding) are still applied up front. Only `str` values
+    are parsed lazily; with ``ns.PATH``, each path component is parsed
+    when it is needed. With ``ns.UNGROUPLETTERS`` and a locale-aware
+    algorithm, and for all other types, the whole key is computed
+    immediately. The keys cannot be pickled.
+
+    Examples
+    --------
+
+        >>> a = ['num5.10', 'num-3', 'num5.3', 'num2']
+        >>> a.sort(key=natsort_lazy_keygen(alg=ns.REAL))
+        >>> a
+        ['num-3', 'num2', 'num5.10', 'num5.3']
+
+    """
+    natkey = natsort_keygen(None, alg)
+
+    def func(
+        val,
+        _key=key,
+        _natkey=natkey,
+        _lazy=natkey.lazy_string_func,
+        _lazy_key=utils.LazyKey,
+    ):
+        if _key is not None:
+            val = _key(val)
+        if type(val) is str and _lazy is not None:
+            return _lazy_key((), _lazy(val))
+        return _lazy_key(_natkey(val))
+
+    return func
+
+
+def _chunk_keys(key, alg, current_locale, chunk):
+    """Compute the natsort keys of the pickled *chunk*, in a worker process."""
+    import pickle
+
+    if current_locale is not None and setlocale(LC_ALL) != current_locale:
+        setlocale(LC_ALL, current_locale)
+    return list(map(natsort_keygen(key, alg), pickle.loads(chunk)))
+
+
+def _page_bounds(offset, limit):
+    """Validate *offset* and *limit*, and return the slice they select."""
+    if offset < 0:
+        raise ValueError("'offset' must be non-negative, got {}".format(offset))
+    if limit is None:
+        return offset, None
+    if limit < 0:
+        raise ValueError("'limit' must be non-negative, got {}".format(limit))
+    return offset, offset + limit
+
+
+def _parallel_order(seq, key, alg, reverse, workers, chunksize):
+    """
+    Compute the natsort keys of *seq* in worker processes, and sort.
+
+    Returns the indexes of *seq* in sorted order, or `None` if the keys
+    should be computed serially instead, because *seq* is too short,
+    there are not multiple CPUs, or *key* or the elements of *seq*
+    cannot be sent to a worker.
+    """
+    if workers is None or len(seq) < PARALLEL_MIN_SIZE:
+        return None
+    workers = min(workers, os.cpu_count() or 1)
+    if workers <= 1:
+        return None
+
+    # Imported here, as they are slow to import and rarely needed.
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+
+    if chunksize is None:
+        chunksize = -(-len(seq) // (workers * 4))
+    bounds = range(0, len(seq) + chunksize, chunksize)
+
+    # Pickle the chunks here, so that a key or element that cannot be
+    # pickled is found before any work is sent, and only errors from
+    # the key itself come back from the workers.
+    try:
+        pickle.dumps(key)
+        chunks = [
+            pickle.dumps(seq[i:j], pickle.HIGHEST_PROTOCOL)
+            for i, j in zip(bounds, bounds[1:])
+        ]
+    except Exception:
+        return None
+
+    current_locale = setlocale(LC_ALL) if alg & ns.LOCALE else None
+    func = partial(_chunk_keys, key, alg, current_locale)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        keys = list(chain.from_iterable(executor.map(func, chunks)))
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+
+def _choose_key_prefix(seq, key, alg):
+    """
+    Choose how many key components to sort *seq* on before refining.
+
+    The keys of a sample of *seq* are sorted, and the number is the
+    one that tells apart 99% of the adjacent unequal pairs of keys.
+    """
+    step = max(len(seq) // KEY_PREFIX_SAMPLE_SIZE, 1)
+    sample = seq[::step][:KEY_PREFIX_SAMPLE_SIZE]
+    keys = sorted(map(natsort_keygen(key, alg), sample))
+    lengths = []
+    for a, b in zip(keys, keys[1:]):
+        if a != b:
+            # The length of the common prefix, plus the first difference.
+            n = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), None)
+            lengths.append(min(len(a), len(b)) + 1 if n is None else n + 1)
+    if not lengths:
+        return 1
+    lengths.sort()
+    return lengths[int(0.99 * (len(lengths) - 1))]
+
+
+def _prefix_key_order(seq, key, alg, reverse, n):
+    """
+    Sort *seq* on the first *n* key components, then refine ties.
+
+    Only elements whose first *n* components are equal (and have
+    more components) get their full key computed, one group at a time.
+    Returns the indexes of *seq* in sorted order.
+    """
+    parse = natsort_keygen(None, alg)
+
+    def prefix_key(val, _key=key, _parse=parse, _lazy=parse.lazy_string_func, _n=n):
+        if _key is not None:
+            val = _key(val)
+        if type(val) is str and _lazy is not None:
+            return tuple(islice(_lazy(val), _n))
+        return _parse(val)[:_n]
+
+    prefix_keys = list(map(prefix_key, seq))
+    order = sorted(range(len(seq)), key=prefix_keys.__getitem__, reverse=reverse)
+
+    # Shorter prefix keys are already full keys, so need no refinement.
+    natkey = natsort_keygen(key, alg)
+    result = []
+    for prefix, group in groupby(order, key=prefix_keys.__getitem__):
+        group = list(group)
+        if len(group) > 1 and len(prefix) == n:
+            group.sort(key=lambda i: natkey(seq[i]), reverse=reverse)
+        result.extend(group)
+    return result
 
 
 # Exposed for simplicity if one needs the default natsort key.
-natsort_key = natsort_keygen()
+natsort_key = _natsort_key_factory(None, ns.DEFAULT)
 natsort_key.__doc__ = """\
 natsort_key(val)
 The default natural sorting key.
@@ -211,7 +561,18 @@ natsort_keygen
 """
 
 
-def natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
+def natsorted(
+    seq,
+    key=None,
+    reverse=False,
+    alg=ns.DEFAULT,
+    cache=None,
+    workers=None,
+    chunksize=None,
+    offset=0,
+    limit=None,
+    key_prefix=None,
+):
     """
     Sorts an iterable naturally.
 
@@ -234,6 +595,36 @@ def natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    cache : {{None, True, int, mapping}}, optional
+        Remember the key of each value, so that repeated values are
+        parsed only once. See :func:`natsort_keygen` for details.
+        The default of `None` does not cache.
+
+    workers : int, optional
+        Compute the keys in this many worker processes, and sort in
+        this process. The result is identical to the serial one. Inputs
+        shorter than ``PARALLEL_MIN_SIZE`` (100000) elements are always
+        handled serially, and no more workers than CPUs are used. The
+        default of `None` does not use workers.
+
+    chunksize : int, optional
+        The number of elements sent to a worker at a time. The default
+        gives each worker about four chunks.
+
+    offset : int, optional
+        The number of sorted elements to skip. The default is 0.
+
+    limit : int, optional
+        The most sorted elements to return, after skipping *offset*.
+        The default of `None` returns all of them.
+
+    key_prefix : {{None, True, int}}, optional
+        Sort first on only this many components of each key, and then
+        sort each group of elements whose first components are equal on
+        their full keys. Use `True` to choose the number from a sample
+        of *seq*. The result is the same as without *key_prefix*. The
+        default of `None` sorts on the full keys.
+
     Returns
     -------
     out: list
@@ -246,6 +637,32 @@ def natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
     humansorted : A wrapper for ``natsorted(seq, alg=ns.LOCALE)``.
     index_natsorted : Returns the sorted indexes from `natsorted`.
 
+    Notes
+    -----
+    If *key* is not given and *seq* contains only `int` and `float`
+    objects, or only strings of ASCII digits, the input is sorted with
+    a simpler numeric key that gives the same order, and *cache* is
+    not used.
+
+    To see how effective a *cache* is, pass a mapping and compare
+    its size to the length of the input, or sort with a key from
+    ``natsort_keygen(cache=...)`` and call its ``cache_info()``.
+
+    Worker processes are not used if a *cache* is given, or if *key*
+    or the elements of *seq* cannot be pickled (e.g. a `lambda`).
+    Each worker process builds its own natsort key from *key* and
+    *alg* and (for locale-aware algorithms) the current locale.
+
+    With *offset* or *limit*, the result is the same as slicing the
+    full result with ``[offset:offset + limit]``, but only the
+    requested page is put in order.
+
+    With *key_prefix*, strings are parsed only as far as the requested
+    number of components (see :func:`natsort_lazy_keygen`), so much less
+    memory is used for the keys of long strings. Each element that
+    shares its first components with another element is parsed
+    a second time in full. *cache* and *workers* are not used.
+
     Examples
     --------
     Use `natsorted` just like the builtin `sorted`::
@@ -254,9 +671,41 @@ def natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
         >>> natsorted(a)
         ['num2', 'num3', 'num5']
 
+    Return one page of the sorted input::
+
+        >>> natsorted(a, offset=1, limit=1)
+        ['num3']
+
     """
-    key = natsort_keygen(key, alg)
-    return sorted(seq, reverse=reverse, key=key)
+    natkey = natsort_keygen(key, alg, cache)
+    start, stop = _page_bounds(offset, limit)
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("'chunksize' must be positive, got {}".format(chunksize))
+    if key_prefix is not None and key_prefix is not True and key_prefix < 1:
+        msg = "'key_prefix' must be positive or True, got {}"
+        raise ValueError(msg.format(key_prefix))
+
+    # Use a simpler key if the input's natural order is its numeric order.
+    seq = list(seq)
+    simple_key = utils.homogeneous_input_key(seq, alg) if key is None else None
+    if simple_key is not None:
+        natkey = simple_key
+    elif key_prefix is not None:
+        if key_prefix is True:
+            key_prefix = _choose_key_prefix(seq, key, alg)
+        order = _prefix_key_order(seq, key, alg, reverse, key_prefix)
+        return [seq[i] for i in order[start:stop]]
+    elif cache is None:
+        order = _parallel_order(seq, key, alg, reverse, workers, chunksize)
+        if order is not None:
+            return [seq[i] for i in order[start:stop]]
+
+    if start or stop is not None:
+        keys = list(map(natkey, seq))
+        return [seq[i] for i in utils.select_order(keys, start, stop, reverse)]
+
+    seq.sort(reverse=reverse, key=natkey)
+    return seq
 
 
 def humansorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
@@ -364,7 +813,18 @@ def realsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
     return natsorted(seq, key, reverse, alg | ns.REAL)
 
 
-def index_natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
+def index_natsorted(
+    seq,
+    key=None,
+    reverse=False,
+    alg=ns.DEFAULT,
+    cache=None,
+    dedupe=False,
+    workers=None,
+    chunksize=None,
+    offset=0,
+    limit=None,
+):
     """
     Determine the list of the indexes used to sort the input sequence.
 
@@ -392,6 +852,35 @@ def index_natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    cache : {{None, True, int, mapping}}, optional
+        Remember the key of each value, so that repeated values are
+        parsed only once. See :func:`natsort_keygen` for details.
+        The default of `None` does not cache.
+
+    dedupe : {{True, False}}, optional
+        Sort only the distinct values of *seq*, then order the full
+        sequence by the rank of each value. This is much faster when
+        *seq* has many repeated values. The result is the same. The
+        default is `False`.
+
+    workers : int, optional
+        Compute the keys in this many worker processes, and sort in
+        this process. The result is identical to the serial one. Inputs
+        shorter than ``PARALLEL_MIN_SIZE`` (100000) elements are always
+        handled serially, and no more workers than CPUs are used. The
+        default of `None` does not use workers.
+
+    chunksize : int, optional
+        The number of elements sent to a worker at a time. The default
+        gives each worker about four chunks.
+
+    offset : int, optional
+        The number of sorted indexes to skip. The default is 0.
+
+    limit : int, optional
+        The most sorted indexes to return, after skipping *offset*.
+        The default of `None` returns all of them.
+
     Returns
     -------
     out : tuple
@@ -400,8 +889,18 @@ def index_natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
     See Also
     --------
     natsorted
+    natrank
     order_by_index
 
+    Notes
+    -----
+    Worker processes are not used if *cache* or *dedupe* is given, or
+    if *key* or the elements of *seq* cannot be pickled. See
+    :func:`natsorted` for details.
+
+    With *offset* or *limit*, only the requested page of indexes is
+    put in order, except with *dedupe*, which orders all of them.
+
     Examples
     --------
 
@@ -420,16 +919,36 @@ def index_natsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
         ['baz', 'foo', 'bar']
 
     """
-    if key is None:
-        newkey = itemgetter(1)
-    else:
-
-        def newkey(x):
-            return key(itemgetter(1)(x))
+    natkey = natsort_keygen(key, alg, cache)
+    start, stop = _page_bounds(offset, limit)
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("'chunksize' must be positive, got {}".format(chunksize))
+
+    # Use a simpler key if the input's natural order is its numeric order.
+    seq = list(seq)
+    simple_key = utils.homogeneous_input_key(seq, alg) if key is None else None
+    if simple_key is not None:
+        natkey = simple_key
+    elif cache is None and not dedupe:
+        order = _parallel_order(seq, key, alg, reverse, workers, chunksize)
+        if order is not None:
+            return order[start:stop]
+
+    if dedupe:
+        if key is not None:
+            # Group on the result of key, since equal elements may differ there.
+            seq, natkey = list(map(key, seq)), natsort_keygen(None, alg, cache)
+        order = utils.argsort_ranks(utils.dense_ranks(seq, natkey), reverse)
+        return order[start:stop]
+    elif start or stop is not None:
+        return utils.select_order(list(map(natkey, seq)), start, stop, reverse)
+
+    def newkey(x, _natkey=natkey):
+        return _natkey(x[1])
 
     # Pair the index and sequence together, then sort by element
     index_seq_pair = [(x, y) for x, y in enumerate(seq)]
-    index_seq_pair.sort(reverse=reverse, key=natsort_keygen(newkey, alg))
+    index_seq_pair.sort(reverse=reverse, key=newkey)
     return [x for x, _ in index_seq_pair]
 
 
@@ -527,6 +1046,281 @@ def index_realsorted(seq, key=None, reverse=False, alg=ns.DEFAULT):
     return index_natsorted(seq, key, reverse, alg | ns.REAL)
 
 
+def natmerge(*iterables, key=None, reverse=False, alg=ns.DEFAULT):
+    """
+    Merge iterables that are each already sorted naturally.
+
+    This is a lazy k-way merge (with :func:`heapq.merge`), so it is
+    much cheaper than sorting the concatenated input again. The key
+    of each element is computed only once.
+
+    Parameters
+    ----------
+    *iterables : iterable
+        The inputs to merge. Each must already be in the order that
+        :func:`natsorted` would give with the same *key*, *reverse*,
+        and *alg*.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the inputs.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        The inputs are in reversed sorted order, and so is the output.
+        The default is `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : generator
+        The elements of all the inputs, in natural order. Equal elements
+        come in the order of the inputs they are from.
+
+    See Also
+    --------
+    natsorted
+    index_natmerge
+
+    Examples
+    --------
+
+        >>> list(natmerge(['a1', 'a10'], ['a2', 'a9']))
+        ['a1', 'a2', 'a9', 'a10']
+
+    """
+    return heapq.merge(*iterables, key=natsort_keygen(key, alg), reverse=reverse)
+
+
+def index_natmerge(*iterables, key=None, reverse=False, alg=ns.DEFAULT):
+    """
+    Determine where each element of a natural merge comes from.
+
+    This is like :func:`natmerge`, but gives the positions of the
+    elements instead of the elements themselves. This can be used to
+    merge other sequences in the same way.
+
+    Parameters
+    ----------
+    *iterables : iterable
+        The inputs to merge. Each must already be in the order that
+        :func:`natsorted` would give with the same *key*, *reverse*,
+        and *alg*.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the inputs.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        The inputs are in reversed sorted order, and so is the output.
+        The default is `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : generator
+        A tuple ``(i, j)`` for each merged element, meaning element *j*
+        of input *i*.
+
+    See Also
+    --------
+    natmerge
+    index_natsorted
+
+    Examples
+    --------
+
+    Merge two lists and the lists of data that go with them::
+
+        >>> names = [['a1', 'a10'], ['a2', 'a9']]
+        >>> sizes = [[100, 200], [300, 400]]
+        >>> index = list(index_natmerge(*names))
+        >>> index
+        [(0, 0), (1, 0), (1, 1), (0, 1)]
+        >>> [names[i][j] for i, j in index]
+        ['a1', 'a2', 'a9', 'a10']
+        >>> [sizes[i][j] for i, j in index]
+        [100, 300, 400, 200]
+
+    """
+    natkey = natsort_keygen(key, alg)
+
+    def newkey(x, _natkey=natkey):
+        return _natkey(x[2])
+
+    # Tag each element with its position, and drop the element after merging.
+    tagged = [zip(repeat(i), count(), x) for i, x in enumerate(iterables)]
+    merged = heapq.merge(*tagged, key=newkey, reverse=reverse)
+    return ((i, j) for i, j, _ in merged)
+
+
+def natsmallest(n, iterable, key=None, alg=ns.DEFAULT):
+    """
+    Return the first *n* elements of an iterable in natural order.
+
+    This gives the same result as ``natsorted(iterable)[:n]``, but
+    uses a heap of size *n* (with :func:`heapq.nsmallest`) instead
+    of sorting the whole input.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements to return.
+
+    iterable : iterable
+        The input to select from. It is consumed once, and only *n*
+        of its elements are held at a time.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the iterable.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : list
+        The *n* smallest elements, in natural order.
+
+    See Also
+    --------
+    natsorted
+    natlargest
+
+    Examples
+    --------
+
+        >>> natsmallest(2, ['num10', 'num9', 'num2', 'num20'])
+        ['num2', 'num9']
+
+    """
+    return heapq.nsmallest(n, iterable, key=natsort_keygen(key, alg))
+
+
+def natlargest(n, iterable, key=None, alg=ns.DEFAULT):
+    """
+    Return the last *n* elements of an iterable in natural order.
+
+    This gives the same result as ``natsorted(iterable, reverse=True)[:n]``,
+    but uses a heap of size *n* (with :func:`heapq.nlargest`) instead
+    of sorting the whole input.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements to return.
+
+    iterable : iterable
+        The input to select from. It is consumed once, and only *n*
+        of its elements are held at a time.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the iterable.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : list
+        The *n* largest elements, in reversed natural order.
+
+    See Also
+    --------
+    natsorted
+    natsmallest
+
+    Examples
+    --------
+
+        >>> natlargest(2, ['num10', 'num9', 'num2', 'num20'])
+        ['num20', 'num10']
+
+    """
+    return heapq.nlargest(n, iterable, key=natsort_keygen(key, alg))
+
+
+def natrank(seq, key=None, reverse=False, alg=ns.DEFAULT):
+    """
+    Rank each element of a sequence by its natural order.
+
+    The distinct values of *seq* are found by hashing, and only they
+    are parsed and sorted. Each element is then given the rank of its
+    value, in a single pass over *seq*. This is much cheaper than
+    sorting *seq* when it has few distinct values.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to rank. If any element is not hashable, every element
+        is treated as distinct.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Give rank 0 to the largest elements instead of the smallest.
+        The default is `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : list of int
+        The dense rank of each element of *seq*, starting at 0. Elements
+        that :func:`natsorted` considers equal have the same rank, and
+        the ranks have no gaps.
+
+    See Also
+    --------
+    index_natsorted
+
+    Examples
+    --------
+
+        >>> natrank(['b10', 'a2', 'b9', 'a2', 'b10'])
+        [2, 0, 1, 0, 2]
+
+    The ranks can be used to sort, to group, or to look up the
+    sorted distinct values::
+
+        >>> a = ['b10', 'a2', 'b9', 'a2', 'b10']
+        >>> ranks = natrank(a)
+        >>> uniques = natsorted(set(a))
+        >>> [uniques[r] for r in ranks] == a
+        True
+
+    """
+    seq = list(seq) if key is None else list(map(key, seq))
+    ranks = utils.dense_ranks(seq, natsort_keygen(None, alg))
+    if reverse and ranks:
+        top = max(ranks)
+        ranks = [top - x for x in ranks]
+    return ranks
+
+
 # noinspection PyShadowingBuiltins,PyUnresolvedReferences
 def order_by_index(seq, index, iter=False):
     """
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""
+Binary search in natural order, and a list that stays naturally sorted.
+"""
+
+import bisect
+from itertools import chain, islice
+from operator import itemgetter
+
+from natsort.natsort import natsort_keygen
+from natsort.ns_enum import ns
+
+# The target number of elements in each chunk of a NatSortedList.
+# Chunks are split when they grow to twice this size.
+SORTED_LIST_LOAD = 1000
+
+
+def _search(a, x, keys, key, alg, lo, hi, find):
+    """Do a binary search of *a* (or *keys*) for the natsort key of *x*."""
+    if lo < 0:
+        raise ValueError("'lo' must be non-negative, got {}".format(lo))
+    natkey = natsort_keygen(key, alg)
+    target = natkey(x)
+    if keys is not None:
+        if hi is None:
+            hi = len(keys)
+        return find(keys, target, lo, hi)
+
+    # Without precomputed keys, each probed element must be parsed.
+    if hi is None:
+        hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = natkey(a[mid])
+        if probe < target or (find is bisect.bisect_right and probe == target):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def bisect_left(a, x, keys=None, key=None, alg=ns.DEFAULT, lo=0, hi=None):
+    """
+    Locate where to insert *x* in a naturally sorted list.
+
+    If elements equal to *x* in natural order are already in *a*,
+    the position is before them.
+
+    Parameters
+    ----------
+    a : sequence
+        A sequence that is sorted with the same *key* and *alg*,
+        such as the output of :func:`natsorted`.
+
+    x : object
+        The value to search for.
+
+    keys : sequence, optional
+        The natsort keys of the elements of *a*, as returned by
+        :func:`natsort_keygen` with the same *key* and *alg*. If given,
+        only *x* is parsed and *a* is not used, so it may be `None`.
+        Otherwise, each element of *a* that is probed is parsed.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    lo, hi : int, optional
+        Only search ``a[lo:hi]``. By default the whole sequence is searched.
+
+    Returns
+    -------
+    out : int
+        The position at which to insert *x* to keep *a* sorted.
+
+    See Also
+    --------
+    bisect_right
+    insort
+
+    Examples
+    --------
+
+        >>> a = ['num2', 'num5', 'num10']
+        >>> bisect_left(a, 'num5')
+        1
+        >>> bisect_left(a, 'num7', keys=list(map(natsort_keygen(), a)))
+        2
+
+    """
+    return _search(a, x, keys, key, alg, lo, hi, bisect.bisect_left)
+
+
+def bisect_right(a, x, keys=None, key=None, alg=ns.DEFAULT, lo=0, hi=None):
+    """
+    Locate where to insert *x* in a naturally sorted list.
+
+    If elements equal to *x* in natural order are already in *a*,
+    the position is after them. The parameters are the same as
+    those of :func:`bisect_left`.
+
+    Returns
+    -------
+    out : int
+        The position at which to insert *x* to keep *a* sorted.
+
+    See Also
+    --------
+    bisect_left
+    insort
+
+    Examples
+    --------
+
+        >>> bisect_right(['num2', 'num5', 'num10'], 'num05')
+        2
+
+    """
+    return _search(a, x, keys, key, alg, lo, hi, bisect.bisect_right)
+
+
+def insort(a, x, keys=None, key=None, alg=ns.DEFAULT, lo=0, hi=None):
+    """
+    Insert *x* into a naturally sorted list, keeping it sorted.
+
+    *x* is inserted after any elements that are equal to it in
+    natural order, as it would be by :func:`natsorted` if it were
+    appended to *a*. The parameters are the same as those of
+    :func:`bisect_left`, except that *a* is required. If *keys* is
+    given, the key of *x* is inserted into it at the same position.
+
+    See Also
+    --------
+    bisect_left
+    bisect_right
+
+    Examples
+    --------
+
+        >>> a = ['num2', 'num10']
+        >>> insort(a, 'num5')
+        >>> a
+        ['num2', 'num5', 'num10']
+
+    """
+    if keys is None:
+        a.insert(bisect_right(a, x, key=key, alg=alg, lo=lo, hi=hi), x)
+    else:
+        target = natsort_keygen(key, alg)(x)
+        if hi is None:
+            hi = len(keys)
+        i = bisect.bisect_right(keys, target, lo, hi)
+        a.insert(i, x)
+        keys.insert(i, target)
+
+
+class NatSortedList(object):
+    """
+    A list that keeps its elements in natural order.
+
+    The natsort key of each element is computed once, when it is added,
+    and kept alongside it. The elements are stored in chunks of about
+    ``SORTED_LIST_LOAD`` elements, so adding and removing an element
+    takes a binary search and an insertion into one chunk, rather than
+    re-sorting the whole list.
+
+    Elements that are equal in natural order are kept in the order
+    they were added, so the list is always the same as
+    ``natsorted(elements_in_order_added, key=key, alg=alg)``.
+
+    Parameters
+    ----------
+    iterable : iterable, optional
+        The initial elements.
+
+    key : callable, optional
+        A key used to determine how to sort each element.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    See Also
+    --------
+    natsorted
+    insort
+
+    Examples
+    --------
+
+        >>> a = NatSortedList(['num10', 'num2'])
+        >>> a.add('num5')
+        >>> a
+        NatSortedList(['num2', 'num5', 'num10'])
+        >>> a.remove('num2')
+        >>> a[0]
+        'num5'
+        >>> list(a.irange('num3', 'num10', inclusive=(True, False)))
+        ['num5']
+
+    """
+
+    def __init__(self, iterable=None, key=None, alg=ns.DEFAULT):
+        self._natkey = natsort_keygen(key, alg)
+        self.key = key
+        self.alg = alg
+        self.clear()
+        if iterable is not None:
+            self.update(iterable)
+
+    def clear(self):
+        """Remove all elements."""
+        self._values = []
+        self._keys = []
+        self._maxes = []
+        self._len = 0
+        self._offsets = None
+
+    def add(self, value):
+        """Add *value*, after any elements equal to it in natural order."""
+        k = self._natkey(value)
+        if not self._maxes:
+            self._values.append([value])
+            self._keys.append([k])
+            self._maxes.append(k)
+            self._len = 1
+            self._offsets = None
+        else:
+            self._insert(k, value)
+
+    def update(self, iterable):
+        """Add each element of *iterable*."""
+        new = [(self._natkey(x), x) for x in iterable]
+        if not new:
+            return
+        if len(new) * 8 < self._len:
+            for k, x in new:
+                self._insert(k, x)
+            return
+
+        # With many new elements, it is faster to sort everything again.
+        # The existing elements come first so equal elements stay in order.
+        items = list(zip(chain.from_iterable(self._keys), self))
+        items.extend(new)
+        items.sort(key=itemgetter(0))
+        self.clear()
+        for start in range(0, len(items), SORTED_LIST_LOAD):
+            stop = start + SORTED_LIST_LOAD
+            chunk = items[start:stop]
+            self._keys.append([k for k, _ in chunk])
+            self._values.append([x for _, x in chunk])
+            self._maxes.append(chunk[-1][0])
+        self._len = len(items)
+
+    def _insert(self, k, value):
+        """Add *value* with the precomputed key *k*."""
+        pos = bisect.bisect_right(self._maxes, k)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._maxes[pos] = k
+        i = bisect.bisect_right(self._keys[pos], k)
+        self._values[pos].insert(i, value)
+        self._keys[pos].insert(i, k)
+        self._split(pos)
+        self._len += 1
+        self._offsets = None
+
+    def _split(self, pos):
+        """Split chunk *pos* in two if it has grown too large."""
+        if len(self._keys[pos]) <= 2 * SORTED_LIST_LOAD:
+            return
+        half = SORTED_LIST_LOAD
+        values, keys = self._values[pos], self._keys[pos]
+        self._values[pos] = values[:half]
+        self._values.insert(pos + 1, values[half:])
+        self._keys[pos] = keys[:half]
+        self._keys.insert(pos + 1, keys[half:])
+        self._maxes.insert(pos, keys[half - 1])
+
+    def _delete(self, pos, i):
+        """Delete element *i* of chunk *pos*."""
+        values, keys = self._values[pos], self._keys[pos]
+        del values[i]
+        del keys[i]
+        if not keys:
+            del self._values[pos]
+            del self._keys[pos]
+            del self._maxes[pos]
+        elif i == len(keys):
+            self._maxes[pos] = keys[-1]
+        self._len -= 1
+        self._offsets = None
+
+    def _locate(self, value):
+        """Return the chunk and position of *value*, or `None`."""
+        k = self._natkey(value)
+        pos = bisect.bisect_left(self._maxes, k)
+        if pos == len(self._maxes):
+            return None
+        i = bisect.bisect_left(self._keys[pos], k)
+        # Elements can be equal in natural order but not equal to *value*
+        # (e.g. 'a1' and 'a01'), so search through all equal elements.
+        while pos < len(self._keys):
+            keys, values = self._keys[pos], self._values[pos]
+            while i < len(keys):
+                if keys[i] != k:
+                    return None
+                if values[i] == value:
+                    return pos, i
+                i += 1
+            pos, i = pos + 1, 0
+        return None
+
+    def remove(self, value):
+        """Remove the first occurrence of *value*; raise `ValueError` if absent."""
+        loc = self._locate(value)
+        if loc is None:
+            raise ValueError("{!r} is not in list".format(value))
+        self._delete(*loc)
+
+    def discard(self, value):
+        """Remove the first occurrence of *value* if it is present."""
+        loc = self._locate(value)
+        if loc is not None:
+            self._delete(*loc)
+
+    def pop(self, index=-1):
+        """Remove and return the element at *index* (default last)."""
+        pos, i = self._position(index)
+        value = self._values[pos][i]
+        self._delete(pos, i)
+        return value
+
+    def _position(self, index):
+        """Return the chunk and position of the element at *index*."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        offsets = self._chunk_offsets()
+        pos = bisect.bisect_right(self._offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def _index_of(self, pos, i):
+        """Return the index of element *i* of chunk *pos*."""
+        if pos == len(self._values):
+            return self._len
+        return self._chunk_offsets()[pos] + i
+
+    def _chunk_offsets(self):
+        """Return the index of the first element of each chunk."""
+        if self._offsets is None:
+            offsets, total = [], 0
+            for values in self._values:
+                offsets.append(total)
+                total += len(values)
+            self._offsets = offsets
+        return self._offsets
+
+    def bisect_left(self, value):
+        """Return the index to insert *value* before equal elements."""
+        k = self._natkey(value)
+        pos = bisect.bisect_left(self._maxes, k)
+        if pos == len(self._maxes):
+            return self._len
+        return self._index_of(pos, bisect.bisect_left(self._keys[pos], k))
+
+    def bisect_right(self, value):
+        """Return the index to insert *value* after equal elements."""
+        k = self._natkey(value)
+        pos = bisect.bisect_right(self._maxes, k)
+        if pos == len(self._maxes):
+            return self._len
+        return self._index_of(pos, bisect.bisect_right(self._keys[pos], k))
+
+    def index(self, value):
+        """Return the index of the first occurrence of *value*."""
+        loc = self._locate(value)
+        if loc is None:
+            raise ValueError("{!r} is not in list".format(value))
+        return self._index_of(*loc)
+
+    def count(self, value):
+        """Return the number of occurrences of *value*."""
+        lo, hi = self.bisect_left(value), self.bisect_right(value)
+        return sum(1 for x in self._islice(lo, hi) if x == value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Iterate over the elements from *minimum* to *maximum*.
+
+        Either bound may be `None` to leave that end open. Whether
+        elements equal to each bound (in natural order) are included
+        is controlled by *inclusive*.
+        """
+        if minimum is None:
+            lo = 0
+        elif inclusive[0]:
+            lo = self.bisect_left(minimum)
+        else:
+            lo = self.bisect_right(minimum)
+        if maximum is None:
+            hi = self._len
+        elif inclusive[1]:
+            hi = self.bisect_right(maximum)
+        else:
+            hi = self.bisect_left(maximum)
+        return self._islice(lo, hi)
+
+    def _islice(self, start, stop):
+        """Iterate over the elements from index *start* up to *stop*."""
+        if start >= stop:
+            return iter(())
+        pos, i = self._position(start)
+        first = islice(self._values[pos], i, None)
+        rest = chain.from_iterable(islice(self._values, pos + 1, None))
+        return islice(chain(first, rest), stop - start)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._islice(start, stop))
+            return list(self)[index]
+        pos, i = self._position(index)
+        return self._values[pos][i]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(self._len)), reverse=True):
+                self._delete(*self._position(i))
+        else:
+            self._delete(*self._position(index))
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._values)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self._values)))
+
+    def __contains__(self, value):
+        return self._locate(value) is not None
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self))
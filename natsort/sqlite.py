@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Natural sorting inside SQLite databases.
+
+These functions register a collation and a key SQL function on an
+existing sqlite3 connection, so that queries can return rows in natural
+order without loading whole tables into Python.
+"""
+
+import sqlite3
+from functools import lru_cache
+
+from natsort.binary_key import natsort_bytes_keygen
+from natsort.ns_enum import ns
+
+
+def create_collation(conn, name="NATSORT", alg=ns.DEFAULT, key=None, cache_size=None):
+    """
+    Register a collation that compares strings in natural order.
+
+    Once registered, the collation can be used as, e.g.,
+    ``SELECT name FROM files ORDER BY name COLLATE NATSORT``.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection on which to register the collation.
+
+    name : str, optional
+        The name of the collation. The default is "NATSORT"
+        ("NATURAL" is an SQL keyword, so would need to be quoted).
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    key : callable, optional
+        A key used to manipulate each string before parsing for
+        numbers. It should accept a single `str` and return a
+        single value.
+
+    cache_size : int, optional
+        The number of strings whose keys are remembered between
+        comparisons. The default of `None` remembers all of them
+        until the collation is replaced or its cache is cleared.
+
+    Returns
+    -------
+    out : function
+        The comparison function that was registered. Its cache can
+        be inspected or emptied with its ``cache_info`` and
+        ``cache_clear`` methods.
+
+    See Also
+    --------
+    create_key_function
+
+    Notes
+    -----
+    SQLite calls the collation for every comparison, so each string
+    is compared many times during a sort. The key of each string is
+    computed once, encoded as `bytes` with
+    :func:`~natsort.encode_natsort_key`, and cached, so that each
+    comparison is only a cache lookup and a `bytes` comparison.
+
+    Examples
+    --------
+
+        >>> import sqlite3
+        >>> conn = sqlite3.connect(":memory:")
+        >>> _ = create_collation(conn)
+        >>> _ = conn.execute("CREATE TABLE t (name TEXT)")
+        >>> _ = conn.executemany("INSERT INTO t VALUES (?)", [["a10"], ["a9"]])
+        >>> conn.execute("SELECT name FROM t ORDER BY name COLLATE NATSORT").fetchall()
+        [('a9',), ('a10',)]
+
+    """
+    natkey = lru_cache(maxsize=cache_size)(natsort_bytes_keygen(key, alg))
+
+    def collate(a, b, _natkey=natkey):
+        a, b = _natkey(a), _natkey(b)
+        return (a > b) - (a < b)
+
+    collate.cache_info = natkey.cache_info
+    collate.cache_clear = natkey.cache_clear
+    conn.create_collation(name, collate)
+    return collate
+
+
+def create_key_function(conn, name="NATSORT_KEY", alg=ns.DEFAULT, key=None):
+    """
+    Register a SQL function that returns a natural sort key.
+
+    The function returns a BLOB (or NULL for NULL input) that SQLite
+    orders the same as :func:`~natsort.natsorted` orders the input.
+    It is registered as deterministic where SQLite supports it, so it
+    can be used in an index, e.g.
+    ``CREATE INDEX files_natural ON files (NATSORT_KEY(name))``.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection on which to register the function.
+
+    name : str, optional
+        The name of the SQL function. The default is "NATSORT_KEY".
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    key : callable, optional
+        A key used to manipulate each value before parsing for
+        numbers. It should accept a single value and return a
+        single value.
+
+    Returns
+    -------
+    out : function
+        The function that was registered.
+
+    See Also
+    --------
+    create_collation
+    natsort.natsort_bytes_keygen
+
+    Notes
+    -----
+    An index on the key stays correct only as long as the key does
+    not change. With a locale-aware *alg*, the key depends on the
+    locale (and the PyICU version), so rebuild the index with
+    ``REINDEX`` if either changes.
+
+    Examples
+    --------
+
+        >>> import sqlite3
+        >>> conn = sqlite3.connect(":memory:")
+        >>> _ = create_key_function(conn)
+        >>> _ = conn.execute("CREATE TABLE t (name TEXT)")
+        >>> _ = conn.executemany("INSERT INTO t VALUES (?)", [["a10"], ["a9"]])
+        >>> conn.execute("SELECT name FROM t ORDER BY NATSORT_KEY(name)").fetchall()
+        [('a9',), ('a10',)]
+
+    """
+    natkey = natsort_bytes_keygen(key, alg)
+
+    def func(val, _natkey=natkey):
+        return None if val is None else _natkey(val)
+
+    try:
+        conn.create_function(name, 1, func, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):
+        # Python < 3.8 or SQLite < 3.8.3 cannot mark a function deterministic.
+        conn.create_function(name, 1, func)
+    return func
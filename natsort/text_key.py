@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Encode natsort keys as strings that sort in the same order as the keys.
+
+This is the text counterpart of natsort.binary_key. The strings contain
+no NUL characters, so they can be stored in a database column, and
+compared with a plain code-point (binary or "C") collation they order
+the same as natsorted.
+
+THE ENCODING.
+
+A key from natsort_keygen alternates between strings and numbers, and
+is written as follows.
+
+- String components are written as-is, except that the characters
+  U+0000 to U+0003 are escaped as U+0003 followed by U+0003 to U+0006.
+  All other written characters are therefore greater than the two
+  control characters used below.
+- A number is written as the marker U+0002, followed by one of "0" for
+  -Infinity, "1" for negative, "2" for zero, "3" for positive, or "4"
+  for +Infinity. Positive numbers are then written as the decimal
+  exponent and the significant digits, so that the value is 0.DIGITS
+  times ten to the exponent, followed by ".". Negative numbers are
+  written like their absolute value, but with each digit d replaced by
+  9 - d and the "." replaced by ":". Equal int and float values give
+  the same output.
+- The exponent is written as "1" for non-negative or "0" for negative,
+  then the number of digits in the number of digits, the number of
+  digits, and the digits. Negative exponents are then complemented as
+  above.
+- A nested tuple, which is what the PATH algorithm and tuple input
+  produce, is written as its contents followed by U+0001.
+
+"""
+
+from natsort.natsort import natsort_keygen
+from natsort.ns_enum import ns
+
+_ESCAPE = str.maketrans(
+    {"\x00": "\x03\x03", "\x01": "\x03\x04", "\x02": "\x03\x05", "\x03": "\x03\x06"}
+)
+_COMPLEMENT = str.maketrans("0123456789.", "9876543210:")
+_END = "\x01"
+_NUMBER = "\x02"
+
+
+def _encode_digits(digits):
+    """Prefix a string of digits with its length, keeping the order of the value."""
+    size = str(len(digits))
+    return str(len(size)) + size + digits
+
+
+def _encode_positive(digits, exponent):
+    """Encode the positive number 0.DIGITS * 10 ** exponent."""
+    if exponent >= 0:
+        body = "1" + _encode_digits(str(exponent))
+    else:
+        body = "0" + _encode_digits(str(-exponent)).translate(_COMPLEMENT)
+    return body + digits + "."
+
+
+def _encode_number(x, nan):
+    """Encode an int or float, including the marker."""
+    if x != x:
+        x = nan
+    if x == 0:
+        return _NUMBER + "2"
+    elif x == float("inf"):
+        return _NUMBER + "4"
+    elif x == float("-inf"):
+        return _NUMBER + "0"
+
+    if isinstance(x, float) and not x.is_integer():
+        # The shortest repr of a float identifies it uniquely, and no
+        # other number lies between the float and its repr.
+        mantissa, _, exponent = repr(abs(x)).partition("e")
+        whole, _, fraction = mantissa.partition(".")
+        digits = (whole + fraction).lstrip("0")
+        exponent = int(exponent or 0) - len(fraction) + len(digits)
+    else:
+        digits = str(abs(int(x)))
+        exponent = len(digits)
+    body = _encode_positive(digits.rstrip("0"), exponent)
+
+    if x > 0:
+        return _NUMBER + "3" + body
+    else:
+        return _NUMBER + "1" + body.translate(_COMPLEMENT)
+
+
+def _encode_elements(elements, nan):
+    """Encode the elements of a tuple, without a terminator."""
+    out = []
+    for x in elements:
+        if type(x) is str:
+            out.append(x.translate(_ESCAPE))
+        elif type(x) is tuple:
+            out.append(_encode_elements(x, nan))
+            out.append(_END)
+        elif isinstance(x, (int, float)):
+            out.append(_encode_number(x, nan))
+        else:
+            msg = "normalized_string: cannot encode an object of type {}"
+            raise TypeError(msg.format(type(x).__name__))
+    return "".join(out)
+
+
+def normalized_string(s, alg=ns.DEFAULT):
+    """
+    Return a string that sorts lexicographically in natural order.
+
+    The returned string is built from the same key that
+    :func:`natsort_keygen` generates, with numbers written so that
+    comparing the strings character by character gives the same
+    order as comparing the keys. It can be stored in a database
+    column (for example a generated column in PostgreSQL or SQLite)
+    so that an index or ``ORDER BY`` on that column returns rows
+    in natural order.
+
+    Parameters
+    ----------
+    s : str, int, float, tuple, or iterable
+        The value to transform. A `tuple` is transformed as a single
+        value, just as :func:`natsorted` treats a tuple as one element.
+        Any other iterable (such as a `list`) is transformed element
+        by element.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : str or list of str
+        A `str` if *s* is a `str`, a number, or a `tuple`, otherwise
+        a `list` of `str` for each element of *s*.
+
+    Raises
+    ------
+    ValueError
+        *alg* contains ``ns.LOCALE``, ``ns.LOCALEALPHA``, or
+        ``ns.LOCALENUM``.
+
+    TypeError
+        The value to transform is `bytes` (or contains `bytes`).
+
+    See Also
+    --------
+    natsort_keygen
+    encode_natsort_key
+
+    Notes
+    -----
+    Comparing the returned strings by code point (the "C" or binary
+    collation in most databases, or ``<`` in Python) gives exactly
+    the same order as :func:`natsorted` with the same *alg*, for all
+    combinations of ``INT``, ``FLOAT``, ``SIGNED``, ``NOEXP``,
+    ``PATH``, ``IGNORECASE``, ``LOWERCASEFIRST``, ``GROUPLETTERS``,
+    ``NANLAST``, ``NUMAFTER``, and the normalization options, for
+    strings, numbers, and nested tuples of them. Values that
+    :func:`natsorted` considers equal, such as ``"a1"`` and ``"a01"``,
+    give equal strings.
+
+    Locale-aware algorithms are not supported, because the locale
+    transformations are platform-specific and are not ordered by code
+    point.
+
+    The output is not meant to be read, and is subject to change
+    between major versions of :mod:`natsort`.
+
+    Examples
+    --------
+
+        >>> a = ['num10', 'num9', 'num-3']
+        >>> sorted(a, key=lambda x: normalized_string(x, alg=ns.SIGNED))
+        ['num-3', 'num9', 'num10']
+
+    """
+    if alg & ns.LOCALE:
+        raise ValueError("normalized_string does not support locale-aware sorting")
+    natkey = natsort_keygen(alg=alg)
+    nan = float("+inf") if alg & ns.NANLAST else float("-inf")
+
+    def func(val, _natkey=natkey, _nan=nan):
+        if isinstance(val, bytes):
+            raise TypeError("normalized_string: cannot encode bytes")
+        return _encode_elements(_natkey(val), _nan)
+
+    if isinstance(s, (str, bytes, int, float, tuple)):
+        return func(s)
+    return [func(x) for x in s]
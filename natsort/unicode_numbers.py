@@ -5,32 +5,65 @@ Pre-determine the collection of unicode decimals, digits, and numerals.
 
 import unicodedata
 
-from natsort.unicode_numeric_hex import numeric_hex
-
-# Convert each hex into the literal Unicode character.
-# Stop if a ValueError is raised in case of a narrow Unicode build.
-# The extra check with unicodedata is in case this Python version
-# does not support some characters.
-numeric_chars = []
-for a in numeric_hex:
-    try:
-        character = chr(a)
-    except ValueError:  # pragma: no cover
-        break
-    if unicodedata.numeric(character, None) is None:
-        continue  # pragma: no cover
-    numeric_chars.append(character)
-
-# The digit characters are a subset of the numerals.
-digit_chars = [a for a in numeric_chars if unicodedata.digit(a, None) is not None]
-
-# The decimal characters are a subset of the numberals
-# (probably of the digits, but let's be safe).
-decimal_chars = [a for a in numeric_chars if unicodedata.decimal(a, None) is not None]
-
-# Create a single string with the above data.
-decimals = "".join(decimal_chars)
-digits = "".join(digit_chars)
-numeric = "".join(numeric_chars)
-digits_no_decimals = "".join([x for x in digits if x not in decimals])
-numeric_no_decimals = "".join([x for x in numeric if x not in decimals])
+from natsort.unicode_numeric_tables import numeric_tables
+
+
+def construct_numeric_strings():
+    """
+    Build the unicode decimal, digit, and numeric strings from scratch.
+
+    This queries :mod:`unicodedata` for every character in
+    :data:`natsort.unicode_numeric_hex.numeric_hex`, so it is slow.
+    It is only needed if this Python's unicode database version is
+    not in :data:`natsort.unicode_numeric_tables.numeric_tables`.
+
+    Returns
+    -------
+    out : tuple
+        The decimal, digit, and numeric strings, in that order.
+
+    """
+    from natsort.unicode_numeric_hex import numeric_hex
+
+    # Convert each hex into the literal Unicode character.
+    # Stop if a ValueError is raised in case of a narrow Unicode build.
+    # The extra check with unicodedata is in case this Python version
+    # does not support some characters.
+    numeric_chars = []
+    for a in numeric_hex:
+        try:
+            character = chr(a)
+        except ValueError:  # pragma: no cover
+            break
+        if unicodedata.numeric(character, None) is None:
+            continue  # pragma: no cover
+        numeric_chars.append(character)
+
+    # The digit characters are a subset of the numerals.
+    digit_chars = [a for a in numeric_chars if unicodedata.digit(a, None) is not None]
+
+    # The decimal characters are a subset of the numberals
+    # (probably of the digits, but let's be safe).
+    decimal_chars = [
+        a for a in numeric_chars if unicodedata.decimal(a, None) is not None
+    ]
+
+    return "".join(decimal_chars), "".join(digit_chars), "".join(numeric_chars)
+
+
+# Use the pre-built strings for this unicode database version if we have them,
+# since building them at import time is slow.
+try:
+    decimals, digits, numeric = numeric_tables[unicodedata.unidata_version]
+except KeyError:  # pragma: no cover
+    decimals, digits, numeric = construct_numeric_strings()
+
+# Each character as an element of a list.
+decimal_chars = list(decimals)
+digit_chars = list(digits)
+numeric_chars = list(numeric)
+
+# Strings without the decimal characters.
+_decimal_set = frozenset(decimals)
+digits_no_decimals = "".join([x for x in digits if x not in _decimal_set])
+numeric_no_decimals = "".join([x for x in numeric if x not in _decimal_set])
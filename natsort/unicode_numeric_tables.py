@@ -0,0 +1,2531 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-built unicode decimal, digit, and numeric strings.
+
+This file is generated by dev/generate_unicode_tables.py - do not edit.
+"""
+
+# Rather than query unicodedata for every numeric character at import time,
+# the strings built by natsort.unicode_numbers.construct_numeric_strings are
+# stored for each unicode database version. The values are tuples of the
+# decimal, digit, and numeric strings, in that order.
+numeric_tables = {
+    "9.0.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00011066\U00011067\U00011068\U00011069"
+            "\U0001106a\U0001106b\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0"
+            "\U000110f1\U000110f2\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7"
+            "\U000110f8\U000110f9\U00011136\U00011137\U00011138\U00011139\U0001113a"
+            "\U0001113b\U0001113c\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1"
+            "\U000111d2\U000111d3\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8"
+            "\U000111d9\U000112f0\U000112f1\U000112f2\U000112f3\U000112f4\U000112f5"
+            "\U000112f6\U000112f7\U000112f8\U000112f9\U00011450\U00011451\U00011452"
+            "\U00011453\U00011454\U00011455\U00011456\U00011457\U00011458\U00011459"
+            "\U000114d0\U000114d1\U000114d2\U000114d3\U000114d4\U000114d5\U000114d6"
+            "\U000114d7\U000114d8\U000114d9\U00011650\U00011651\U00011652\U00011653"
+            "\U00011654\U00011655\U00011656\U00011657\U00011658\U00011659\U000116c0"
+            "\U000116c1\U000116c2\U000116c3\U000116c4\U000116c5\U000116c6\U000116c7"
+            "\U000116c8\U000116c9\U00011730\U00011731\U00011732\U00011733\U00011734"
+            "\U00011735\U00011736\U00011737\U00011738\U00011739\U000118e0\U000118e1"
+            "\U000118e2\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8"
+            "\U000118e9\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54\U00011c55"
+            "\U00011c56\U00011c57\U00011c58\U00011c59\U00016a60\U00016a61\U00016a62"
+            "\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67\U00016a68\U00016a69"
+            "\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54\U00016b55\U00016b56"
+            "\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf\U0001d7d0\U0001d7d1"
+            "\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6\U0001d7d7\U0001d7d8"
+            "\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd\U0001d7de\U0001d7df"
+            "\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4\U0001d7e5\U0001d7e6"
+            "\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb\U0001d7ec\U0001d7ed"
+            "\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2\U0001d7f3\U0001d7f4"
+            "\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9\U0001d7fa\U0001d7fb"
+            "\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e950\U0001e951\U0001e952"
+            "\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00011052\U00011053\U00011054\U00011055\U00011056\U00011057"
+            "\U00011058\U00011059\U0001105a\U00011066\U00011067\U00011068\U00011069"
+            "\U0001106a\U0001106b\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0"
+            "\U000110f1\U000110f2\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7"
+            "\U000110f8\U000110f9\U00011136\U00011137\U00011138\U00011139\U0001113a"
+            "\U0001113b\U0001113c\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1"
+            "\U000111d2\U000111d3\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8"
+            "\U000111d9\U000112f0\U000112f1\U000112f2\U000112f3\U000112f4\U000112f5"
+            "\U000112f6\U000112f7\U000112f8\U000112f9\U00011450\U00011451\U00011452"
+            "\U00011453\U00011454\U00011455\U00011456\U00011457\U00011458\U00011459"
+            "\U000114d0\U000114d1\U000114d2\U000114d3\U000114d4\U000114d5\U000114d6"
+            "\U000114d7\U000114d8\U000114d9\U00011650\U00011651\U00011652\U00011653"
+            "\U00011654\U00011655\U00011656\U00011657\U00011658\U00011659\U000116c0"
+            "\U000116c1\U000116c2\U000116c3\U000116c4\U000116c5\U000116c6\U000116c7"
+            "\U000116c8\U000116c9\U00011730\U00011731\U00011732\U00011733\U00011734"
+            "\U00011735\U00011736\U00011737\U00011738\U00011739\U000118e0\U000118e1"
+            "\U000118e2\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8"
+            "\U000118e9\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54\U00011c55"
+            "\U00011c56\U00011c57\U00011c58\U00011c59\U00016a60\U00016a61\U00016a62"
+            "\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67\U00016a68\U00016a69"
+            "\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54\U00016b55\U00016b56"
+            "\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf\U0001d7d0\U0001d7d1"
+            "\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6\U0001d7d7\U0001d7d8"
+            "\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd\U0001d7de\U0001d7df"
+            "\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4\U0001d7e5\U0001d7e6"
+            "\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb\U0001d7ec\U0001d7ed"
+            "\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2\U0001d7f3\U0001d7f4"
+            "\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9\U0001d7fa\U0001d7fb"
+            "\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e950\U0001e951\U0001e952"
+            "\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958\U0001e959"
+            "\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105\U0001f106"
+            "\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a7d\U00010a7e"
+            "\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed\U00010aee"
+            "\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c\U00010b5d"
+            "\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b\U00010b7c"
+            "\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab\U00010bac"
+            "\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc\U00010cfd"
+            "\U00010cfe\U00010cff\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00010e69\U00010e6a\U00010e6b"
+            "\U00010e6c\U00010e6d\U00010e6e\U00010e6f\U00010e70\U00010e71\U00010e72"
+            "\U00010e73\U00010e74\U00010e75\U00010e76\U00010e77\U00010e78\U00010e79"
+            "\U00010e7a\U00010e7b\U00010e7c\U00010e7d\U00010e7e\U00011052\U00011053"
+            "\U00011054\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a"
+            "\U0001105b\U0001105c\U0001105d\U0001105e\U0001105f\U00011060\U00011061"
+            "\U00011062\U00011063\U00011064\U00011065\U00011066\U00011067\U00011068"
+            "\U00011069\U0001106a\U0001106b\U0001106c\U0001106d\U0001106e\U0001106f"
+            "\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4\U000110f5\U000110f6"
+            "\U000110f7\U000110f8\U000110f9\U00011136\U00011137\U00011138\U00011139"
+            "\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e\U0001113f\U000111d0"
+            "\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5\U000111d6\U000111d7"
+            "\U000111d8\U000111d9\U000111e1\U000111e2\U000111e3\U000111e4\U000111e5"
+            "\U000111e6\U000111e7\U000111e8\U000111e9\U000111ea\U000111eb\U000111ec"
+            "\U000111ed\U000111ee\U000111ef\U000111f0\U000111f1\U000111f2\U000111f3"
+            "\U000111f4\U000112f0\U000112f1\U000112f2\U000112f3\U000112f4\U000112f5"
+            "\U000112f6\U000112f7\U000112f8\U000112f9\U00011450\U00011451\U00011452"
+            "\U00011453\U00011454\U00011455\U00011456\U00011457\U00011458\U00011459"
+            "\U000114d0\U000114d1\U000114d2\U000114d3\U000114d4\U000114d5\U000114d6"
+            "\U000114d7\U000114d8\U000114d9\U00011650\U00011651\U00011652\U00011653"
+            "\U00011654\U00011655\U00011656\U00011657\U00011658\U00011659\U000116c0"
+            "\U000116c1\U000116c2\U000116c3\U000116c4\U000116c5\U000116c6\U000116c7"
+            "\U000116c8\U000116c9\U00011730\U00011731\U00011732\U00011733\U00011734"
+            "\U00011735\U00011736\U00011737\U00011738\U00011739\U0001173a\U0001173b"
+            "\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5\U000118e6"
+            "\U000118e7\U000118e8\U000118e9\U000118ea\U000118eb\U000118ec\U000118ed"
+            "\U000118ee\U000118ef\U000118f0\U000118f1\U000118f2\U00011c50\U00011c51"
+            "\U00011c52\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58"
+            "\U00011c59\U00011c5a\U00011c5b\U00011c5c\U00011c5d\U00011c5e\U00011c5f"
+            "\U00011c60\U00011c61\U00011c62\U00011c63\U00011c64\U00011c65\U00011c66"
+            "\U00011c67\U00011c68\U00011c69\U00011c6a\U00011c6b\U00011c6c\U00012400"
+            "\U00012401\U00012402\U00012403\U00012404\U00012405\U00012406\U00012407"
+            "\U00012408\U00012409\U0001240a\U0001240b\U0001240c\U0001240d\U0001240e"
+            "\U0001240f\U00012410\U00012411\U00012412\U00012413\U00012414\U00012415"
+            "\U00012416\U00012417\U00012418\U00012419\U0001241a\U0001241b\U0001241c"
+            "\U0001241d\U0001241e\U0001241f\U00012420\U00012421\U00012422\U00012423"
+            "\U00012424\U00012425\U00012426\U00012427\U00012428\U00012429\U0001242a"
+            "\U0001242b\U0001242c\U0001242d\U0001242e\U0001242f\U00012430\U00012431"
+            "\U00012432\U00012433\U00012434\U00012435\U00012436\U00012437\U00012438"
+            "\U00012439\U0001243a\U0001243b\U0001243c\U0001243d\U0001243e\U0001243f"
+            "\U00012440\U00012441\U00012442\U00012443\U00012444\U00012445\U00012446"
+            "\U00012447\U00012448\U00012449\U0001244a\U0001244b\U0001244c\U0001244d"
+            "\U0001244e\U0001244f\U00012450\U00012451\U00012452\U00012453\U00012454"
+            "\U00012455\U00012456\U00012457\U00012458\U00012459\U0001245a\U0001245b"
+            "\U0001245c\U0001245d\U0001245e\U0001245f\U00012460\U00012461\U00012462"
+            "\U00012463\U00012464\U00012465\U00012466\U00012467\U00012468\U00012469"
+            "\U0001246a\U0001246b\U0001246c\U0001246d\U0001246e\U00016a60\U00016a61"
+            "\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67\U00016a68"
+            "\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54\U00016b55"
+            "\U00016b56\U00016b57\U00016b58\U00016b59\U00016b5b\U00016b5c\U00016b5d"
+            "\U00016b5e\U00016b5f\U00016b60\U00016b61\U0001d360\U0001d361\U0001d362"
+            "\U0001d363\U0001d364\U0001d365\U0001d366\U0001d367\U0001d368\U0001d369"
+            "\U0001d36a\U0001d36b\U0001d36c\U0001d36d\U0001d36e\U0001d36f\U0001d370"
+            "\U0001d371\U0001d7ce\U0001d7cf\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3"
+            "\U0001d7d4\U0001d7d5\U0001d7d6\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da"
+            "\U0001d7db\U0001d7dc\U0001d7dd\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1"
+            "\U0001d7e2\U0001d7e3\U0001d7e4\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8"
+            "\U0001d7e9\U0001d7ea\U0001d7eb\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef"
+            "\U0001d7f0\U0001d7f1\U0001d7f2\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6"
+            "\U0001d7f7\U0001d7f8\U0001d7f9\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd"
+            "\U0001d7fe\U0001d7ff\U0001e8c7\U0001e8c8\U0001e8c9\U0001e8ca\U0001e8cb"
+            "\U0001e8cc\U0001e8cd\U0001e8ce\U0001e8cf\U0001e950\U0001e951\U0001e952"
+            "\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958\U0001e959"
+            "\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105\U0001f106"
+            "\U0001f107\U0001f108\U0001f109\U0001f10a\U0001f10b\U0001f10c\U00020001"
+            "\U00020064\U000200e2\U00020121\U0002092a\U00020983\U0002098c\U0002099c"
+            "\U00020aea\U00020afd\U00020b19\U00022390\U00022998\U00023b1b\U0002626d"
+            "\U0002f890"
+        ),
+    ),
+    "11.0.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e950"
+            "\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957"
+            "\U0001e958\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010d30"
+            "\U00010d31\U00010d32\U00010d33\U00010d34\U00010d35\U00010d36\U00010d37"
+            "\U00010d38\U00010d39\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00011052\U00011053\U00011054"
+            "\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e950"
+            "\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957"
+            "\U0001e958\U0001e959\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104"
+            "\U0001f105\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a48\U00010a7d"
+            "\U00010a7e\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed"
+            "\U00010aee\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c"
+            "\U00010b5d\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b"
+            "\U00010b7c\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab"
+            "\U00010bac\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc"
+            "\U00010cfd\U00010cfe\U00010cff\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00010e69\U00010e6a\U00010e6b\U00010e6c\U00010e6d\U00010e6e"
+            "\U00010e6f\U00010e70\U00010e71\U00010e72\U00010e73\U00010e74\U00010e75"
+            "\U00010e76\U00010e77\U00010e78\U00010e79\U00010e7a\U00010e7b\U00010e7c"
+            "\U00010e7d\U00010e7e\U00010f1d\U00010f1e\U00010f1f\U00010f20\U00010f21"
+            "\U00010f22\U00010f23\U00010f24\U00010f25\U00010f26\U00010f51\U00010f52"
+            "\U00010f53\U00010f54\U00011052\U00011053\U00011054\U00011055\U00011056"
+            "\U00011057\U00011058\U00011059\U0001105a\U0001105b\U0001105c\U0001105d"
+            "\U0001105e\U0001105f\U00011060\U00011061\U00011062\U00011063\U00011064"
+            "\U00011065\U00011066\U00011067\U00011068\U00011069\U0001106a\U0001106b"
+            "\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2"
+            "\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9"
+            "\U00011136\U00011137\U00011138\U00011139\U0001113a\U0001113b\U0001113c"
+            "\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3"
+            "\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8\U000111d9\U000111e1"
+            "\U000111e2\U000111e3\U000111e4\U000111e5\U000111e6\U000111e7\U000111e8"
+            "\U000111e9\U000111ea\U000111eb\U000111ec\U000111ed\U000111ee\U000111ef"
+            "\U000111f0\U000111f1\U000111f2\U000111f3\U000111f4\U000112f0\U000112f1"
+            "\U000112f2\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8"
+            "\U000112f9\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455"
+            "\U00011456\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2"
+            "\U000114d3\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9"
+            "\U00011650\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656"
+            "\U00011657\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3"
+            "\U000116c4\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730"
+            "\U00011731\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737"
+            "\U00011738\U00011739\U0001173a\U0001173b\U000118e0\U000118e1\U000118e2"
+            "\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8\U000118e9"
+            "\U000118ea\U000118eb\U000118ec\U000118ed\U000118ee\U000118ef\U000118f0"
+            "\U000118f1\U000118f2\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54"
+            "\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59\U00011c5a\U00011c5b"
+            "\U00011c5c\U00011c5d\U00011c5e\U00011c5f\U00011c60\U00011c61\U00011c62"
+            "\U00011c63\U00011c64\U00011c65\U00011c66\U00011c67\U00011c68\U00011c69"
+            "\U00011c6a\U00011c6b\U00011c6c\U00011d50\U00011d51\U00011d52\U00011d53"
+            "\U00011d54\U00011d55\U00011d56\U00011d57\U00011d58\U00011d59\U00011da0"
+            "\U00011da1\U00011da2\U00011da3\U00011da4\U00011da5\U00011da6\U00011da7"
+            "\U00011da8\U00011da9\U00012400\U00012401\U00012402\U00012403\U00012404"
+            "\U00012405\U00012406\U00012407\U00012408\U00012409\U0001240a\U0001240b"
+            "\U0001240c\U0001240d\U0001240e\U0001240f\U00012410\U00012411\U00012412"
+            "\U00012413\U00012414\U00012415\U00012416\U00012417\U00012418\U00012419"
+            "\U0001241a\U0001241b\U0001241c\U0001241d\U0001241e\U0001241f\U00012420"
+            "\U00012421\U00012422\U00012423\U00012424\U00012425\U00012426\U00012427"
+            "\U00012428\U00012429\U0001242a\U0001242b\U0001242c\U0001242d\U0001242e"
+            "\U0001242f\U00012430\U00012431\U00012432\U00012433\U00012434\U00012435"
+            "\U00012436\U00012437\U00012438\U00012439\U0001243a\U0001243b\U0001243c"
+            "\U0001243d\U0001243e\U0001243f\U00012440\U00012441\U00012442\U00012443"
+            "\U00012444\U00012445\U00012446\U00012447\U00012448\U00012449\U0001244a"
+            "\U0001244b\U0001244c\U0001244d\U0001244e\U0001244f\U00012450\U00012451"
+            "\U00012452\U00012453\U00012454\U00012455\U00012456\U00012457\U00012458"
+            "\U00012459\U0001245a\U0001245b\U0001245c\U0001245d\U0001245e\U0001245f"
+            "\U00012460\U00012461\U00012462\U00012463\U00012464\U00012465\U00012466"
+            "\U00012467\U00012468\U00012469\U0001246a\U0001246b\U0001246c\U0001246d"
+            "\U0001246e\U00016a60\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65"
+            "\U00016a66\U00016a67\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52"
+            "\U00016b53\U00016b54\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59"
+            "\U00016b5b\U00016b5c\U00016b5d\U00016b5e\U00016b5f\U00016b60\U00016b61"
+            "\U00016e80\U00016e81\U00016e82\U00016e83\U00016e84\U00016e85\U00016e86"
+            "\U00016e87\U00016e88\U00016e89\U00016e8a\U00016e8b\U00016e8c\U00016e8d"
+            "\U00016e8e\U00016e8f\U00016e90\U00016e91\U00016e92\U00016e93\U00016e94"
+            "\U00016e95\U00016e96\U0001d2e0\U0001d2e1\U0001d2e2\U0001d2e3\U0001d2e4"
+            "\U0001d2e5\U0001d2e6\U0001d2e7\U0001d2e8\U0001d2e9\U0001d2ea\U0001d2eb"
+            "\U0001d2ec\U0001d2ed\U0001d2ee\U0001d2ef\U0001d2f0\U0001d2f1\U0001d2f2"
+            "\U0001d2f3\U0001d360\U0001d361\U0001d362\U0001d363\U0001d364\U0001d365"
+            "\U0001d366\U0001d367\U0001d368\U0001d369\U0001d36a\U0001d36b\U0001d36c"
+            "\U0001d36d\U0001d36e\U0001d36f\U0001d370\U0001d371\U0001d372\U0001d373"
+            "\U0001d374\U0001d375\U0001d376\U0001d377\U0001d378\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e8c7"
+            "\U0001e8c8\U0001e8c9\U0001e8ca\U0001e8cb\U0001e8cc\U0001e8cd\U0001e8ce"
+            "\U0001e8cf\U0001e950\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955"
+            "\U0001e956\U0001e957\U0001e958\U0001e959\U0001ec71\U0001ec72\U0001ec73"
+            "\U0001ec74\U0001ec75\U0001ec76\U0001ec77\U0001ec78\U0001ec79\U0001ec7a"
+            "\U0001ec7b\U0001ec7c\U0001ec7d\U0001ec7e\U0001ec7f\U0001ec80\U0001ec81"
+            "\U0001ec82\U0001ec83\U0001ec84\U0001ec85\U0001ec86\U0001ec87\U0001ec88"
+            "\U0001ec89\U0001ec8a\U0001ec8b\U0001ec8c\U0001ec8d\U0001ec8e\U0001ec8f"
+            "\U0001ec90\U0001ec91\U0001ec92\U0001ec93\U0001ec94\U0001ec95\U0001ec96"
+            "\U0001ec97\U0001ec98\U0001ec99\U0001ec9a\U0001ec9b\U0001ec9c\U0001ec9d"
+            "\U0001ec9e\U0001ec9f\U0001eca0\U0001eca1\U0001eca2\U0001eca3\U0001eca4"
+            "\U0001eca5\U0001eca6\U0001eca7\U0001eca8\U0001eca9\U0001ecaa\U0001ecab"
+            "\U0001ecad\U0001ecae\U0001ecaf\U0001ecb1\U0001ecb2\U0001ecb3\U0001ecb4"
+            "\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105\U0001f106"
+            "\U0001f107\U0001f108\U0001f109\U0001f10a\U0001f10b\U0001f10c\U00020001"
+            "\U00020064\U000200e2\U00020121\U0002092a\U00020983\U0002098c\U0002099c"
+            "\U00020aea\U00020afd\U00020b19\U00022390\U00022998\U00023b1b\U0002626d"
+            "\U0002f890"
+        ),
+    ),
+    "12.1.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010d30"
+            "\U00010d31\U00010d32\U00010d33\U00010d34\U00010d35\U00010d36\U00010d37"
+            "\U00010d38\U00010d39\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00011052\U00011053\U00011054"
+            "\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105"
+            "\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a48\U00010a7d"
+            "\U00010a7e\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed"
+            "\U00010aee\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c"
+            "\U00010b5d\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b"
+            "\U00010b7c\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab"
+            "\U00010bac\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc"
+            "\U00010cfd\U00010cfe\U00010cff\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00010e69\U00010e6a\U00010e6b\U00010e6c\U00010e6d\U00010e6e"
+            "\U00010e6f\U00010e70\U00010e71\U00010e72\U00010e73\U00010e74\U00010e75"
+            "\U00010e76\U00010e77\U00010e78\U00010e79\U00010e7a\U00010e7b\U00010e7c"
+            "\U00010e7d\U00010e7e\U00010f1d\U00010f1e\U00010f1f\U00010f20\U00010f21"
+            "\U00010f22\U00010f23\U00010f24\U00010f25\U00010f26\U00010f51\U00010f52"
+            "\U00010f53\U00010f54\U00011052\U00011053\U00011054\U00011055\U00011056"
+            "\U00011057\U00011058\U00011059\U0001105a\U0001105b\U0001105c\U0001105d"
+            "\U0001105e\U0001105f\U00011060\U00011061\U00011062\U00011063\U00011064"
+            "\U00011065\U00011066\U00011067\U00011068\U00011069\U0001106a\U0001106b"
+            "\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2"
+            "\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9"
+            "\U00011136\U00011137\U00011138\U00011139\U0001113a\U0001113b\U0001113c"
+            "\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3"
+            "\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8\U000111d9\U000111e1"
+            "\U000111e2\U000111e3\U000111e4\U000111e5\U000111e6\U000111e7\U000111e8"
+            "\U000111e9\U000111ea\U000111eb\U000111ec\U000111ed\U000111ee\U000111ef"
+            "\U000111f0\U000111f1\U000111f2\U000111f3\U000111f4\U000112f0\U000112f1"
+            "\U000112f2\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8"
+            "\U000112f9\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455"
+            "\U00011456\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2"
+            "\U000114d3\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9"
+            "\U00011650\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656"
+            "\U00011657\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3"
+            "\U000116c4\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730"
+            "\U00011731\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737"
+            "\U00011738\U00011739\U0001173a\U0001173b\U000118e0\U000118e1\U000118e2"
+            "\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8\U000118e9"
+            "\U000118ea\U000118eb\U000118ec\U000118ed\U000118ee\U000118ef\U000118f0"
+            "\U000118f1\U000118f2\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54"
+            "\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59\U00011c5a\U00011c5b"
+            "\U00011c5c\U00011c5d\U00011c5e\U00011c5f\U00011c60\U00011c61\U00011c62"
+            "\U00011c63\U00011c64\U00011c65\U00011c66\U00011c67\U00011c68\U00011c69"
+            "\U00011c6a\U00011c6b\U00011c6c\U00011d50\U00011d51\U00011d52\U00011d53"
+            "\U00011d54\U00011d55\U00011d56\U00011d57\U00011d58\U00011d59\U00011da0"
+            "\U00011da1\U00011da2\U00011da3\U00011da4\U00011da5\U00011da6\U00011da7"
+            "\U00011da8\U00011da9\U00011fc0\U00011fc1\U00011fc2\U00011fc3\U00011fc4"
+            "\U00011fc5\U00011fc6\U00011fc7\U00011fc8\U00011fc9\U00011fca\U00011fcb"
+            "\U00011fcc\U00011fcd\U00011fce\U00011fcf\U00011fd0\U00011fd1\U00011fd2"
+            "\U00011fd3\U00011fd4\U00012400\U00012401\U00012402\U00012403\U00012404"
+            "\U00012405\U00012406\U00012407\U00012408\U00012409\U0001240a\U0001240b"
+            "\U0001240c\U0001240d\U0001240e\U0001240f\U00012410\U00012411\U00012412"
+            "\U00012413\U00012414\U00012415\U00012416\U00012417\U00012418\U00012419"
+            "\U0001241a\U0001241b\U0001241c\U0001241d\U0001241e\U0001241f\U00012420"
+            "\U00012421\U00012422\U00012423\U00012424\U00012425\U00012426\U00012427"
+            "\U00012428\U00012429\U0001242a\U0001242b\U0001242c\U0001242d\U0001242e"
+            "\U0001242f\U00012430\U00012431\U00012432\U00012433\U00012434\U00012435"
+            "\U00012436\U00012437\U00012438\U00012439\U0001243a\U0001243b\U0001243c"
+            "\U0001243d\U0001243e\U0001243f\U00012440\U00012441\U00012442\U00012443"
+            "\U00012444\U00012445\U00012446\U00012447\U00012448\U00012449\U0001244a"
+            "\U0001244b\U0001244c\U0001244d\U0001244e\U0001244f\U00012450\U00012451"
+            "\U00012452\U00012453\U00012454\U00012455\U00012456\U00012457\U00012458"
+            "\U00012459\U0001245a\U0001245b\U0001245c\U0001245d\U0001245e\U0001245f"
+            "\U00012460\U00012461\U00012462\U00012463\U00012464\U00012465\U00012466"
+            "\U00012467\U00012468\U00012469\U0001246a\U0001246b\U0001246c\U0001246d"
+            "\U0001246e\U00016a60\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65"
+            "\U00016a66\U00016a67\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52"
+            "\U00016b53\U00016b54\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59"
+            "\U00016b5b\U00016b5c\U00016b5d\U00016b5e\U00016b5f\U00016b60\U00016b61"
+            "\U00016e80\U00016e81\U00016e82\U00016e83\U00016e84\U00016e85\U00016e86"
+            "\U00016e87\U00016e88\U00016e89\U00016e8a\U00016e8b\U00016e8c\U00016e8d"
+            "\U00016e8e\U00016e8f\U00016e90\U00016e91\U00016e92\U00016e93\U00016e94"
+            "\U00016e95\U00016e96\U0001d2e0\U0001d2e1\U0001d2e2\U0001d2e3\U0001d2e4"
+            "\U0001d2e5\U0001d2e6\U0001d2e7\U0001d2e8\U0001d2e9\U0001d2ea\U0001d2eb"
+            "\U0001d2ec\U0001d2ed\U0001d2ee\U0001d2ef\U0001d2f0\U0001d2f1\U0001d2f2"
+            "\U0001d2f3\U0001d360\U0001d361\U0001d362\U0001d363\U0001d364\U0001d365"
+            "\U0001d366\U0001d367\U0001d368\U0001d369\U0001d36a\U0001d36b\U0001d36c"
+            "\U0001d36d\U0001d36e\U0001d36f\U0001d370\U0001d371\U0001d372\U0001d373"
+            "\U0001d374\U0001d375\U0001d376\U0001d377\U0001d378\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e8c7\U0001e8c8"
+            "\U0001e8c9\U0001e8ca\U0001e8cb\U0001e8cc\U0001e8cd\U0001e8ce\U0001e8cf"
+            "\U0001e950\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956"
+            "\U0001e957\U0001e958\U0001e959\U0001ec71\U0001ec72\U0001ec73\U0001ec74"
+            "\U0001ec75\U0001ec76\U0001ec77\U0001ec78\U0001ec79\U0001ec7a\U0001ec7b"
+            "\U0001ec7c\U0001ec7d\U0001ec7e\U0001ec7f\U0001ec80\U0001ec81\U0001ec82"
+            "\U0001ec83\U0001ec84\U0001ec85\U0001ec86\U0001ec87\U0001ec88\U0001ec89"
+            "\U0001ec8a\U0001ec8b\U0001ec8c\U0001ec8d\U0001ec8e\U0001ec8f\U0001ec90"
+            "\U0001ec91\U0001ec92\U0001ec93\U0001ec94\U0001ec95\U0001ec96\U0001ec97"
+            "\U0001ec98\U0001ec99\U0001ec9a\U0001ec9b\U0001ec9c\U0001ec9d\U0001ec9e"
+            "\U0001ec9f\U0001eca0\U0001eca1\U0001eca2\U0001eca3\U0001eca4\U0001eca5"
+            "\U0001eca6\U0001eca7\U0001eca8\U0001eca9\U0001ecaa\U0001ecab\U0001ecad"
+            "\U0001ecae\U0001ecaf\U0001ecb1\U0001ecb2\U0001ecb3\U0001ecb4\U0001ed01"
+            "\U0001ed02\U0001ed03\U0001ed04\U0001ed05\U0001ed06\U0001ed07\U0001ed08"
+            "\U0001ed09\U0001ed0a\U0001ed0b\U0001ed0c\U0001ed0d\U0001ed0e\U0001ed0f"
+            "\U0001ed10\U0001ed11\U0001ed12\U0001ed13\U0001ed14\U0001ed15\U0001ed16"
+            "\U0001ed17\U0001ed18\U0001ed19\U0001ed1a\U0001ed1b\U0001ed1c\U0001ed1d"
+            "\U0001ed1e\U0001ed1f\U0001ed20\U0001ed21\U0001ed22\U0001ed23\U0001ed24"
+            "\U0001ed25\U0001ed26\U0001ed27\U0001ed28\U0001ed29\U0001ed2a\U0001ed2b"
+            "\U0001ed2c\U0001ed2d\U0001ed2f\U0001ed30\U0001ed31\U0001ed32\U0001ed33"
+            "\U0001ed34\U0001ed35\U0001ed36\U0001ed37\U0001ed38\U0001ed39\U0001ed3a"
+            "\U0001ed3b\U0001ed3c\U0001ed3d\U0001f100\U0001f101\U0001f102\U0001f103"
+            "\U0001f104\U0001f105\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+            "\U0001f10b\U0001f10c\U00020001\U00020064\U000200e2\U00020121\U0002092a"
+            "\U00020983\U0002098c\U0002099c\U00020aea\U00020afd\U00020b19\U00022390"
+            "\U00022998\U00023b1b\U0002626d\U0002f890"
+        ),
+    ),
+    "13.0.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010d30"
+            "\U00010d31\U00010d32\U00010d33\U00010d34\U00010d35\U00010d36\U00010d37"
+            "\U00010d38\U00010d39\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00011052\U00011053\U00011054"
+            "\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105"
+            "\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a48\U00010a7d"
+            "\U00010a7e\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed"
+            "\U00010aee\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c"
+            "\U00010b5d\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b"
+            "\U00010b7c\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab"
+            "\U00010bac\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc"
+            "\U00010cfd\U00010cfe\U00010cff\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00010e69\U00010e6a\U00010e6b\U00010e6c\U00010e6d\U00010e6e"
+            "\U00010e6f\U00010e70\U00010e71\U00010e72\U00010e73\U00010e74\U00010e75"
+            "\U00010e76\U00010e77\U00010e78\U00010e79\U00010e7a\U00010e7b\U00010e7c"
+            "\U00010e7d\U00010e7e\U00010f1d\U00010f1e\U00010f1f\U00010f20\U00010f21"
+            "\U00010f22\U00010f23\U00010f24\U00010f25\U00010f26\U00010f51\U00010f52"
+            "\U00010f53\U00010f54\U00011052\U00011053\U00011054\U00011055\U00011056"
+            "\U00011057\U00011058\U00011059\U0001105a\U0001105b\U0001105c\U0001105d"
+            "\U0001105e\U0001105f\U00011060\U00011061\U00011062\U00011063\U00011064"
+            "\U00011065\U00011066\U00011067\U00011068\U00011069\U0001106a\U0001106b"
+            "\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2"
+            "\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9"
+            "\U00011136\U00011137\U00011138\U00011139\U0001113a\U0001113b\U0001113c"
+            "\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3"
+            "\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8\U000111d9\U000111e1"
+            "\U000111e2\U000111e3\U000111e4\U000111e5\U000111e6\U000111e7\U000111e8"
+            "\U000111e9\U000111ea\U000111eb\U000111ec\U000111ed\U000111ee\U000111ef"
+            "\U000111f0\U000111f1\U000111f2\U000111f3\U000111f4\U000112f0\U000112f1"
+            "\U000112f2\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8"
+            "\U000112f9\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455"
+            "\U00011456\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2"
+            "\U000114d3\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9"
+            "\U00011650\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656"
+            "\U00011657\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3"
+            "\U000116c4\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730"
+            "\U00011731\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737"
+            "\U00011738\U00011739\U0001173a\U0001173b\U000118e0\U000118e1\U000118e2"
+            "\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8\U000118e9"
+            "\U000118ea\U000118eb\U000118ec\U000118ed\U000118ee\U000118ef\U000118f0"
+            "\U000118f1\U000118f2\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54"
+            "\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59\U00011c5a\U00011c5b"
+            "\U00011c5c\U00011c5d\U00011c5e\U00011c5f\U00011c60\U00011c61\U00011c62"
+            "\U00011c63\U00011c64\U00011c65\U00011c66\U00011c67\U00011c68\U00011c69"
+            "\U00011c6a\U00011c6b\U00011c6c\U00011d50\U00011d51\U00011d52\U00011d53"
+            "\U00011d54\U00011d55\U00011d56\U00011d57\U00011d58\U00011d59\U00011da0"
+            "\U00011da1\U00011da2\U00011da3\U00011da4\U00011da5\U00011da6\U00011da7"
+            "\U00011da8\U00011da9\U00011fc0\U00011fc1\U00011fc2\U00011fc3\U00011fc4"
+            "\U00011fc5\U00011fc6\U00011fc7\U00011fc8\U00011fc9\U00011fca\U00011fcb"
+            "\U00011fcc\U00011fcd\U00011fce\U00011fcf\U00011fd0\U00011fd1\U00011fd2"
+            "\U00011fd3\U00011fd4\U00012400\U00012401\U00012402\U00012403\U00012404"
+            "\U00012405\U00012406\U00012407\U00012408\U00012409\U0001240a\U0001240b"
+            "\U0001240c\U0001240d\U0001240e\U0001240f\U00012410\U00012411\U00012412"
+            "\U00012413\U00012414\U00012415\U00012416\U00012417\U00012418\U00012419"
+            "\U0001241a\U0001241b\U0001241c\U0001241d\U0001241e\U0001241f\U00012420"
+            "\U00012421\U00012422\U00012423\U00012424\U00012425\U00012426\U00012427"
+            "\U00012428\U00012429\U0001242a\U0001242b\U0001242c\U0001242d\U0001242e"
+            "\U0001242f\U00012430\U00012431\U00012432\U00012433\U00012434\U00012435"
+            "\U00012436\U00012437\U00012438\U00012439\U0001243a\U0001243b\U0001243c"
+            "\U0001243d\U0001243e\U0001243f\U00012440\U00012441\U00012442\U00012443"
+            "\U00012444\U00012445\U00012446\U00012447\U00012448\U00012449\U0001244a"
+            "\U0001244b\U0001244c\U0001244d\U0001244e\U0001244f\U00012450\U00012451"
+            "\U00012452\U00012453\U00012454\U00012455\U00012456\U00012457\U00012458"
+            "\U00012459\U0001245a\U0001245b\U0001245c\U0001245d\U0001245e\U0001245f"
+            "\U00012460\U00012461\U00012462\U00012463\U00012464\U00012465\U00012466"
+            "\U00012467\U00012468\U00012469\U0001246a\U0001246b\U0001246c\U0001246d"
+            "\U0001246e\U00016a60\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65"
+            "\U00016a66\U00016a67\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52"
+            "\U00016b53\U00016b54\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59"
+            "\U00016b5b\U00016b5c\U00016b5d\U00016b5e\U00016b5f\U00016b60\U00016b61"
+            "\U00016e80\U00016e81\U00016e82\U00016e83\U00016e84\U00016e85\U00016e86"
+            "\U00016e87\U00016e88\U00016e89\U00016e8a\U00016e8b\U00016e8c\U00016e8d"
+            "\U00016e8e\U00016e8f\U00016e90\U00016e91\U00016e92\U00016e93\U00016e94"
+            "\U00016e95\U00016e96\U0001d2e0\U0001d2e1\U0001d2e2\U0001d2e3\U0001d2e4"
+            "\U0001d2e5\U0001d2e6\U0001d2e7\U0001d2e8\U0001d2e9\U0001d2ea\U0001d2eb"
+            "\U0001d2ec\U0001d2ed\U0001d2ee\U0001d2ef\U0001d2f0\U0001d2f1\U0001d2f2"
+            "\U0001d2f3\U0001d360\U0001d361\U0001d362\U0001d363\U0001d364\U0001d365"
+            "\U0001d366\U0001d367\U0001d368\U0001d369\U0001d36a\U0001d36b\U0001d36c"
+            "\U0001d36d\U0001d36e\U0001d36f\U0001d370\U0001d371\U0001d372\U0001d373"
+            "\U0001d374\U0001d375\U0001d376\U0001d377\U0001d378\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e8c7\U0001e8c8"
+            "\U0001e8c9\U0001e8ca\U0001e8cb\U0001e8cc\U0001e8cd\U0001e8ce\U0001e8cf"
+            "\U0001e950\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956"
+            "\U0001e957\U0001e958\U0001e959\U0001ec71\U0001ec72\U0001ec73\U0001ec74"
+            "\U0001ec75\U0001ec76\U0001ec77\U0001ec78\U0001ec79\U0001ec7a\U0001ec7b"
+            "\U0001ec7c\U0001ec7d\U0001ec7e\U0001ec7f\U0001ec80\U0001ec81\U0001ec82"
+            "\U0001ec83\U0001ec84\U0001ec85\U0001ec86\U0001ec87\U0001ec88\U0001ec89"
+            "\U0001ec8a\U0001ec8b\U0001ec8c\U0001ec8d\U0001ec8e\U0001ec8f\U0001ec90"
+            "\U0001ec91\U0001ec92\U0001ec93\U0001ec94\U0001ec95\U0001ec96\U0001ec97"
+            "\U0001ec98\U0001ec99\U0001ec9a\U0001ec9b\U0001ec9c\U0001ec9d\U0001ec9e"
+            "\U0001ec9f\U0001eca0\U0001eca1\U0001eca2\U0001eca3\U0001eca4\U0001eca5"
+            "\U0001eca6\U0001eca7\U0001eca8\U0001eca9\U0001ecaa\U0001ecab\U0001ecad"
+            "\U0001ecae\U0001ecaf\U0001ecb1\U0001ecb2\U0001ecb3\U0001ecb4\U0001ed01"
+            "\U0001ed02\U0001ed03\U0001ed04\U0001ed05\U0001ed06\U0001ed07\U0001ed08"
+            "\U0001ed09\U0001ed0a\U0001ed0b\U0001ed0c\U0001ed0d\U0001ed0e\U0001ed0f"
+            "\U0001ed10\U0001ed11\U0001ed12\U0001ed13\U0001ed14\U0001ed15\U0001ed16"
+            "\U0001ed17\U0001ed18\U0001ed19\U0001ed1a\U0001ed1b\U0001ed1c\U0001ed1d"
+            "\U0001ed1e\U0001ed1f\U0001ed20\U0001ed21\U0001ed22\U0001ed23\U0001ed24"
+            "\U0001ed25\U0001ed26\U0001ed27\U0001ed28\U0001ed29\U0001ed2a\U0001ed2b"
+            "\U0001ed2c\U0001ed2d\U0001ed2f\U0001ed30\U0001ed31\U0001ed32\U0001ed33"
+            "\U0001ed34\U0001ed35\U0001ed36\U0001ed37\U0001ed38\U0001ed39\U0001ed3a"
+            "\U0001ed3b\U0001ed3c\U0001ed3d\U0001f100\U0001f101\U0001f102\U0001f103"
+            "\U0001f104\U0001f105\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+            "\U0001f10b\U0001f10c\U00020001\U00020064\U000200e2\U00020121\U0002092a"
+            "\U00020983\U0002098c\U0002099c\U00020aea\U00020afd\U00020b19\U00022390"
+            "\U00022998\U00023b1b\U0002626d\U0002f890"
+        ),
+    ),
+    "14.0.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010d30"
+            "\U00010d31\U00010d32\U00010d33\U00010d34\U00010d35\U00010d36\U00010d37"
+            "\U00010d38\U00010d39\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00011052\U00011053\U00011054"
+            "\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105"
+            "\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a48\U00010a7d"
+            "\U00010a7e\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed"
+            "\U00010aee\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c"
+            "\U00010b5d\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b"
+            "\U00010b7c\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab"
+            "\U00010bac\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc"
+            "\U00010cfd\U00010cfe\U00010cff\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00010e69\U00010e6a\U00010e6b\U00010e6c\U00010e6d\U00010e6e"
+            "\U00010e6f\U00010e70\U00010e71\U00010e72\U00010e73\U00010e74\U00010e75"
+            "\U00010e76\U00010e77\U00010e78\U00010e79\U00010e7a\U00010e7b\U00010e7c"
+            "\U00010e7d\U00010e7e\U00010f1d\U00010f1e\U00010f1f\U00010f20\U00010f21"
+            "\U00010f22\U00010f23\U00010f24\U00010f25\U00010f26\U00010f51\U00010f52"
+            "\U00010f53\U00010f54\U00011052\U00011053\U00011054\U00011055\U00011056"
+            "\U00011057\U00011058\U00011059\U0001105a\U0001105b\U0001105c\U0001105d"
+            "\U0001105e\U0001105f\U00011060\U00011061\U00011062\U00011063\U00011064"
+            "\U00011065\U00011066\U00011067\U00011068\U00011069\U0001106a\U0001106b"
+            "\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2"
+            "\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9"
+            "\U00011136\U00011137\U00011138\U00011139\U0001113a\U0001113b\U0001113c"
+            "\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3"
+            "\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8\U000111d9\U000111e1"
+            "\U000111e2\U000111e3\U000111e4\U000111e5\U000111e6\U000111e7\U000111e8"
+            "\U000111e9\U000111ea\U000111eb\U000111ec\U000111ed\U000111ee\U000111ef"
+            "\U000111f0\U000111f1\U000111f2\U000111f3\U000111f4\U000112f0\U000112f1"
+            "\U000112f2\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8"
+            "\U000112f9\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455"
+            "\U00011456\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2"
+            "\U000114d3\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9"
+            "\U00011650\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656"
+            "\U00011657\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3"
+            "\U000116c4\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730"
+            "\U00011731\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737"
+            "\U00011738\U00011739\U0001173a\U0001173b\U000118e0\U000118e1\U000118e2"
+            "\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8\U000118e9"
+            "\U000118ea\U000118eb\U000118ec\U000118ed\U000118ee\U000118ef\U000118f0"
+            "\U000118f1\U000118f2\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54"
+            "\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59\U00011c5a\U00011c5b"
+            "\U00011c5c\U00011c5d\U00011c5e\U00011c5f\U00011c60\U00011c61\U00011c62"
+            "\U00011c63\U00011c64\U00011c65\U00011c66\U00011c67\U00011c68\U00011c69"
+            "\U00011c6a\U00011c6b\U00011c6c\U00011d50\U00011d51\U00011d52\U00011d53"
+            "\U00011d54\U00011d55\U00011d56\U00011d57\U00011d58\U00011d59\U00011da0"
+            "\U00011da1\U00011da2\U00011da3\U00011da4\U00011da5\U00011da6\U00011da7"
+            "\U00011da8\U00011da9\U00011fc0\U00011fc1\U00011fc2\U00011fc3\U00011fc4"
+            "\U00011fc5\U00011fc6\U00011fc7\U00011fc8\U00011fc9\U00011fca\U00011fcb"
+            "\U00011fcc\U00011fcd\U00011fce\U00011fcf\U00011fd0\U00011fd1\U00011fd2"
+            "\U00011fd3\U00011fd4\U00012400\U00012401\U00012402\U00012403\U00012404"
+            "\U00012405\U00012406\U00012407\U00012408\U00012409\U0001240a\U0001240b"
+            "\U0001240c\U0001240d\U0001240e\U0001240f\U00012410\U00012411\U00012412"
+            "\U00012413\U00012414\U00012415\U00012416\U00012417\U00012418\U00012419"
+            "\U0001241a\U0001241b\U0001241c\U0001241d\U0001241e\U0001241f\U00012420"
+            "\U00012421\U00012422\U00012423\U00012424\U00012425\U00012426\U00012427"
+            "\U00012428\U00012429\U0001242a\U0001242b\U0001242c\U0001242d\U0001242e"
+            "\U0001242f\U00012430\U00012431\U00012432\U00012433\U00012434\U00012435"
+            "\U00012436\U00012437\U00012438\U00012439\U0001243a\U0001243b\U0001243c"
+            "\U0001243d\U0001243e\U0001243f\U00012440\U00012441\U00012442\U00012443"
+            "\U00012444\U00012445\U00012446\U00012447\U00012448\U00012449\U0001244a"
+            "\U0001244b\U0001244c\U0001244d\U0001244e\U0001244f\U00012450\U00012451"
+            "\U00012452\U00012453\U00012454\U00012455\U00012456\U00012457\U00012458"
+            "\U00012459\U0001245a\U0001245b\U0001245c\U0001245d\U0001245e\U0001245f"
+            "\U00012460\U00012461\U00012462\U00012463\U00012464\U00012465\U00012466"
+            "\U00012467\U00012468\U00012469\U0001246a\U0001246b\U0001246c\U0001246d"
+            "\U0001246e\U00016a60\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65"
+            "\U00016a66\U00016a67\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52"
+            "\U00016b53\U00016b54\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59"
+            "\U00016b5b\U00016b5c\U00016b5d\U00016b5e\U00016b5f\U00016b60\U00016b61"
+            "\U00016e80\U00016e81\U00016e82\U00016e83\U00016e84\U00016e85\U00016e86"
+            "\U00016e87\U00016e88\U00016e89\U00016e8a\U00016e8b\U00016e8c\U00016e8d"
+            "\U00016e8e\U00016e8f\U00016e90\U00016e91\U00016e92\U00016e93\U00016e94"
+            "\U00016e95\U00016e96\U0001d2e0\U0001d2e1\U0001d2e2\U0001d2e3\U0001d2e4"
+            "\U0001d2e5\U0001d2e6\U0001d2e7\U0001d2e8\U0001d2e9\U0001d2ea\U0001d2eb"
+            "\U0001d2ec\U0001d2ed\U0001d2ee\U0001d2ef\U0001d2f0\U0001d2f1\U0001d2f2"
+            "\U0001d2f3\U0001d360\U0001d361\U0001d362\U0001d363\U0001d364\U0001d365"
+            "\U0001d366\U0001d367\U0001d368\U0001d369\U0001d36a\U0001d36b\U0001d36c"
+            "\U0001d36d\U0001d36e\U0001d36f\U0001d370\U0001d371\U0001d372\U0001d373"
+            "\U0001d374\U0001d375\U0001d376\U0001d377\U0001d378\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e8c7\U0001e8c8"
+            "\U0001e8c9\U0001e8ca\U0001e8cb\U0001e8cc\U0001e8cd\U0001e8ce\U0001e8cf"
+            "\U0001e950\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956"
+            "\U0001e957\U0001e958\U0001e959\U0001ec71\U0001ec72\U0001ec73\U0001ec74"
+            "\U0001ec75\U0001ec76\U0001ec77\U0001ec78\U0001ec79\U0001ec7a\U0001ec7b"
+            "\U0001ec7c\U0001ec7d\U0001ec7e\U0001ec7f\U0001ec80\U0001ec81\U0001ec82"
+            "\U0001ec83\U0001ec84\U0001ec85\U0001ec86\U0001ec87\U0001ec88\U0001ec89"
+            "\U0001ec8a\U0001ec8b\U0001ec8c\U0001ec8d\U0001ec8e\U0001ec8f\U0001ec90"
+            "\U0001ec91\U0001ec92\U0001ec93\U0001ec94\U0001ec95\U0001ec96\U0001ec97"
+            "\U0001ec98\U0001ec99\U0001ec9a\U0001ec9b\U0001ec9c\U0001ec9d\U0001ec9e"
+            "\U0001ec9f\U0001eca0\U0001eca1\U0001eca2\U0001eca3\U0001eca4\U0001eca5"
+            "\U0001eca6\U0001eca7\U0001eca8\U0001eca9\U0001ecaa\U0001ecab\U0001ecad"
+            "\U0001ecae\U0001ecaf\U0001ecb1\U0001ecb2\U0001ecb3\U0001ecb4\U0001ed01"
+            "\U0001ed02\U0001ed03\U0001ed04\U0001ed05\U0001ed06\U0001ed07\U0001ed08"
+            "\U0001ed09\U0001ed0a\U0001ed0b\U0001ed0c\U0001ed0d\U0001ed0e\U0001ed0f"
+            "\U0001ed10\U0001ed11\U0001ed12\U0001ed13\U0001ed14\U0001ed15\U0001ed16"
+            "\U0001ed17\U0001ed18\U0001ed19\U0001ed1a\U0001ed1b\U0001ed1c\U0001ed1d"
+            "\U0001ed1e\U0001ed1f\U0001ed20\U0001ed21\U0001ed22\U0001ed23\U0001ed24"
+            "\U0001ed25\U0001ed26\U0001ed27\U0001ed28\U0001ed29\U0001ed2a\U0001ed2b"
+            "\U0001ed2c\U0001ed2d\U0001ed2f\U0001ed30\U0001ed31\U0001ed32\U0001ed33"
+            "\U0001ed34\U0001ed35\U0001ed36\U0001ed37\U0001ed38\U0001ed39\U0001ed3a"
+            "\U0001ed3b\U0001ed3c\U0001ed3d\U0001f100\U0001f101\U0001f102\U0001f103"
+            "\U0001f104\U0001f105\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+            "\U0001f10b\U0001f10c\U00020001\U00020064\U000200e2\U00020121\U0002092a"
+            "\U00020983\U0002098c\U0002099c\U00020aea\U00020afd\U00020b19\U00022390"
+            "\U00022998\U00023b1b\U0002626d\U0002f890"
+        ),
+    ),
+    "15.0.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010d30"
+            "\U00010d31\U00010d32\U00010d33\U00010d34\U00010d35\U00010d36\U00010d37"
+            "\U00010d38\U00010d39\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00011052\U00011053\U00011054"
+            "\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105"
+            "\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a48\U00010a7d"
+            "\U00010a7e\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed"
+            "\U00010aee\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c"
+            "\U00010b5d\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b"
+            "\U00010b7c\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab"
+            "\U00010bac\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc"
+            "\U00010cfd\U00010cfe\U00010cff\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00010e69\U00010e6a\U00010e6b\U00010e6c\U00010e6d\U00010e6e"
+            "\U00010e6f\U00010e70\U00010e71\U00010e72\U00010e73\U00010e74\U00010e75"
+            "\U00010e76\U00010e77\U00010e78\U00010e79\U00010e7a\U00010e7b\U00010e7c"
+            "\U00010e7d\U00010e7e\U00010f1d\U00010f1e\U00010f1f\U00010f20\U00010f21"
+            "\U00010f22\U00010f23\U00010f24\U00010f25\U00010f26\U00010f51\U00010f52"
+            "\U00010f53\U00010f54\U00011052\U00011053\U00011054\U00011055\U00011056"
+            "\U00011057\U00011058\U00011059\U0001105a\U0001105b\U0001105c\U0001105d"
+            "\U0001105e\U0001105f\U00011060\U00011061\U00011062\U00011063\U00011064"
+            "\U00011065\U00011066\U00011067\U00011068\U00011069\U0001106a\U0001106b"
+            "\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2"
+            "\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9"
+            "\U00011136\U00011137\U00011138\U00011139\U0001113a\U0001113b\U0001113c"
+            "\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3"
+            "\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8\U000111d9\U000111e1"
+            "\U000111e2\U000111e3\U000111e4\U000111e5\U000111e6\U000111e7\U000111e8"
+            "\U000111e9\U000111ea\U000111eb\U000111ec\U000111ed\U000111ee\U000111ef"
+            "\U000111f0\U000111f1\U000111f2\U000111f3\U000111f4\U000112f0\U000112f1"
+            "\U000112f2\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8"
+            "\U000112f9\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455"
+            "\U00011456\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2"
+            "\U000114d3\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9"
+            "\U00011650\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656"
+            "\U00011657\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3"
+            "\U000116c4\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730"
+            "\U00011731\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737"
+            "\U00011738\U00011739\U0001173a\U0001173b\U000118e0\U000118e1\U000118e2"
+            "\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8\U000118e9"
+            "\U000118ea\U000118eb\U000118ec\U000118ed\U000118ee\U000118ef\U000118f0"
+            "\U000118f1\U000118f2\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54"
+            "\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59\U00011c5a\U00011c5b"
+            "\U00011c5c\U00011c5d\U00011c5e\U00011c5f\U00011c60\U00011c61\U00011c62"
+            "\U00011c63\U00011c64\U00011c65\U00011c66\U00011c67\U00011c68\U00011c69"
+            "\U00011c6a\U00011c6b\U00011c6c\U00011d50\U00011d51\U00011d52\U00011d53"
+            "\U00011d54\U00011d55\U00011d56\U00011d57\U00011d58\U00011d59\U00011da0"
+            "\U00011da1\U00011da2\U00011da3\U00011da4\U00011da5\U00011da6\U00011da7"
+            "\U00011da8\U00011da9\U00011fc0\U00011fc1\U00011fc2\U00011fc3\U00011fc4"
+            "\U00011fc5\U00011fc6\U00011fc7\U00011fc8\U00011fc9\U00011fca\U00011fcb"
+            "\U00011fcc\U00011fcd\U00011fce\U00011fcf\U00011fd0\U00011fd1\U00011fd2"
+            "\U00011fd3\U00011fd4\U00012400\U00012401\U00012402\U00012403\U00012404"
+            "\U00012405\U00012406\U00012407\U00012408\U00012409\U0001240a\U0001240b"
+            "\U0001240c\U0001240d\U0001240e\U0001240f\U00012410\U00012411\U00012412"
+            "\U00012413\U00012414\U00012415\U00012416\U00012417\U00012418\U00012419"
+            "\U0001241a\U0001241b\U0001241c\U0001241d\U0001241e\U0001241f\U00012420"
+            "\U00012421\U00012422\U00012423\U00012424\U00012425\U00012426\U00012427"
+            "\U00012428\U00012429\U0001242a\U0001242b\U0001242c\U0001242d\U0001242e"
+            "\U0001242f\U00012430\U00012431\U00012432\U00012433\U00012434\U00012435"
+            "\U00012436\U00012437\U00012438\U00012439\U0001243a\U0001243b\U0001243c"
+            "\U0001243d\U0001243e\U0001243f\U00012440\U00012441\U00012442\U00012443"
+            "\U00012444\U00012445\U00012446\U00012447\U00012448\U00012449\U0001244a"
+            "\U0001244b\U0001244c\U0001244d\U0001244e\U0001244f\U00012450\U00012451"
+            "\U00012452\U00012453\U00012454\U00012455\U00012456\U00012457\U00012458"
+            "\U00012459\U0001245a\U0001245b\U0001245c\U0001245d\U0001245e\U0001245f"
+            "\U00012460\U00012461\U00012462\U00012463\U00012464\U00012465\U00012466"
+            "\U00012467\U00012468\U00012469\U0001246a\U0001246b\U0001246c\U0001246d"
+            "\U0001246e\U00016a60\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65"
+            "\U00016a66\U00016a67\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52"
+            "\U00016b53\U00016b54\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59"
+            "\U00016b5b\U00016b5c\U00016b5d\U00016b5e\U00016b5f\U00016b60\U00016b61"
+            "\U00016e80\U00016e81\U00016e82\U00016e83\U00016e84\U00016e85\U00016e86"
+            "\U00016e87\U00016e88\U00016e89\U00016e8a\U00016e8b\U00016e8c\U00016e8d"
+            "\U00016e8e\U00016e8f\U00016e90\U00016e91\U00016e92\U00016e93\U00016e94"
+            "\U00016e95\U00016e96\U0001d2e0\U0001d2e1\U0001d2e2\U0001d2e3\U0001d2e4"
+            "\U0001d2e5\U0001d2e6\U0001d2e7\U0001d2e8\U0001d2e9\U0001d2ea\U0001d2eb"
+            "\U0001d2ec\U0001d2ed\U0001d2ee\U0001d2ef\U0001d2f0\U0001d2f1\U0001d2f2"
+            "\U0001d2f3\U0001d360\U0001d361\U0001d362\U0001d363\U0001d364\U0001d365"
+            "\U0001d366\U0001d367\U0001d368\U0001d369\U0001d36a\U0001d36b\U0001d36c"
+            "\U0001d36d\U0001d36e\U0001d36f\U0001d370\U0001d371\U0001d372\U0001d373"
+            "\U0001d374\U0001d375\U0001d376\U0001d377\U0001d378\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e8c7\U0001e8c8"
+            "\U0001e8c9\U0001e8ca\U0001e8cb\U0001e8cc\U0001e8cd\U0001e8ce\U0001e8cf"
+            "\U0001e950\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956"
+            "\U0001e957\U0001e958\U0001e959\U0001ec71\U0001ec72\U0001ec73\U0001ec74"
+            "\U0001ec75\U0001ec76\U0001ec77\U0001ec78\U0001ec79\U0001ec7a\U0001ec7b"
+            "\U0001ec7c\U0001ec7d\U0001ec7e\U0001ec7f\U0001ec80\U0001ec81\U0001ec82"
+            "\U0001ec83\U0001ec84\U0001ec85\U0001ec86\U0001ec87\U0001ec88\U0001ec89"
+            "\U0001ec8a\U0001ec8b\U0001ec8c\U0001ec8d\U0001ec8e\U0001ec8f\U0001ec90"
+            "\U0001ec91\U0001ec92\U0001ec93\U0001ec94\U0001ec95\U0001ec96\U0001ec97"
+            "\U0001ec98\U0001ec99\U0001ec9a\U0001ec9b\U0001ec9c\U0001ec9d\U0001ec9e"
+            "\U0001ec9f\U0001eca0\U0001eca1\U0001eca2\U0001eca3\U0001eca4\U0001eca5"
+            "\U0001eca6\U0001eca7\U0001eca8\U0001eca9\U0001ecaa\U0001ecab\U0001ecad"
+            "\U0001ecae\U0001ecaf\U0001ecb1\U0001ecb2\U0001ecb3\U0001ecb4\U0001ed01"
+            "\U0001ed02\U0001ed03\U0001ed04\U0001ed05\U0001ed06\U0001ed07\U0001ed08"
+            "\U0001ed09\U0001ed0a\U0001ed0b\U0001ed0c\U0001ed0d\U0001ed0e\U0001ed0f"
+            "\U0001ed10\U0001ed11\U0001ed12\U0001ed13\U0001ed14\U0001ed15\U0001ed16"
+            "\U0001ed17\U0001ed18\U0001ed19\U0001ed1a\U0001ed1b\U0001ed1c\U0001ed1d"
+            "\U0001ed1e\U0001ed1f\U0001ed20\U0001ed21\U0001ed22\U0001ed23\U0001ed24"
+            "\U0001ed25\U0001ed26\U0001ed27\U0001ed28\U0001ed29\U0001ed2a\U0001ed2b"
+            "\U0001ed2c\U0001ed2d\U0001ed2f\U0001ed30\U0001ed31\U0001ed32\U0001ed33"
+            "\U0001ed34\U0001ed35\U0001ed36\U0001ed37\U0001ed38\U0001ed39\U0001ed3a"
+            "\U0001ed3b\U0001ed3c\U0001ed3d\U0001f100\U0001f101\U0001f102\U0001f103"
+            "\U0001f104\U0001f105\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+            "\U0001f10b\U0001f10c\U00020001\U00020064\U000200e2\U00020121\U0002092a"
+            "\U00020983\U0002098c\U0002099c\U00020aea\U00020afd\U00020b19\U00022390"
+            "\U00022998\U00023b1b\U0002626d\U0002f890"
+        ),
+    ),
+    "15.1.0": (
+        (
+            "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u06f0\u06f1"
+            "\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1\u07c2\u07c3"
+            "\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969\u096a\u096b"
+            "\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb\u09ec\u09ed"
+            "\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f"
+            "\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67"
+            "\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7\u0be8\u0be9"
+            "\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b"
+            "\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb\u0cec\u0ced"
+            "\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f"
+            "\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def\u0e50\u0e51"
+            "\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3"
+            "\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25"
+            "\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045\u1046\u1047"
+            "\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097\u1098\u1099"
+            "\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811"
+            "\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949"
+            "\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5"
+            "\u19d6\u19d7\u19d8\u19d9\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627"
+            "\ua628\ua629\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9"
+            "\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1"
+            "\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3"
+            "\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55"
+            "\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7"
+            "\uabf8\uabf9\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959"
+        ),
+        (
+            "\xb2\xb3\xb9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+            "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u07c0\u07c1"
+            "\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967\u0968\u0969"
+            "\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9\u09ea\u09eb"
+            "\u09ec\u09ed\u09ee\u09ef\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d"
+            "\u0a6e\u0a6f\u0ae6\u0ae7\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef"
+            "\u0b66\u0b67\u0b68\u0b69\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0be6\u0be7"
+            "\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0c66\u0c67\u0c68\u0c69"
+            "\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d66\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d"
+            "\u0d6e\u0d6f\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb\u0dec\u0ded\u0dee\u0def"
+            "\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57\u0e58\u0e59\u0ed0\u0ed1"
+            "\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9\u0f20\u0f21\u0f22\u0f23"
+            "\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u1040\u1041\u1042\u1043\u1044\u1045"
+            "\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095\u1096\u1097"
+            "\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u17e0"
+            "\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8\u17e9\u1810\u1811\u1812"
+            "\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948\u1949\u194a"
+            "\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4\u19d5\u19d6"
+            "\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85\u1a86\u1a87"
+            "\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97\u1a98\u1a99"
+            "\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59\u1bb0\u1bb1"
+            "\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41\u1c42\u1c43"
+            "\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53\u1c54\u1c55"
+            "\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078\u2079\u2080"
+            "\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2460\u2461\u2462"
+            "\u2463\u2464\u2465\u2466\u2467\u2468\u2474\u2475\u2476\u2477\u2478\u2479"
+            "\u247a\u247b\u247c\u2488\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490"
+            "\u24ea\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa\u24fb\u24fc\u24fd\u24ff\u2776"
+            "\u2777\u2778\u2779\u277a\u277b\u277c\u277d\u277e\u2780\u2781\u2782\u2783"
+            "\u2784\u2785\u2786\u2787\u2788\u278a\u278b\u278c\u278d\u278e\u278f\u2790"
+            "\u2791\u2792\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629"
+            "\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8\ua8d9\ua900\ua901"
+            "\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0\ua9d1\ua9d2\ua9d3"
+            "\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2\ua9f3\ua9f4\ua9f5"
+            "\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54\uaa55\uaa56\uaa57"
+            "\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6\uabf7\uabf8\uabf9"
+            "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U000104a0"
+            "\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6\U000104a7"
+            "\U000104a8\U000104a9\U00010a40\U00010a41\U00010a42\U00010a43\U00010d30"
+            "\U00010d31\U00010d32\U00010d33\U00010d34\U00010d35\U00010d36\U00010d37"
+            "\U00010d38\U00010d39\U00010e60\U00010e61\U00010e62\U00010e63\U00010e64"
+            "\U00010e65\U00010e66\U00010e67\U00010e68\U00011052\U00011053\U00011054"
+            "\U00011055\U00011056\U00011057\U00011058\U00011059\U0001105a\U00011066"
+            "\U00011067\U00011068\U00011069\U0001106a\U0001106b\U0001106c\U0001106d"
+            "\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2\U000110f3\U000110f4"
+            "\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9\U00011136\U00011137"
+            "\U00011138\U00011139\U0001113a\U0001113b\U0001113c\U0001113d\U0001113e"
+            "\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3\U000111d4\U000111d5"
+            "\U000111d6\U000111d7\U000111d8\U000111d9\U000112f0\U000112f1\U000112f2"
+            "\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8\U000112f9"
+            "\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455\U00011456"
+            "\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2\U000114d3"
+            "\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9\U00011650"
+            "\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656\U00011657"
+            "\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3\U000116c4"
+            "\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730\U00011731"
+            "\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737\U00011738"
+            "\U00011739\U000118e0\U000118e1\U000118e2\U000118e3\U000118e4\U000118e5"
+            "\U000118e6\U000118e7\U000118e8\U000118e9\U00011c50\U00011c51\U00011c52"
+            "\U00011c53\U00011c54\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59"
+            "\U00011d50\U00011d51\U00011d52\U00011d53\U00011d54\U00011d55\U00011d56"
+            "\U00011d57\U00011d58\U00011d59\U00011da0\U00011da1\U00011da2\U00011da3"
+            "\U00011da4\U00011da5\U00011da6\U00011da7\U00011da8\U00011da9\U00016a60"
+            "\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65\U00016a66\U00016a67"
+            "\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52\U00016b53\U00016b54"
+            "\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e950\U0001e951"
+            "\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956\U0001e957\U0001e958"
+            "\U0001e959\U0001f100\U0001f101\U0001f102\U0001f103\U0001f104\U0001f105"
+            "\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+        ),
+        (
+            "\xb2\xb3\xb9\xbc\xbd\xbe\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+            "\u0668\u0669\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+            "\u07c0\u07c1\u07c2\u07c3\u07c4\u07c5\u07c6\u07c7\u07c8\u07c9\u0966\u0967"
+            "\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u09e6\u09e7\u09e8\u09e9"
+            "\u09ea\u09eb\u09ec\u09ed\u09ee\u09ef\u09f4\u09f5\u09f6\u09f7\u09f8\u09f9"
+            "\u0a66\u0a67\u0a68\u0a69\u0a6a\u0a6b\u0a6c\u0a6d\u0a6e\u0a6f\u0ae6\u0ae7"
+            "\u0ae8\u0ae9\u0aea\u0aeb\u0aec\u0aed\u0aee\u0aef\u0b66\u0b67\u0b68\u0b69"
+            "\u0b6a\u0b6b\u0b6c\u0b6d\u0b6e\u0b6f\u0b72\u0b73\u0b74\u0b75\u0b76\u0b77"
+            "\u0be6\u0be7\u0be8\u0be9\u0bea\u0beb\u0bec\u0bed\u0bee\u0bef\u0bf0\u0bf1"
+            "\u0bf2\u0c66\u0c67\u0c68\u0c69\u0c6a\u0c6b\u0c6c\u0c6d\u0c6e\u0c6f\u0c78"
+            "\u0c79\u0c7a\u0c7b\u0c7c\u0c7d\u0c7e\u0ce6\u0ce7\u0ce8\u0ce9\u0cea\u0ceb"
+            "\u0cec\u0ced\u0cee\u0cef\u0d58\u0d59\u0d5a\u0d5b\u0d5c\u0d5d\u0d5e\u0d66"
+            "\u0d67\u0d68\u0d69\u0d6a\u0d6b\u0d6c\u0d6d\u0d6e\u0d6f\u0d70\u0d71\u0d72"
+            "\u0d73\u0d74\u0d75\u0d76\u0d77\u0d78\u0de6\u0de7\u0de8\u0de9\u0dea\u0deb"
+            "\u0dec\u0ded\u0dee\u0def\u0e50\u0e51\u0e52\u0e53\u0e54\u0e55\u0e56\u0e57"
+            "\u0e58\u0e59\u0ed0\u0ed1\u0ed2\u0ed3\u0ed4\u0ed5\u0ed6\u0ed7\u0ed8\u0ed9"
+            "\u0f20\u0f21\u0f22\u0f23\u0f24\u0f25\u0f26\u0f27\u0f28\u0f29\u0f2a\u0f2b"
+            "\u0f2c\u0f2d\u0f2e\u0f2f\u0f30\u0f31\u0f32\u0f33\u1040\u1041\u1042\u1043"
+            "\u1044\u1045\u1046\u1047\u1048\u1049\u1090\u1091\u1092\u1093\u1094\u1095"
+            "\u1096\u1097\u1098\u1099\u1369\u136a\u136b\u136c\u136d\u136e\u136f\u1370"
+            "\u1371\u1372\u1373\u1374\u1375\u1376\u1377\u1378\u1379\u137a\u137b\u137c"
+            "\u16ee\u16ef\u16f0\u17e0\u17e1\u17e2\u17e3\u17e4\u17e5\u17e6\u17e7\u17e8"
+            "\u17e9\u17f0\u17f1\u17f2\u17f3\u17f4\u17f5\u17f6\u17f7\u17f8\u17f9\u1810"
+            "\u1811\u1812\u1813\u1814\u1815\u1816\u1817\u1818\u1819\u1946\u1947\u1948"
+            "\u1949\u194a\u194b\u194c\u194d\u194e\u194f\u19d0\u19d1\u19d2\u19d3\u19d4"
+            "\u19d5\u19d6\u19d7\u19d8\u19d9\u19da\u1a80\u1a81\u1a82\u1a83\u1a84\u1a85"
+            "\u1a86\u1a87\u1a88\u1a89\u1a90\u1a91\u1a92\u1a93\u1a94\u1a95\u1a96\u1a97"
+            "\u1a98\u1a99\u1b50\u1b51\u1b52\u1b53\u1b54\u1b55\u1b56\u1b57\u1b58\u1b59"
+            "\u1bb0\u1bb1\u1bb2\u1bb3\u1bb4\u1bb5\u1bb6\u1bb7\u1bb8\u1bb9\u1c40\u1c41"
+            "\u1c42\u1c43\u1c44\u1c45\u1c46\u1c47\u1c48\u1c49\u1c50\u1c51\u1c52\u1c53"
+            "\u1c54\u1c55\u1c56\u1c57\u1c58\u1c59\u2070\u2074\u2075\u2076\u2077\u2078"
+            "\u2079\u2080\u2081\u2082\u2083\u2084\u2085\u2086\u2087\u2088\u2089\u2150"
+            "\u2151\u2152\u2153\u2154\u2155\u2156\u2157\u2158\u2159\u215a\u215b\u215c"
+            "\u215d\u215e\u215f\u2160\u2161\u2162\u2163\u2164\u2165\u2166\u2167\u2168"
+            "\u2169\u216a\u216b\u216c\u216d\u216e\u216f\u2170\u2171\u2172\u2173\u2174"
+            "\u2175\u2176\u2177\u2178\u2179\u217a\u217b\u217c\u217d\u217e\u217f\u2180"
+            "\u2181\u2182\u2185\u2186\u2187\u2188\u2189\u2460\u2461\u2462\u2463\u2464"
+            "\u2465\u2466\u2467\u2468\u2469\u246a\u246b\u246c\u246d\u246e\u246f\u2470"
+            "\u2471\u2472\u2473\u2474\u2475\u2476\u2477\u2478\u2479\u247a\u247b\u247c"
+            "\u247d\u247e\u247f\u2480\u2481\u2482\u2483\u2484\u2485\u2486\u2487\u2488"
+            "\u2489\u248a\u248b\u248c\u248d\u248e\u248f\u2490\u2491\u2492\u2493\u2494"
+            "\u2495\u2496\u2497\u2498\u2499\u249a\u249b\u24ea\u24eb\u24ec\u24ed\u24ee"
+            "\u24ef\u24f0\u24f1\u24f2\u24f3\u24f4\u24f5\u24f6\u24f7\u24f8\u24f9\u24fa"
+            "\u24fb\u24fc\u24fd\u24fe\u24ff\u2776\u2777\u2778\u2779\u277a\u277b\u277c"
+            "\u277d\u277e\u277f\u2780\u2781\u2782\u2783\u2784\u2785\u2786\u2787\u2788"
+            "\u2789\u278a\u278b\u278c\u278d\u278e\u278f\u2790\u2791\u2792\u2793\u2cfd"
+            "\u3007\u3021\u3022\u3023\u3024\u3025\u3026\u3027\u3028\u3029\u3038\u3039"
+            "\u303a\u3192\u3193\u3194\u3195\u3220\u3221\u3222\u3223\u3224\u3225\u3226"
+            "\u3227\u3228\u3229\u3248\u3249\u324a\u324b\u324c\u324d\u324e\u324f\u3251"
+            "\u3252\u3253\u3254\u3255\u3256\u3257\u3258\u3259\u325a\u325b\u325c\u325d"
+            "\u325e\u325f\u3280\u3281\u3282\u3283\u3284\u3285\u3286\u3287\u3288\u3289"
+            "\u32b1\u32b2\u32b3\u32b4\u32b5\u32b6\u32b7\u32b8\u32b9\u32ba\u32bb\u32bc"
+            "\u32bd\u32be\u32bf\u3405\u3483\u382a\u3b4d\u4e00\u4e03\u4e07\u4e09\u4e5d"
+            "\u4e8c\u4e94\u4e96\u4ebf\u4ec0\u4edf\u4ee8\u4f0d\u4f70\u5104\u5146\u5169"
+            "\u516b\u516d\u5341\u5343\u5344\u5345\u534c\u53c1\u53c2\u53c3\u53c4\u56db"
+            "\u58f1\u58f9\u5e7a\u5efe\u5eff\u5f0c\u5f0d\u5f0e\u5f10\u62fe\u634c\u67d2"
+            "\u6f06\u7396\u767e\u8086\u842c\u8cae\u8cb3\u8d30\u9621\u9646\u964c\u9678"
+            "\u96f6\ua620\ua621\ua622\ua623\ua624\ua625\ua626\ua627\ua628\ua629\ua6e6"
+            "\ua6e7\ua6e8\ua6e9\ua6ea\ua6eb\ua6ec\ua6ed\ua6ee\ua6ef\ua830\ua831\ua832"
+            "\ua833\ua834\ua835\ua8d0\ua8d1\ua8d2\ua8d3\ua8d4\ua8d5\ua8d6\ua8d7\ua8d8"
+            "\ua8d9\ua900\ua901\ua902\ua903\ua904\ua905\ua906\ua907\ua908\ua909\ua9d0"
+            "\ua9d1\ua9d2\ua9d3\ua9d4\ua9d5\ua9d6\ua9d7\ua9d8\ua9d9\ua9f0\ua9f1\ua9f2"
+            "\ua9f3\ua9f4\ua9f5\ua9f6\ua9f7\ua9f8\ua9f9\uaa50\uaa51\uaa52\uaa53\uaa54"
+            "\uaa55\uaa56\uaa57\uaa58\uaa59\uabf0\uabf1\uabf2\uabf3\uabf4\uabf5\uabf6"
+            "\uabf7\uabf8\uabf9\uf96b\uf973\uf978\uf9b2\uf9d1\uf9d3\uf9fd\uff10\uff11"
+            "\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\U00010107\U00010108"
+            "\U00010109\U0001010a\U0001010b\U0001010c\U0001010d\U0001010e\U0001010f"
+            "\U00010110\U00010111\U00010112\U00010113\U00010114\U00010115\U00010116"
+            "\U00010117\U00010118\U00010119\U0001011a\U0001011b\U0001011c\U0001011d"
+            "\U0001011e\U0001011f\U00010120\U00010121\U00010122\U00010123\U00010124"
+            "\U00010125\U00010126\U00010127\U00010128\U00010129\U0001012a\U0001012b"
+            "\U0001012c\U0001012d\U0001012e\U0001012f\U00010130\U00010131\U00010132"
+            "\U00010133\U00010140\U00010141\U00010142\U00010143\U00010144\U00010145"
+            "\U00010146\U00010147\U00010148\U00010149\U0001014a\U0001014b\U0001014c"
+            "\U0001014d\U0001014e\U0001014f\U00010150\U00010151\U00010152\U00010153"
+            "\U00010154\U00010155\U00010156\U00010157\U00010158\U00010159\U0001015a"
+            "\U0001015b\U0001015c\U0001015d\U0001015e\U0001015f\U00010160\U00010161"
+            "\U00010162\U00010163\U00010164\U00010165\U00010166\U00010167\U00010168"
+            "\U00010169\U0001016a\U0001016b\U0001016c\U0001016d\U0001016e\U0001016f"
+            "\U00010170\U00010171\U00010172\U00010173\U00010174\U00010175\U00010176"
+            "\U00010177\U00010178\U0001018a\U0001018b\U000102e1\U000102e2\U000102e3"
+            "\U000102e4\U000102e5\U000102e6\U000102e7\U000102e8\U000102e9\U000102ea"
+            "\U000102eb\U000102ec\U000102ed\U000102ee\U000102ef\U000102f0\U000102f1"
+            "\U000102f2\U000102f3\U000102f4\U000102f5\U000102f6\U000102f7\U000102f8"
+            "\U000102f9\U000102fa\U000102fb\U00010320\U00010321\U00010322\U00010323"
+            "\U00010341\U0001034a\U000103d1\U000103d2\U000103d3\U000103d4\U000103d5"
+            "\U000104a0\U000104a1\U000104a2\U000104a3\U000104a4\U000104a5\U000104a6"
+            "\U000104a7\U000104a8\U000104a9\U00010858\U00010859\U0001085a\U0001085b"
+            "\U0001085c\U0001085d\U0001085e\U0001085f\U00010879\U0001087a\U0001087b"
+            "\U0001087c\U0001087d\U0001087e\U0001087f\U000108a7\U000108a8\U000108a9"
+            "\U000108aa\U000108ab\U000108ac\U000108ad\U000108ae\U000108af\U000108fb"
+            "\U000108fc\U000108fd\U000108fe\U000108ff\U00010916\U00010917\U00010918"
+            "\U00010919\U0001091a\U0001091b\U000109bc\U000109bd\U000109c0\U000109c1"
+            "\U000109c2\U000109c3\U000109c4\U000109c5\U000109c6\U000109c7\U000109c8"
+            "\U000109c9\U000109ca\U000109cb\U000109cc\U000109cd\U000109ce\U000109cf"
+            "\U000109d2\U000109d3\U000109d4\U000109d5\U000109d6\U000109d7\U000109d8"
+            "\U000109d9\U000109da\U000109db\U000109dc\U000109dd\U000109de\U000109df"
+            "\U000109e0\U000109e1\U000109e2\U000109e3\U000109e4\U000109e5\U000109e6"
+            "\U000109e7\U000109e8\U000109e9\U000109ea\U000109eb\U000109ec\U000109ed"
+            "\U000109ee\U000109ef\U000109f0\U000109f1\U000109f2\U000109f3\U000109f4"
+            "\U000109f5\U000109f6\U000109f7\U000109f8\U000109f9\U000109fa\U000109fb"
+            "\U000109fc\U000109fd\U000109fe\U000109ff\U00010a40\U00010a41\U00010a42"
+            "\U00010a43\U00010a44\U00010a45\U00010a46\U00010a47\U00010a48\U00010a7d"
+            "\U00010a7e\U00010a9d\U00010a9e\U00010a9f\U00010aeb\U00010aec\U00010aed"
+            "\U00010aee\U00010aef\U00010b58\U00010b59\U00010b5a\U00010b5b\U00010b5c"
+            "\U00010b5d\U00010b5e\U00010b5f\U00010b78\U00010b79\U00010b7a\U00010b7b"
+            "\U00010b7c\U00010b7d\U00010b7e\U00010b7f\U00010ba9\U00010baa\U00010bab"
+            "\U00010bac\U00010bad\U00010bae\U00010baf\U00010cfa\U00010cfb\U00010cfc"
+            "\U00010cfd\U00010cfe\U00010cff\U00010d30\U00010d31\U00010d32\U00010d33"
+            "\U00010d34\U00010d35\U00010d36\U00010d37\U00010d38\U00010d39\U00010e60"
+            "\U00010e61\U00010e62\U00010e63\U00010e64\U00010e65\U00010e66\U00010e67"
+            "\U00010e68\U00010e69\U00010e6a\U00010e6b\U00010e6c\U00010e6d\U00010e6e"
+            "\U00010e6f\U00010e70\U00010e71\U00010e72\U00010e73\U00010e74\U00010e75"
+            "\U00010e76\U00010e77\U00010e78\U00010e79\U00010e7a\U00010e7b\U00010e7c"
+            "\U00010e7d\U00010e7e\U00010f1d\U00010f1e\U00010f1f\U00010f20\U00010f21"
+            "\U00010f22\U00010f23\U00010f24\U00010f25\U00010f26\U00010f51\U00010f52"
+            "\U00010f53\U00010f54\U00011052\U00011053\U00011054\U00011055\U00011056"
+            "\U00011057\U00011058\U00011059\U0001105a\U0001105b\U0001105c\U0001105d"
+            "\U0001105e\U0001105f\U00011060\U00011061\U00011062\U00011063\U00011064"
+            "\U00011065\U00011066\U00011067\U00011068\U00011069\U0001106a\U0001106b"
+            "\U0001106c\U0001106d\U0001106e\U0001106f\U000110f0\U000110f1\U000110f2"
+            "\U000110f3\U000110f4\U000110f5\U000110f6\U000110f7\U000110f8\U000110f9"
+            "\U00011136\U00011137\U00011138\U00011139\U0001113a\U0001113b\U0001113c"
+            "\U0001113d\U0001113e\U0001113f\U000111d0\U000111d1\U000111d2\U000111d3"
+            "\U000111d4\U000111d5\U000111d6\U000111d7\U000111d8\U000111d9\U000111e1"
+            "\U000111e2\U000111e3\U000111e4\U000111e5\U000111e6\U000111e7\U000111e8"
+            "\U000111e9\U000111ea\U000111eb\U000111ec\U000111ed\U000111ee\U000111ef"
+            "\U000111f0\U000111f1\U000111f2\U000111f3\U000111f4\U000112f0\U000112f1"
+            "\U000112f2\U000112f3\U000112f4\U000112f5\U000112f6\U000112f7\U000112f8"
+            "\U000112f9\U00011450\U00011451\U00011452\U00011453\U00011454\U00011455"
+            "\U00011456\U00011457\U00011458\U00011459\U000114d0\U000114d1\U000114d2"
+            "\U000114d3\U000114d4\U000114d5\U000114d6\U000114d7\U000114d8\U000114d9"
+            "\U00011650\U00011651\U00011652\U00011653\U00011654\U00011655\U00011656"
+            "\U00011657\U00011658\U00011659\U000116c0\U000116c1\U000116c2\U000116c3"
+            "\U000116c4\U000116c5\U000116c6\U000116c7\U000116c8\U000116c9\U00011730"
+            "\U00011731\U00011732\U00011733\U00011734\U00011735\U00011736\U00011737"
+            "\U00011738\U00011739\U0001173a\U0001173b\U000118e0\U000118e1\U000118e2"
+            "\U000118e3\U000118e4\U000118e5\U000118e6\U000118e7\U000118e8\U000118e9"
+            "\U000118ea\U000118eb\U000118ec\U000118ed\U000118ee\U000118ef\U000118f0"
+            "\U000118f1\U000118f2\U00011c50\U00011c51\U00011c52\U00011c53\U00011c54"
+            "\U00011c55\U00011c56\U00011c57\U00011c58\U00011c59\U00011c5a\U00011c5b"
+            "\U00011c5c\U00011c5d\U00011c5e\U00011c5f\U00011c60\U00011c61\U00011c62"
+            "\U00011c63\U00011c64\U00011c65\U00011c66\U00011c67\U00011c68\U00011c69"
+            "\U00011c6a\U00011c6b\U00011c6c\U00011d50\U00011d51\U00011d52\U00011d53"
+            "\U00011d54\U00011d55\U00011d56\U00011d57\U00011d58\U00011d59\U00011da0"
+            "\U00011da1\U00011da2\U00011da3\U00011da4\U00011da5\U00011da6\U00011da7"
+            "\U00011da8\U00011da9\U00011fc0\U00011fc1\U00011fc2\U00011fc3\U00011fc4"
+            "\U00011fc5\U00011fc6\U00011fc7\U00011fc8\U00011fc9\U00011fca\U00011fcb"
+            "\U00011fcc\U00011fcd\U00011fce\U00011fcf\U00011fd0\U00011fd1\U00011fd2"
+            "\U00011fd3\U00011fd4\U00012400\U00012401\U00012402\U00012403\U00012404"
+            "\U00012405\U00012406\U00012407\U00012408\U00012409\U0001240a\U0001240b"
+            "\U0001240c\U0001240d\U0001240e\U0001240f\U00012410\U00012411\U00012412"
+            "\U00012413\U00012414\U00012415\U00012416\U00012417\U00012418\U00012419"
+            "\U0001241a\U0001241b\U0001241c\U0001241d\U0001241e\U0001241f\U00012420"
+            "\U00012421\U00012422\U00012423\U00012424\U00012425\U00012426\U00012427"
+            "\U00012428\U00012429\U0001242a\U0001242b\U0001242c\U0001242d\U0001242e"
+            "\U0001242f\U00012430\U00012431\U00012432\U00012433\U00012434\U00012435"
+            "\U00012436\U00012437\U00012438\U00012439\U0001243a\U0001243b\U0001243c"
+            "\U0001243d\U0001243e\U0001243f\U00012440\U00012441\U00012442\U00012443"
+            "\U00012444\U00012445\U00012446\U00012447\U00012448\U00012449\U0001244a"
+            "\U0001244b\U0001244c\U0001244d\U0001244e\U0001244f\U00012450\U00012451"
+            "\U00012452\U00012453\U00012454\U00012455\U00012456\U00012457\U00012458"
+            "\U00012459\U0001245a\U0001245b\U0001245c\U0001245d\U0001245e\U0001245f"
+            "\U00012460\U00012461\U00012462\U00012463\U00012464\U00012465\U00012466"
+            "\U00012467\U00012468\U00012469\U0001246a\U0001246b\U0001246c\U0001246d"
+            "\U0001246e\U00016a60\U00016a61\U00016a62\U00016a63\U00016a64\U00016a65"
+            "\U00016a66\U00016a67\U00016a68\U00016a69\U00016b50\U00016b51\U00016b52"
+            "\U00016b53\U00016b54\U00016b55\U00016b56\U00016b57\U00016b58\U00016b59"
+            "\U00016b5b\U00016b5c\U00016b5d\U00016b5e\U00016b5f\U00016b60\U00016b61"
+            "\U00016e80\U00016e81\U00016e82\U00016e83\U00016e84\U00016e85\U00016e86"
+            "\U00016e87\U00016e88\U00016e89\U00016e8a\U00016e8b\U00016e8c\U00016e8d"
+            "\U00016e8e\U00016e8f\U00016e90\U00016e91\U00016e92\U00016e93\U00016e94"
+            "\U00016e95\U00016e96\U0001d2e0\U0001d2e1\U0001d2e2\U0001d2e3\U0001d2e4"
+            "\U0001d2e5\U0001d2e6\U0001d2e7\U0001d2e8\U0001d2e9\U0001d2ea\U0001d2eb"
+            "\U0001d2ec\U0001d2ed\U0001d2ee\U0001d2ef\U0001d2f0\U0001d2f1\U0001d2f2"
+            "\U0001d2f3\U0001d360\U0001d361\U0001d362\U0001d363\U0001d364\U0001d365"
+            "\U0001d366\U0001d367\U0001d368\U0001d369\U0001d36a\U0001d36b\U0001d36c"
+            "\U0001d36d\U0001d36e\U0001d36f\U0001d370\U0001d371\U0001d372\U0001d373"
+            "\U0001d374\U0001d375\U0001d376\U0001d377\U0001d378\U0001d7ce\U0001d7cf"
+            "\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6"
+            "\U0001d7d7\U0001d7d8\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd"
+            "\U0001d7de\U0001d7df\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4"
+            "\U0001d7e5\U0001d7e6\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb"
+            "\U0001d7ec\U0001d7ed\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2"
+            "\U0001d7f3\U0001d7f4\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9"
+            "\U0001d7fa\U0001d7fb\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e140"
+            "\U0001e141\U0001e142\U0001e143\U0001e144\U0001e145\U0001e146\U0001e147"
+            "\U0001e148\U0001e149\U0001e2f0\U0001e2f1\U0001e2f2\U0001e2f3\U0001e2f4"
+            "\U0001e2f5\U0001e2f6\U0001e2f7\U0001e2f8\U0001e2f9\U0001e8c7\U0001e8c8"
+            "\U0001e8c9\U0001e8ca\U0001e8cb\U0001e8cc\U0001e8cd\U0001e8ce\U0001e8cf"
+            "\U0001e950\U0001e951\U0001e952\U0001e953\U0001e954\U0001e955\U0001e956"
+            "\U0001e957\U0001e958\U0001e959\U0001ec71\U0001ec72\U0001ec73\U0001ec74"
+            "\U0001ec75\U0001ec76\U0001ec77\U0001ec78\U0001ec79\U0001ec7a\U0001ec7b"
+            "\U0001ec7c\U0001ec7d\U0001ec7e\U0001ec7f\U0001ec80\U0001ec81\U0001ec82"
+            "\U0001ec83\U0001ec84\U0001ec85\U0001ec86\U0001ec87\U0001ec88\U0001ec89"
+            "\U0001ec8a\U0001ec8b\U0001ec8c\U0001ec8d\U0001ec8e\U0001ec8f\U0001ec90"
+            "\U0001ec91\U0001ec92\U0001ec93\U0001ec94\U0001ec95\U0001ec96\U0001ec97"
+            "\U0001ec98\U0001ec99\U0001ec9a\U0001ec9b\U0001ec9c\U0001ec9d\U0001ec9e"
+            "\U0001ec9f\U0001eca0\U0001eca1\U0001eca2\U0001eca3\U0001eca4\U0001eca5"
+            "\U0001eca6\U0001eca7\U0001eca8\U0001eca9\U0001ecaa\U0001ecab\U0001ecad"
+            "\U0001ecae\U0001ecaf\U0001ecb1\U0001ecb2\U0001ecb3\U0001ecb4\U0001ed01"
+            "\U0001ed02\U0001ed03\U0001ed04\U0001ed05\U0001ed06\U0001ed07\U0001ed08"
+            "\U0001ed09\U0001ed0a\U0001ed0b\U0001ed0c\U0001ed0d\U0001ed0e\U0001ed0f"
+            "\U0001ed10\U0001ed11\U0001ed12\U0001ed13\U0001ed14\U0001ed15\U0001ed16"
+            "\U0001ed17\U0001ed18\U0001ed19\U0001ed1a\U0001ed1b\U0001ed1c\U0001ed1d"
+            "\U0001ed1e\U0001ed1f\U0001ed20\U0001ed21\U0001ed22\U0001ed23\U0001ed24"
+            "\U0001ed25\U0001ed26\U0001ed27\U0001ed28\U0001ed29\U0001ed2a\U0001ed2b"
+            "\U0001ed2c\U0001ed2d\U0001ed2f\U0001ed30\U0001ed31\U0001ed32\U0001ed33"
+            "\U0001ed34\U0001ed35\U0001ed36\U0001ed37\U0001ed38\U0001ed39\U0001ed3a"
+            "\U0001ed3b\U0001ed3c\U0001ed3d\U0001f100\U0001f101\U0001f102\U0001f103"
+            "\U0001f104\U0001f105\U0001f106\U0001f107\U0001f108\U0001f109\U0001f10a"
+            "\U0001f10b\U0001f10c\U00020001\U00020064\U000200e2\U00020121\U0002092a"
+            "\U00020983\U0002098c\U0002099c\U00020aea\U00020afd\U00020b19\U00022390"
+            "\U00022998\U00023b1b\U0002626d\U0002f890"
+        ),
+    ),
+}
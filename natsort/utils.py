@@ -39,11 +39,14 @@ and thus has a slightly improved performance at runtime.
 
 """
 
+import heapq
+import random
 import re
-from functools import partial, reduce
+from collections import namedtuple
+from functools import lru_cache, partial, reduce
 from itertools import chain as ichain
 from operator import methodcaller
-from pathlib import PurePath
+from pathlib import PurePath, PurePosixPath
 from unicodedata import normalize
 
 from natsort.compat.fastnumbers import fast_float, fast_int
@@ -59,6 +62,8 @@ class NumericalRegularExpressions:
     The numbers also account for unicode non-decimal characters.
 
     Not intended to be made an instance - use class methods only.
+    Each regular expression is compiled only once, the first time
+    it is requested.
     """
 
     # All unicode numeric characters (minus the decimal characters).
@@ -71,6 +76,7 @@ class NumericalRegularExpressions:
     float_num = r"(?:\d+\.?\d*|\.\d+)"
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _construct_regex(cls, fmt):
         """Given a format string, construct the regex with class attributes."""
         return re.compile(fmt.format(**vars(cls)), flags=re.U)
@@ -106,7 +112,28 @@ class NumericalRegularExpressions:
         return cls._construct_regex(r"({float_num}|[{numeric}])")
 
 
-def regex_chooser(alg):
+class AsciiNumericalRegularExpressions(NumericalRegularExpressions):
+    """
+    Container of regular expressions that match ASCII numbers.
+
+    On ASCII input these split identically to the corresponding regular
+    expressions of NumericalRegularExpressions, but are much faster
+    because characters are not checked against all the unicode numbers.
+
+    Not intended to be made an instance - use class methods only.
+    """
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _construct_regex(cls, fmt):
+        """Given a format string, construct the ASCII-only regex."""
+        # Remove the alternative that matches a single unicode number.
+        fmt = fmt.replace("|[{digits}]", "").replace("|[{numeric}]", "")
+        fmt = fmt.format(**vars(NumericalRegularExpressions))
+        return re.compile(fmt, flags=re.ASCII)
+
+
+def regex_chooser(alg, ascii_only=False):
     """
     Select an appropriate regex for the type of number of interest.
 
@@ -114,6 +141,9 @@ def regex_chooser(alg):
     ----------
     alg : ns enum
         Used to indicate the regular expression to select.
+    ascii_only : bool, optional
+        If `True`, return a regular expression that only works on ASCII
+        input. The default is `False`.
 
     Returns
     -------
@@ -126,14 +156,20 @@ def regex_chooser(alg):
     else:
         alg &= ns.INT | ns.SIGNED
 
+    if ascii_only:
+        regexes = AsciiNumericalRegularExpressions
+    else:
+        regexes = NumericalRegularExpressions
+
+    # Only the selected regular expression is constructed.
     return {
-        ns.INT: NumericalRegularExpressions.int_nosign(),
-        ns.FLOAT: NumericalRegularExpressions.float_nosign_exp(),
-        ns.INT | ns.SIGNED: NumericalRegularExpressions.int_sign(),
-        ns.FLOAT | ns.SIGNED: NumericalRegularExpressions.float_sign_exp(),
-        ns.FLOAT | ns.NOEXP: NumericalRegularExpressions.float_nosign_noexp(),
-        ns.FLOAT | ns.SIGNED | ns.NOEXP: NumericalRegularExpressions.float_sign_noexp(),
-    }[alg]
+        ns.INT: regexes.int_nosign,
+        ns.FLOAT: regexes.float_nosign_exp,
+        ns.INT | ns.SIGNED: regexes.int_sign,
+        ns.FLOAT | ns.SIGNED: regexes.float_sign_exp,
+        ns.FLOAT | ns.NOEXP: regexes.float_nosign_noexp,
+        ns.FLOAT | ns.SIGNED | ns.NOEXP: regexes.float_sign_noexp,
+    }[alg]()
 
 
 def _no_op(x):
@@ -141,6 +177,17 @@ def _no_op(x):
     return x
 
 
+try:
+    _is_ascii = str.isascii
+except AttributeError:  # pragma: no cover
+
+    def _is_ascii(x):
+        """Python < 3.7 lacks str.isascii, so never assume ASCII input."""
+        if not isinstance(x, str):
+            raise TypeError("not a str")
+        return False
+
+
 def _normalize_input_factory(alg):
     """
     Create a function that will normalize unicode input data.
@@ -161,7 +208,7 @@ def _normalize_input_factory(alg):
     return partial(normalize, normalization_form)
 
 
-def natsort_key(val, key, string_func, bytes_func, num_func):
+def natsort_key(val, key, string_func, bytes_func, num_func):  # noqa: C901
     """
     Key to sort strings and numbers naturally.
 
@@ -208,7 +255,24 @@ def natsort_key(val, key, string_func, bytes_func, num_func):
     if key is not None:
         val = key(val)
 
-    # Assume the input are strings, which is the most common case
+    # Dispatch on the exact type of the most common inputs, so that they
+    # need not raise and catch exceptions to find the right function.
+    # Since we are looking for exact types, 'type' is used instead of
+    # 'isinstance'; subclasses take the slower path below.
+    val_type = type(val)
+    if val_type is str:
+        return string_func(val)
+    elif val_type is int or val_type is float:
+        return num_func(val)
+    elif val_type is bytes:
+        return bytes_func(val)
+    elif val_type is tuple or val_type is list:
+        # Parse recursively. Do not apply the key recursively.
+        return tuple(
+            natsort_key(x, None, string_func, bytes_func, num_func) for x in val
+        )
+
+    # For any other type, assume the input is string-like.
     try:
         return string_func(val)
     except (TypeError, AttributeError):
@@ -229,6 +293,299 @@ def natsort_key(val, key, string_func, bytes_func, num_func):
             return num_func(val)
 
 
+# Digit strings longer than this are not given special treatment, since
+# Python may refuse to convert them to int (see sys.set_int_max_str_digits).
+_MAX_FAST_DIGITS = 640
+
+
+def homogeneous_input_key(seq, alg, _is_ascii=_is_ascii):
+    """
+    Create a simple key for input whose natural order is its numeric order.
+
+    If every element of *seq* is exactly an *int* or *float*, or every
+    element is a *str* consisting only of ASCII digits, then natural
+    sorting is the same as sorting by the numeric value (with NaN
+    replaced according to ``ns.NANLAST``). In that case there is no
+    need to build the full key tuples.
+
+    Parameters
+    ----------
+    seq : sequence
+        The input that will be sorted. It is scanned in full.
+    alg : ns enum
+        The algorithm that will be used to sort *seq*.
+
+    Returns
+    -------
+    func : callable or None
+        A key that sorts *seq* exactly as the natsort key for *alg*
+        would, or `None` if *seq* is not homogeneous.
+
+    """
+    types = set(map(type, seq))
+    if types <= {int, float}:
+        nan_replace = float("+inf") if alg & ns.NANLAST else float("-inf")
+
+        def func(x, _nan_replace=nan_replace):
+            return _nan_replace if x != x else x
+
+        return func
+    elif types == {str} and all(
+        x.isdigit() and _is_ascii(x) and len(x) <= _MAX_FAST_DIGITS for x in seq
+    ):
+        # Large ints would lose precision as floats, so convert the same
+        # way as the natsort key would.
+        return float if alg & ns.FLOAT else int
+    else:
+        return None
+
+
+def dense_ranks(seq, natkey):
+    """
+    Rank each element of a sequence by the order of its natsort key.
+
+    Equal elements of the same type are grouped by hashing, so
+    *natkey* is called and the keys are sorted only once for each
+    distinct element. Equal elements must have equal keys, so a
+    user-given key should be applied to *seq* beforehand rather than
+    be part of *natkey*.
+
+    Parameters
+    ----------
+    seq : sequence
+        The elements to rank. If any element is not hashable, each
+        element is treated as distinct.
+    natkey : callable
+        The key that defines the order of the elements.
+
+    Returns
+    -------
+    ranks : list of int
+        The rank of each element in *seq*: 0 for the elements with the
+        smallest key, 1 for those with the next smallest, and so on.
+        Elements whose keys compare equal have the same rank.
+
+    """
+    # Record each distinct element as its code is assigned, rather than
+    # reading them back from the dict, whose order is arbitrary before
+    # Python 3.6.
+    codes, uniques, element_codes = {}, [], []
+    try:
+        for x in seq:
+            code = codes.setdefault((type(x), x), len(uniques))
+            if code == len(uniques):
+                uniques.append(x)
+            element_codes.append(code)
+    except TypeError:
+        # Some element is not hashable.
+        uniques, element_codes = seq, range(len(seq))
+
+    keys = list(map(natkey, uniques))
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+
+    # Dense rank in sorted order, starting a new rank whenever a key is
+    # greater than the one before, as the sort itself compares them.
+    unique_ranks = [0] * len(keys)
+    rank = 0
+    for previous, current in zip(order, order[1:]):
+        if keys[previous] < keys[current]:
+            rank += 1
+        unique_ranks[current] = rank
+    return [unique_ranks[x] for x in element_codes]
+
+
+def argsort_ranks(ranks, reverse=False):
+    """
+    Return the indexes that stably sort a list of dense ranks.
+
+    This is a counting sort, so it takes linear time.
+
+    Parameters
+    ----------
+    ranks : list of int
+        Dense ranks starting at 0, as returned by :func:`dense_ranks`.
+    reverse : bool, optional
+        Order from the largest rank to the smallest, with equal ranks
+        still in their original order, as `list.sort` does.
+
+    Returns
+    -------
+    indexes : list of int
+
+    """
+    buckets = [[] for _ in range(max(ranks, default=-1) + 1)]
+    for i, rank in enumerate(ranks):
+        buckets[rank].append(i)
+    if reverse:
+        buckets.reverse()
+    return list(ichain.from_iterable(buckets))
+
+
+# Inputs at most this long are fully sorted by select_order.
+_SELECT_SORT_SIZE = 1024
+
+
+def _quickselect(keys, indexes, start, stop, reverse):
+    """Return *indexes* from *start* to *stop* in their stable sorted order."""
+    getkey = keys.__getitem__
+    if len(indexes) <= _SELECT_SORT_SIZE or 2 * (stop - start) >= len(indexes):
+        indexes = sorted(indexes, key=getkey, reverse=reverse)
+        return indexes[start:stop]
+
+    # Partition around the median of a sample. Each part keeps its indexes
+    # in their original order, so equal keys stay in that order.
+    pivot = sorted(map(getkey, random.sample(indexes, 31)))[15]
+    lower = [i for i in indexes if keys[i] < pivot]
+    higher = [i for i in indexes if pivot < keys[i]]
+    n_equal = len(indexes) - len(lower) - len(higher)
+    parts = [higher, None, lower] if reverse else [lower, None, higher]
+
+    out, position = [], 0
+    for part in parts:
+        size = n_equal if part is None else len(part)
+        if position < stop and start < position + size:
+            part_start, part_stop = max(start - position, 0), stop - position
+            if part is None:
+                equal = [i for i in indexes if not (keys[i] < pivot or pivot < keys[i])]
+                out.extend(equal[part_start:part_stop])
+            else:
+                out.extend(_quickselect(keys, part, part_start, part_stop, reverse))
+        position += size
+    return out
+
+
+def select_order(keys, start=0, stop=None, reverse=False):
+    """
+    Return a slice of the indexes that stably sort a list of keys.
+
+    The result is the same as
+    ``sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)[start:stop]``,
+    but only the requested positions are put in order.
+
+    Parameters
+    ----------
+    keys : list
+        The keys to order.
+    start : int, optional
+        The first sorted position to return.
+    stop : int, optional
+        The sorted position to stop before. The default of `None`
+        stops at the end.
+    reverse : bool, optional
+        Order from the largest key to the smallest, with equal keys
+        still in their original order, as `list.sort` does.
+
+    Returns
+    -------
+    indexes : list of int
+
+    Notes
+    -----
+    A page near the start (ending within the first 1% of the positions)
+    is selected with a heap of its size. Otherwise the keys are
+    partitioned as in quickselect, and only the parts that overlap the
+    page are partitioned further, until they are small enough to sort.
+
+    """
+    n = len(keys)
+    stop = n if stop is None else min(stop, n)
+    if start >= stop:
+        return []
+    if stop <= n // 100:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(stop, range(n), key=keys.__getitem__)[start:]
+    return _quickselect(keys, list(range(n)), start, stop, reverse)
+
+
+# Mirrors the fields of the statistics from functools.lru_cache.
+KeyCacheInfo = namedtuple("KeyCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def key_cache_factory(natkey, cache):
+    """
+    Create a function that remembers the keys of the values it has seen.
+
+    Parameters
+    ----------
+    natkey : callable
+        The key whose results are to be cached.
+    cache : bool, int, or mapping
+        If `True`, cache every key; if an *int*, cache the most recently
+        used *cache* keys. Otherwise, *cache* is a mutable mapping from
+        ``(type(value), value)`` to keys that is used as the cache, and
+        can be shared between keys with the same *key* and *alg*.
+
+    Returns
+    -------
+    func : callable
+        A function that returns the same as *natkey*, with equal values
+        of the same type sharing a single key. Values that are not
+        hashable are not cached. The function has ``cache_info()`` and
+        ``cache_clear()`` methods, like one decorated with
+        `functools.lru_cache`.
+
+    Raises
+    ------
+    TypeError
+        *cache* is not a `bool`, an `int`, or a mapping.
+    ValueError
+        *cache* is a negative `int`.
+
+    """
+    if isinstance(cache, int):
+        if cache < 0:
+            raise ValueError("'cache' must be non-negative, got {}".format(cache))
+        maxsize = None if cache is True else cache
+        cached = lru_cache(maxsize=maxsize, typed=True)(natkey)
+    elif hasattr(cache, "__getitem__") and hasattr(cache, "__setitem__"):
+        cached = _mapping_cache_factory(natkey, cache)
+    else:
+        msg = "'cache' must be a bool, an int, or a mapping, got {}"
+        raise TypeError(msg.format(type(cache).__name__))
+
+    def func(val, _cached=cached, _natkey=natkey):
+        # Check hashability first, so that a TypeError raised by the
+        # key itself is not mistaken for it and the key called twice.
+        try:
+            hash(val)
+        except TypeError:
+            return _natkey(val)
+        return _cached(val)
+
+    func.cache_info = cached.cache_info
+    func.cache_clear = cached.cache_clear
+    return func
+
+
+def _mapping_cache_factory(natkey, cache):
+    """Cache the results of *natkey* in the mapping *cache*, with statistics."""
+    stats = [0, 0]
+
+    def func(val, _natkey=natkey, _cache=cache, _stats=stats):
+        # Include the type, as lru_cache(typed=True) does, because equal
+        # values of different types (1 and 1.0) can have different keys.
+        k = (type(val), val)
+        try:
+            result = _cache[k]
+        except KeyError:
+            _stats[1] += 1
+            result = _cache[k] = _natkey(val)
+        else:
+            _stats[0] += 1
+        return result
+
+    def cache_info(_cache=cache, _stats=stats):
+        return KeyCacheInfo(_stats[0], _stats[1], None, len(_cache))
+
+    def cache_clear(_cache=cache, _stats=stats):
+        _cache.clear()
+        _stats[:] = [0, 0]
+
+    func.cache_info = cache_info
+    func.cache_clear = cache_clear
+    return func
+
+
 def parse_bytes_factory(alg):
     """
     Create a function that will format a *bytes* object into a tuple.
@@ -309,7 +666,13 @@ def parse_number_factory(alg, sep, pre_sep):
 
 
 def parse_string_factory(
-    alg, sep, splitter, input_transform, component_transform, final_transform
+    alg,
+    sep,
+    splitter,
+    input_transform,
+    component_transform,
+    final_transform,
+    ascii_splitter=None,
 ):
     """
     Create a function that will split and format a *str* into a tuple.
@@ -336,6 +699,10 @@ def parse_string_factory(
         must accept a tuple and a string argument - the tuple
         should be the result of applying the above functions, and the
         string is the original input value. It must return a tuple.
+    ascii_splitter : callable, optional
+        Used instead of *splitter* when the input is ASCII. It must split
+        ASCII input exactly as *splitter* would. If not given,
+        *splitter* is used for all input.
 
     Returns
     -------
@@ -358,20 +725,52 @@ def parse_string_factory(
     # Sometimes we store the "original" input before transformation,
     # sometimes after.
     orig_after_xfrm = not (alg & NS_DUMB and alg & ns.LOCALEALPHA)
-    original_func = input_transform if orig_after_xfrm else _no_op
     normalize_input = _normalize_input_factory(alg)
+    if ascii_splitter is None:
+        ascii_splitter = splitter
+
+    def func(
+        x,
+        _is_ascii=_is_ascii,
+        _orig_after_xfrm=orig_after_xfrm,
+        _sep=sep,
+        _types=(int, float),
+    ):
+        # ASCII input is already normalized, and can be split with
+        # a simpler regular expression.
+        if _is_ascii(x):
+            split = ascii_splitter
+        else:
+            x = normalize_input(x)
+            split = splitter
 
-    def func(x):
         # Apply string input transformation function and return to x.
-        # Original function is usually a no-op, but some algorithms require it
-        # to also be the transformation function.
-        x = normalize_input(x)
-        x, original = input_transform(x), original_func(x)
-        x = splitter(x)  # Split string into components.
-        x = filter(None, x)  # Remove empty strings.
-        x = map(component_transform, x)  # Apply transform on components.
-        x = sep_inserter(x, sep)  # Insert '' between numbers.
-        return final_transform(x, original)  # Apply the final transform.
+        # The original is usually the transformed input, but some algorithms
+        # require it to be the input before transformation.
+        if _orig_after_xfrm:
+            x = original = input_transform(x)
+        else:
+            x, original = input_transform(x), x
+
+        # Split string into components, remove empty strings, apply
+        # the transform on components, and insert sep between numbers
+        # (or before a leading number), all in a single pass.
+        # This is equivalent to sep_inserter(map(component_transform,
+        # filter(None, split(x))), sep) but avoids the generator overhead.
+        components = []
+        append = components.append
+        previous_is_number = True
+        for component in split(x):
+            if component:
+                component = component_transform(component)
+                if type(component) in _types:
+                    if previous_is_number:
+                        append(_sep)
+                    previous_is_number = True
+                else:
+                    previous_is_number = False
+                append(component)
+        return final_transform(components, original)  # Apply the final transform.
 
     return func
 
@@ -403,6 +802,172 @@ def parse_path_factory(str_split):
     return lambda x: tuple(map(str_split, path_splitter(x)))
 
 
+def parse_string_lazy_factory(
+    alg, sep, regex, input_transform, component_transform, ascii_regex=None
+):
+    """
+    Create a function that will lazily split and format a *str*.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format and split the *str*.
+    sep : str
+        The string character to be inserted between adjacent numeric
+        objects.
+    regex : compiled regex object
+        The regular expression that matches numbers, as returned by
+        *regex_chooser*. It must have a single group containing the
+        whole match.
+    input_transform : callable
+        A function to apply to the string input before searching
+        for numbers. Must return a string.
+    component_transform : callable
+        A function that is operated elementwise on the numeric and
+        non-numeric components. It must accept a single string and
+        return either a string or a number.
+    ascii_regex : compiled regex object, optional
+        Used instead of *regex* when the input is ASCII. If not given,
+        *regex* is used for all input.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts string input and returns an iterator
+        over the same components as the tuple returned by the function
+        from *parse_string_factory* (when its *final_transform* does
+        not change the tuple). Each component is found only when the
+        iterator reaches it.
+
+    See Also
+    --------
+    parse_string_factory
+    LazyKey
+
+    """
+    normalize_input = _normalize_input_factory(alg)
+    if ascii_regex is None:
+        ascii_regex = regex
+
+    def func(x, _is_ascii=_is_ascii, _sep=sep, _types=(int, float)):
+        if _is_ascii(x):
+            finditer = ascii_regex.finditer
+        else:
+            x = normalize_input(x)
+            finditer = regex.finditer
+        x = input_transform(x)
+
+        # This yields the same components as the single pass in
+        # parse_string_factory, with re.split replaced by re.finditer.
+        previous_is_number = True
+        start = 0
+        for match in ichain(finditer(x), (None,)):
+            if match is None:
+                components = (x[start:],)
+            else:
+                end = match.start()
+                components = (x[start:end], match.group())
+                start = match.end()
+            for component in components:
+                if component:
+                    component = component_transform(component)
+                    if type(component) in _types:
+                        if previous_is_number:
+                            yield _sep
+                        previous_is_number = True
+                    else:
+                        previous_is_number = False
+                    yield component
+
+    return func
+
+
+class LazyKey(object):
+    """
+    A natsort key whose components are computed only as they are compared.
+
+    It compares like the tuple of its components, but only computes
+    as many components as are needed to decide each comparison. The
+    computed components are kept, so each is computed only once.
+
+    Parameters
+    ----------
+    components : tuple
+        Components that are already computed.
+    rest : iterator, optional
+        The components that follow *components*.
+
+    """
+
+    __slots__ = ("_components", "_rest")
+
+    def __init__(self, components, rest=None):
+        if rest is not None:
+            components = list(components)
+        self._components = components
+        self._rest = rest
+
+    def _more(self):
+        """Compute the next component; return `False` if there are no more."""
+        if self._rest is None:
+            return False
+        for component in self._rest:
+            self._components.append(component)
+            return True
+        self._rest = None
+        return False
+
+    def _compare(self, other):
+        """Return -1, 0, or 1 as *self* is less than, equal to, or greater."""
+        a, b = self._components, other._components
+        i = 0
+        while True:
+            if i == len(a) and not self._more():
+                return 0 if i == len(b) and not other._more() else -1
+            if i == len(b) and not other._more():
+                return 1
+            x, y = a[i], b[i]
+            if x is not y and x != y:
+                return -1 if x < y else 1
+            i += 1
+
+    def __lt__(self, other):
+        if not isinstance(other, LazyKey):
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        if not isinstance(other, LazyKey):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        if not isinstance(other, LazyKey):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        if not isinstance(other, LazyKey):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LazyKey):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __ne__(self, other):
+        if not isinstance(other, LazyKey):
+            return NotImplemented
+        return self._compare(other) != 0
+
+    __hash__ = None
+
+    def __repr__(self):
+        more = ", ..." if self._rest is not None else ""
+        return "{}({!r}{})".format(type(self).__name__, tuple(self._components), more)
+
+
 def sep_inserter(iterable, sep):
     """
     Insert '' between numbers in an iterable.
@@ -697,8 +1262,33 @@ def do_decoding(s, encoding):
         return s
 
 
+# Whether paths on this platform are POSIX paths, which can be split
+# without building PurePath objects.
+_IS_POSIX = isinstance(PurePath(), PurePosixPath)
+
+
 # noinspection PyIncorrectDocstring
-def path_splitter(s, _d_match=re.compile(r"\.\d").match):
+def _posix_path_parts(s):
+    """
+    Split a str into the same parts as ``PurePosixPath(s).parts``.
+
+    Empty and ``.`` components are removed. A path that starts with
+    exactly two slashes keeps them as its root, as POSIX allows.
+    """
+    parts = [x for x in s.split("/") if x and x != "."]
+    if s[:1] == "/":
+        parts.insert(0, "//" if s[:2] == "//" and s[:3] != "///" else "/")
+    return parts
+
+
+def _name_suffixes(name):
+    """Return the same list as ``PurePosixPath(name).suffixes``."""
+    if "." not in name or name[:1] == "/" or name.endswith("."):
+        return []
+    return ["." + x for x in name.lstrip(".").split(".")[1:]]
+
+
+def path_splitter(s, _d_match=re.compile(r"\.\d").match, _posix=_IS_POSIX):
     """
     Split a string into its path components.
 
@@ -720,22 +1310,30 @@ def path_splitter(s, _d_match=re.compile(r"\.\d").match):
         ('this', 'thing', '.ext')
 
     """
-    if not isinstance(s, PurePath):
-        s = PurePath(s)
-
-    # Split the path into parts.
-    *path_parts, base = s.parts
+    # Building PurePath objects is slow, so on POSIX a str is split with
+    # string operations that give the same result.
+    if _posix and type(s) is str:
+        parts = _posix_path_parts(s)
+        if not parts:
+            return iter(())
+        *path_parts, base = parts
+        suffixes = _name_suffixes(base)
+    else:
+        if not isinstance(s, PurePath):
+            s = PurePath(s)
+        if not s.parts:
+            return iter(())
+        *path_parts, base = s.parts
+        suffixes = PurePath(base).suffixes
 
     # Now, split off the file extensions until we reach a decimal number at
     # the beginning of the suffix or there are no more extensions.
-    suffixes = PurePath(base).suffixes
-    try:
-        digit_index = next(i for i, x in enumerate(reversed(suffixes)) if _d_match(x))
-    except StopIteration:
-        pass
-    else:
-        digit_index = len(suffixes) - digit_index
-        suffixes = suffixes[digit_index:]
-
-    base = base.replace("".join(suffixes), "")
-    return filter(None, ichain(path_parts, [base], suffixes))
+    for i in range(len(suffixes) - 1, -1, -1):
+        if _d_match(suffixes[i]):
+            j = i + 1
+            suffixes = suffixes[j:]
+            break
+
+    path_parts.append(base.replace("".join(suffixes), ""))
+    path_parts.extend(suffixes)
+    return filter(None, path_parts)
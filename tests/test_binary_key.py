@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""\
+Test the binary encoding of natsort keys.
+"""
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import (
+    binary,
+    floats,
+    integers,
+    lists,
+    one_of,
+    recursive,
+    text,
+    tuples,
+)
+from natsort import (
+    decode_natsort_key,
+    encode_natsort_key,
+    natsort_bytes_keygen,
+    natsort_keygen,
+    natsorted,
+    ns,
+)
+
+numbers = floats(allow_nan=False) | integers() | integers(min_value=-(2 ** 1100))
+
+
+def cmp(a, b):
+    return (a > b) - (a < b)
+
+
+@given(x=numbers, y=numbers)
+def test_encode_natsort_key_preserves_the_order_of_numbers(x, y):
+    assert cmp(encode_natsort_key((x,)), encode_natsort_key((y,))) == cmp(x, y)
+
+
+@given(x=text() | binary(), y=text() | binary())
+def test_encode_natsort_key_preserves_the_order_of_strings(x, y):
+    if type(x) is type(y):
+        assert cmp(encode_natsort_key((x,)), encode_natsort_key((y,))) == cmp(x, y)
+
+
+# Keys that alternate strings and numbers, like natsort_keygen creates.
+natsort_like_keys = lists(tuples(text(max_size=3), numbers)).map(
+    lambda x: tuple(y for pair in x for y in pair)
+)
+
+
+@given(x=natsort_like_keys, y=natsort_like_keys)
+def test_encode_natsort_key_preserves_the_order_of_keys(x, y):
+    assert cmp(encode_natsort_key(x), encode_natsort_key(y)) == cmp(x, y)
+
+
+@given(x=lists(natsort_like_keys, max_size=3), y=lists(natsort_like_keys, max_size=3))
+def test_encode_natsort_key_preserves_the_order_of_nested_keys(x, y):
+    x, y = tuple(x), tuple(y)
+    assert cmp(encode_natsort_key(x), encode_natsort_key(y)) == cmp(x, y)
+
+
+@given(
+    x=recursive(
+        one_of(text(), binary(), numbers),
+        lambda children: lists(children).map(tuple),
+        max_leaves=10,
+    ).map(lambda x: (x,))
+)
+def test_decode_natsort_key_is_the_inverse_of_encode_natsort_key(x):
+    assert decode_natsort_key(encode_natsort_key(x)) == x
+
+
+def test_decode_natsort_key_returns_integral_numbers_as_int():
+    result = decode_natsort_key(encode_natsort_key((5.0, -0.0, 2.5, 10 ** 40)))
+    assert result == (5, 0, 2.5, 10 ** 40)
+    assert list(map(type, result)) == [int, int, float, int]
+
+
+@pytest.mark.parametrize(
+    "alg, expected", [(ns.DEFAULT, float("-inf")), (ns.NANLAST, float("inf"))]
+)
+def test_encode_natsort_key_places_nan_according_to_nanlast(alg, expected):
+    encoded = encode_natsort_key(("", float("nan")), alg)
+    assert encoded == encode_natsort_key(("", expected))
+
+
+def test_encode_natsort_key_raises_type_error_for_unsupported_types():
+    with pytest.raises(TypeError, match="cannot encode an object of type dict"):
+        encode_natsort_key(({},))
+
+
+@pytest.mark.parametrize("data", [b"\x09", b"\x08\x02a\x00"])
+def test_decode_natsort_key_raises_value_error_for_invalid_data(data):
+    with pytest.raises(ValueError):
+        decode_natsort_key(data)
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.DEFAULT,
+        ns.REAL | ns.NANLAST,
+        ns.PATH,
+        ns.IGNORECASE | ns.NUMAFTER,
+        ns.GROUPLETTERS,
+    ],
+)
+def test_natsort_bytes_keygen_sorts_the_same_as_natsorted(alg):
+    given = [
+        "/p/Folder (10)/file-2.5e3.tar.gz",
+        "/p/Folder (1)/file-1.tar.gz",
+        "/p/Folder/file (01).txt",
+        "/p/Folder (1)/file.tar.gz",
+        "num-3",
+        "num2",
+        "Num2",
+        "num5.10",
+        "num5.3",
+        float("nan"),
+        -2.5,
+        10 ** 30,
+        ("a", 5),
+        b"bytes",
+    ]
+    natkey = natsort_keygen(alg=alg)
+    bytes_key = natsort_bytes_keygen(alg=alg)
+    # Python cannot compare all of these keys to each other, so check
+    # the order pairwise where it is defined.
+    for x in given:
+        for y in given:
+            try:
+                expected = cmp(natkey(x), natkey(y))
+            except TypeError:
+                continue
+            assert cmp(bytes_key(x), bytes_key(y)) == expected
+    strings = [x for x in given if isinstance(x, str)]
+    assert sorted(strings, key=bytes_key) == natsorted(strings, alg=alg)
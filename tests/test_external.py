@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""\
+Test natural sorting of inputs that do not fit in memory.
+"""
+
+import heapq
+import pickle
+import sys
+import tempfile
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import booleans, integers, lists, sampled_from, text
+from natsort import external, external_sort, natsorted, ns
+
+
+@pytest.fixture
+def many_runs(mocker):
+    """Merge temporary files a few at a time, to test the intermediate merges."""
+    mocker.patch("natsort.external.EXTERNAL_SORT_MAX_FILES", 3)
+
+
+@pytest.fixture
+def lines():
+    return ["file10.txt", "File2.txt", "file1.txt", "file2.txt", "file-1.txt"] * 20
+
+
+@pytest.mark.usefixtures("many_runs")
+@settings(max_examples=50)
+@given(
+    x=lists(text(alphabet="aA1 .-", max_size=6) | integers()),
+    reverse=booleans(),
+    alg=sampled_from([ns.DEFAULT, ns.REAL | ns.IGNORECASE]),
+    max_memory=sampled_from([1, 500, 10 ** 6]),
+)
+def test_external_sort_is_same_as_natsorted(x, reverse, alg, max_memory):
+    result = external_sort(x, reverse=reverse, alg=alg, max_memory=max_memory)
+    assert list(result) == natsorted(x, reverse=reverse, alg=alg)
+
+
+@pytest.mark.usefixtures("many_runs")
+def test_external_sort_is_stable_with_key(lines):
+    def stem(x):
+        return x.partition(".")[0].lower()
+
+    result = external_sort(enumerate(lines), key=lambda x: stem(x[1]), max_memory=500)
+    assert list(result) == natsorted(enumerate(lines), key=lambda x: stem(x[1]))
+
+
+def test_external_sort_spills_the_first_run_before_reading_the_next(mocker, lines):
+    read, spilled = [], []
+
+    def reader():
+        for x in lines:
+            read.append(x)
+            yield x
+
+    def spill(items, tmpdir, batch_memory, _spill=external._spill):
+        if isinstance(items, list):  # A run, rather than merged runs.
+            spilled.append((len(read), len(items)))
+        return _spill(items, tmpdir, batch_memory)
+
+    mocker.patch("natsort.external._spill", spill)
+    assert list(external_sort(reader(), max_memory=500)) == natsorted(lines)
+    # Only one element of the second run was read to see that there is one.
+    assert spilled[0][0] == spilled[0][1] + 1
+    assert len(spilled) > 1
+
+
+def test_external_sort_merges_within_a_small_max_memory(mocker):
+    given = ["file{:04d}.txt".format(i) for i in range(2000, 0, -1)]
+    max_memory = 3000
+    batches, widths = [], []
+
+    def dump(batch, f, protocol, _dump=pickle.dump):
+        batches.append(sum(map(sys.getsizeof, batch)))
+        return _dump(batch, f, protocol)
+
+    def merge(*iterables, _merge=heapq.merge, **kwargs):
+        widths.append(len(iterables))
+        return _merge(*iterables, **kwargs)
+
+    mocker.patch("pickle.dump", dump)
+    mocker.patch("natsort.external.heapq.merge", merge)
+    assert list(external_sort(given, max_memory=max_memory)) == given[::-1]
+    # One batch is read from each file merged, and one batch is written.
+    assert len(widths) > 1
+    assert (max(widths) + 1) * max(batches) <= max_memory
+
+
+def test_external_sort_reads_and_writes_text_files(tmp_path, lines):
+    infile, outfile = tmp_path / "in.txt", tmp_path / "out.txt"
+    infile.write_text("\n".join(lines), encoding="utf-8")
+    assert external_sort(str(infile), outfile, max_memory=500, tmpdir=tmp_path) is None
+    assert outfile.read_text(encoding="utf-8") == "".join(
+        x + "\n" for x in natsorted(lines)
+    )
+    assert sorted(x.name for x in tmp_path.iterdir()) == ["in.txt", "out.txt"]
+    assert list(external_sort(infile, max_memory=500)) == natsorted(lines)
+
+
+def test_external_sort_reads_and_writes_bytes_lines(tmp_path, lines):
+    infile, outfile = tmp_path / "in.txt", tmp_path / "out.txt"
+    infile.write_bytes(b"".join(x.encode() + b"\n" for x in lines))
+    with infile.open("rb") as f, outfile.open("wb") as out:
+        external_sort(f, out, max_memory=500)
+    expected = natsorted(x.encode() for x in lines)
+    assert outfile.read_bytes() == b"".join(x + b"\n" for x in expected)
+
+
+def test_external_sort_generator_closes_temporary_files_when_closed(mocker, lines):
+    files = []
+
+    def temporary_file(_temporary_file=tempfile.TemporaryFile, **kwargs):
+        files.append(_temporary_file(**kwargs))
+        return files[-1]
+
+    mocker.patch("tempfile.TemporaryFile", temporary_file)
+    # Merge all of the runs at once, so that every file stays open.
+    mocker.patch("natsort.external._MIN_BATCH_MEMORY", 1)
+    result = external_sort(lines, max_memory=500)
+    assert next(result) == "File2.txt"
+    assert len(files) > 1
+    assert not any(f.closed for f in files)
+    result.close()
+    assert all(f.closed for f in files)
+
+
+def test_external_sort_handles_empty_input(tmp_path):
+    outfile = tmp_path / "out.txt"
+    assert list(external_sort([])) == []
+    external_sort([], outfile)
+    assert outfile.read_text() == ""
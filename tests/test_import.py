@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""\
+Test what happens when natsort is imported.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from natsort.compat import locale
+from natsort.compat.fastnumbers import is_supported_fastnumbers
+
+
+def run_python(code):
+    return subprocess.check_output([sys.executable, "-c", code]).decode().strip()
+
+
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        ("1.9.9", False),
+        ("2.0.0", True),
+        ("2.0", True),
+        ("2.2.1", True),
+        ("3.0.0a1", True),
+        ("10.1.3", True),
+        ("garbage", False),
+    ],
+)
+def test_is_supported_fastnumbers(version, expected):
+    assert is_supported_fastnumbers(version) is expected
+
+
+@pytest.mark.parametrize(
+    "module", ["icu", "distutils", "concurrent.futures", "pickle", "tempfile"]
+)
+def test_importing_natsort_does_not_import_slow_modules(module):
+    code = "import sys, natsort; print({!r} in sys.modules)".format(module)
+    assert run_python(code) == "False"
+
+
+@pytest.fixture
+def broken_icu(mocker):
+    """Make icu look installed, but fail to import."""
+    mocker.patch("natsort.compat.locale.find_spec", return_value=object())
+    mocker.patch(
+        "natsort.compat.locale.import_module", side_effect=ImportError("libicu")
+    )
+    mocker.patch("natsort.compat.locale.null_string_locale", b"")
+    mocker.patch("natsort.compat.locale.null_string_locale_max", b"x7f" * 50)
+    locale._icu.cache_clear()
+    yield
+    locale._icu.cache_clear()
+
+
+@pytest.mark.usefixtures("broken_icu")
+def test_locale_falls_back_to_the_builtin_locale_if_icu_cannot_be_imported():
+    assert locale.get_strxfrm() is locale.strxfrm
+    assert locale.get_null_string_locale() == (
+        locale.null_string,
+        locale.null_string_max,
+    )
+    assert locale.dumb_sort() is (locale.strxfrm("A") < locale.strxfrm("a"))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""\
+Test range and prefix queries on a NatIndex.
+"""
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text
+from natsort import NatIndex, natsort_keygen, natsorted, ns
+
+paths = text(alphabet="ab1/._-", max_size=8)
+algs = sampled_from([ns.DEFAULT, ns.REAL | ns.IGNORECASE, ns.FLOAT | ns.SIGNED])
+
+
+@pytest.fixture
+def frames():
+    return NatIndex(
+        [
+            "shot_10/frame_0050",
+            "shot_2/frame_0100",
+            "shot_010/frame_0100",
+            "shot_12/frame_0050",
+            "shot_12/frame_0051",
+            "shot_1/frame_5",
+            "shot_11/frame_1",
+        ]
+    )
+
+
+@given(x=lists(paths), lo=paths, hi=paths, alg=algs)
+def test_range_is_same_as_filtering_natsorted(x, lo, hi, alg):
+    index = NatIndex(x, alg=alg)
+    natkey = natsort_keygen(alg=alg)
+    klo, khi = natkey(lo), natkey(hi)
+    expected = natsorted(x, alg=alg)
+    assert list(index) == expected
+    assert index.range(lo, hi) == [y for y in expected if klo <= natkey(y) <= khi]
+    assert index.range(lo, hi, inclusive=(False, False)) == [
+        y for y in expected if klo < natkey(y) < khi
+    ]
+    assert index.range(hi=hi) == [y for y in expected if natkey(y) <= khi]
+    assert index.range(lo) == [y for y in expected if klo <= natkey(y)]
+
+
+def test_range_between_frames(frames):
+    assert frames.range("shot_010/frame_0100", "shot_012/frame_0050") == [
+        "shot_010/frame_0100",
+        "shot_11/frame_1",
+        "shot_12/frame_0050",
+    ]
+
+
+def test_prefix_matches_whole_numbers_and_partial_text(frames):
+    assert frames.prefix("shot_10/") == ["shot_10/frame_0050", "shot_010/frame_0100"]
+    assert frames.prefix("shot_1") == ["shot_1/frame_5"]
+    assert frames.prefix("shot_12/frame_50") == ["shot_12/frame_0050"]
+    assert frames.prefix("shot_12/frame_005") == []
+    assert frames.prefix("shot_12/fr") == frames.prefix("shot_12")
+    assert frames.prefix("") == list(frames)
+    assert frames.prefix("take") == []
+
+
+def test_prefix_with_path_matches_whole_directories():
+    index = NatIndex(
+        ["a/b10/c", "a/b2/c", "a/b2.txt", "a/b2/d/e", "a/b20"], alg=ns.PATH
+    )
+    assert index.prefix("a/b2") == ["a/b2.txt", "a/b2/c", "a/b2/d/e"]
+    assert index.prefix("a/b2/") == index.prefix("a/b2")
+    assert index.prefix("a/b2/d") == ["a/b2/d/e"]
+    assert index.prefix("a") == list(index)
+
+
+def test_floor_and_ceiling(frames):
+    assert frames.floor("shot_3") == "shot_2/frame_0100"
+    assert frames.ceiling("shot_3") == "shot_10/frame_0050"
+    assert frames.floor("shot_2/frame_0100") == "shot_2/frame_0100"
+    assert frames.floor("shot_0") is None
+    assert frames.ceiling("shot_99", default="") == ""
+
+
+def test_contains_and_len(frames):
+    assert "shot_2/frame_0100" in frames
+    assert "shot_2/frame_100" not in frames
+    assert len(frames) == 7
+    assert frames[0] == "shot_1/frame_5"
+
+
+def test_save_and_load(frames, tmp_path):
+    path = tmp_path / "frames.idx"
+    frames.save(path)
+    index = NatIndex.load(path)
+    assert list(index) == list(frames)
+    assert index.prefix("shot_12") == frames.prefix("shot_12")
+
+
+def test_load_rejects_unknown_format(frames, tmp_path, mocker):
+    path = tmp_path / "frames.idx"
+    mocker.patch("natsort.index._FORMAT_VERSION", 0)
+    frames.save(path)
+    mocker.stopall()
+    with pytest.raises(ValueError, match="unsupported format version 0 in .*frames"):
+        NatIndex.load(path)
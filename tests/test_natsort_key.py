@@ -40,3 +40,27 @@ def test_natsort_key_with_nested_input_takes_nested_path(x):
 @given(text())
 def test_natsort_key_with_key_argument_applies_key_before_processing(x):
     assert natsort_key(x, len, str_func, fail, lambda y: y) == len(x)
+
+
+@given(floats(allow_nan=False) | integers())
+def test_natsort_key_with_numeric_input_never_tries_string_path(x):
+    assert natsort_key(x, None, fail, fail, lambda y: y) is x
+
+
+@given(binary())
+def test_natsort_key_with_bytes_input_never_tries_string_path(x):
+    assert natsort_key(x, None, fail, lambda y: y, fail) is x
+
+
+@given(lists(elements=integers(), max_size=10))
+def test_natsort_key_with_tuple_input_never_tries_string_path(x):
+    assert natsort_key(tuple(x), None, fail, fail, lambda y: y) == tuple(x)
+
+
+def test_natsort_key_with_other_types_falls_back_to_trying_each_path():
+    class MyStr(str):
+        pass
+
+    assert natsort_key(MyStr("a"), None, str_func, fail, fail) == "a"
+    assert natsort_key(True, None, str_func, fail, lambda y: y) is True
+    assert natsort_key({"a": 1}, None, str_func, fail, fail) == ("a",)
@@ -5,9 +5,18 @@ See the README or the natsort homepage for more details.
 """
 
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter, itemgetter, methodcaller
 
 import pytest
-from natsort import natsort_key, natsort_keygen, natsorted, ns
+from natsort import (
+    natsort_key,
+    natsort_keygen,
+    natsort_lazy_keygen,
+    natsorted,
+    ns,
+)
 from natsort.compat.locale import get_strxfrm, null_string_locale
 
 
@@ -164,3 +173,223 @@ def test_natsort_keygen_with_locale_bytes(mocker, bytes_input, alg, is_dumb):
     mocker.patch("natsort.compat.locale.dumb_sort", return_value=is_dumb)
     ns_key = natsort_keygen(alg=alg)
     assert ns_key(bytes_input) == expected
+
+
+def test_natsort_keygen_returns_cached_key_for_same_arguments():
+    natsort_keygen.cache_clear()
+    ns_key = natsort_keygen(alg=ns.REAL)
+    assert natsort_keygen(alg=ns.REAL) is ns_key
+    info = natsort_keygen.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_natsort_keygen_caches_separately_for_each_key_and_alg():
+    natsort_keygen.cache_clear()
+    keys = {
+        natsort_keygen(),
+        natsort_keygen(alg=ns.REAL),
+        natsort_keygen(len),
+        natsort_keygen(len, alg=ns.REAL),
+    }
+    assert len(keys) == 4
+    assert natsort_keygen.cache_info().misses == 4
+
+
+def test_natsort_keygen_cache_clear_resets_cache():
+    ns_key = natsort_keygen(alg=ns.PATH)
+    natsort_keygen.cache_clear()
+    assert natsort_keygen.cache_info().currsize == 0
+    assert natsort_keygen(alg=ns.PATH) is not ns_key
+
+
+def test_natsort_keygen_does_not_cache_unhashable_key():
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, x):
+            return x
+
+    natsort_keygen.cache_clear()
+    ns_key = natsort_keygen(Unhashable())
+    assert ns_key("a5") == ("a", 5)
+    assert natsort_keygen.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "key",
+    [str.lower, len, str, itemgetter(0), attrgetter("real"), methodcaller("strip")],
+)
+def test_natsort_keygen_caches_keys_for_builtins_and_operators(key):
+    natsort_keygen.cache_clear()
+    assert natsort_keygen(key) is natsort_keygen(key)
+    assert natsort_keygen.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("key", [lambda x: x, {"a5": "a5"}.get])
+def test_natsort_keygen_does_not_cache_other_callables(key):
+    natsort_keygen.cache_clear()
+    assert natsort_keygen(key)("a5") == ("a", 5)
+    assert natsort_keygen.cache_info().currsize == 0
+
+
+def test_natsort_keygen_cache_accounts_for_current_locale(mocker):
+    natsort_keygen.cache_clear()
+    mocker.patch("natsort.natsort.setlocale", return_value="C")
+    ns_key = natsort_keygen(alg=ns.LOCALENUM)
+    mocker.patch("natsort.natsort.setlocale", return_value="en_US.UTF-8")
+    assert natsort_keygen(alg=ns.LOCALENUM) is not ns_key
+
+
+@pytest.mark.parametrize("cache", [True, 10])
+def test_natsort_keygen_with_cache_shares_keys_of_equal_values(cache):
+    ns_key = natsort_keygen(alg=ns.REAL, cache=cache)
+    given = ["a-5", "b10", "a" + "-5", "b10", "a-5"]
+    keys = list(map(ns_key, given))
+    assert keys == list(map(natsort_keygen(alg=ns.REAL), given))
+    assert keys[0] is keys[2] is keys[4]
+    assert ns_key.cache_info()[:2] == (3, 2)
+    ns_key.cache_clear()
+    assert ns_key.cache_info().currsize == 0
+
+
+def test_natsort_keygen_with_bounded_cache_evicts_least_recently_used():
+    ns_key = natsort_keygen(cache=2)
+    for x in ["a1", "a2", "a1", "a3", "a1", "a2"]:
+        ns_key(x)
+    assert ns_key.cache_info() == (2, 4, 2, 2)
+
+
+def test_natsort_keygen_with_mapping_cache_stores_keys_in_mapping():
+    cache = {}
+    ns_key = natsort_keygen(cache=cache)
+    ns_key("a1")
+    ns_key("a1")
+    assert cache == {(str, "a1"): ("a", 1)}
+    assert ns_key.cache_info() == (1, 1, None, 1)
+    # The mapping can be shared between keys.
+    assert natsort_keygen(cache=cache)("a1") is cache[str, "a1"]
+    ns_key.cache_clear()
+    assert cache == {}
+    assert ns_key.cache_info() == (0, 0, None, 0)
+
+
+def test_natsort_keygen_with_cache_handles_unhashable_values():
+    ns_key = natsort_keygen(cache=True)
+    assert ns_key(["a1", "b2"]) == (("a", 1), ("b", 2))
+    assert ns_key.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("cache", [True, {}])
+def test_natsort_keygen_with_cache_distinguishes_int_and_float(cache):
+    ns_key = natsort_keygen(cache=cache)
+    assert ns_key(1) == ("", 1)
+    assert type(ns_key(1.0)[1]) is float
+
+
+@pytest.mark.parametrize("cache", [True, {}])
+def test_natsort_keygen_with_cache_calls_key_once_if_it_raises_type_error(cache):
+    calls = []
+
+    def key(x):
+        calls.append(x)
+        raise TypeError("bad value")
+
+    with pytest.raises(TypeError, match="bad value"):
+        natsort_keygen(key, cache=cache)("a1")
+    assert calls == ["a1"]
+
+
+def test_natsort_keygen_with_invalid_cache_raises_type_error():
+    with pytest.raises(TypeError, match="'cache' must be"):
+        natsort_keygen(cache="yes")
+
+
+def test_natsort_keygen_with_negative_cache_raises_value_error():
+    with pytest.raises(ValueError, match="'cache' must be non-negative"):
+        natsort_keygen(cache=-1)
+
+
+@pytest.mark.parametrize(
+    "key, alg", [(None, ns.DEFAULT), (str, ns.REAL | ns.PATH), (repr, ns.G)]
+)
+def test_natsort_keygen_result_can_be_pickled(key, alg, arbitrary_input):
+    ns_key = natsort_keygen(key, alg)
+    unpickled = pickle.loads(pickle.dumps(ns_key))
+    for x in arbitrary_input:
+        assert unpickled(x) == ns_key(x)
+
+
+def test_natsort_keygen_result_is_rebuilt_from_cache_when_unpickled():
+    data = pickle.dumps(natsort_keygen(alg=ns.FLOAT))
+    natsort_keygen.cache_clear()
+    assert pickle.loads(data) is pickle.loads(data)
+    assert natsort_keygen.cache_info().misses == 1
+
+
+def test_natsort_key_can_be_pickled():
+    assert pickle.loads(pickle.dumps(natsort_key))("a-5") == ("a-", 5)
+
+
+def test_natsort_keygen_result_can_be_sent_to_worker_processes():
+    given = ["a10", "a2", "/p/b (1).txt"]
+    ns_key = natsort_keygen(alg=ns.PATH)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert list(executor.map(ns_key, given)) == list(map(ns_key, given))
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.DEFAULT,
+        ns.REAL | ns.IGNORECASE,
+        ns.PATH,
+        ns.NUMAFTER | ns.LOWERCASEFIRST,
+        ns.LOCALE | ns.UNGROUPLETTERS,
+    ],
+)
+def test_natsort_lazy_keygen_sorts_same_as_natsort_keygen(alg):
+    given = ["a10/b", "a2/b", "A2/b1", "a2/b1.5", "a-2", "1e5", "x10", "x9 y"]
+    assert sorted(given, key=natsort_lazy_keygen(alg=alg)) == natsorted(given, alg=alg)
+    lazy_key, natkey = natsort_lazy_keygen(alg=alg), natsort_keygen(alg=alg)
+    for a in given:
+        for b in given:
+            assert (lazy_key(a) < lazy_key(b)) is (natkey(a) < natkey(b))
+            assert (lazy_key(a) == lazy_key(b)) is (natkey(a) == natkey(b))
+
+
+def test_natsort_lazy_keygen_handles_numbers_and_key():
+    given = ["a10", 5, "a2", 1.5, "B1"]
+    natkey = natsort_lazy_keygen(key=lambda x: x.lower() if isinstance(x, str) else x)
+    assert sorted(given, key=natkey) == [1.5, 5, "a2", "a10", "B1"]
+
+
+def test_natsort_lazy_keygen_parses_only_what_is_compared():
+    natkey = natsort_lazy_keygen()
+    a = natkey("x1 " + "word 123 " * 1000)
+    b = natkey("x2 " + "word 123 " * 1000)
+    assert a < b
+    assert repr(a) == "LazyKey(('x', 1), ...)"
+    assert a == natkey("x1 " + "word 123 " * 1000)
+    assert repr(a).endswith(" 123, ' word ', 123, ' '))")
+
+
+def test_natsort_keygen_with_path_shares_parsed_directory_components():
+    natkey = natsort_keygen(alg=ns.PATH | ns.IGNORECASE)
+    a, b = natkey("/usr/share/data1/X.txt"), natkey("/usr/share/data1/y10.txt")
+    assert a == (("/",), ("usr",), ("share",), ("data", 1), ("x",), (".txt",))
+    assert all(x is y for x, y in zip(a[:4], b[:4]))
+    assert natkey("/usr/Share")[2] == a[2]
+    lazy_key = natsort_lazy_keygen(alg=ns.PATH | ns.IGNORECASE)
+    assert lazy_key("/usr/share/data1/y10.txt") > lazy_key("/usr/Share/data1/x.txt")
+
+
+def test_natsort_keygen_with_path_bounds_the_component_cache(mocker):
+    mocker.patch("natsort.natsort.PATH_COMPONENT_CACHE_SIZE", 2)
+    natsort_keygen.cache_clear()
+    natkey = natsort_keygen(alg=ns.PATH)
+    first = natkey("a1/b")[0]
+    assert natkey("a1/c")[0] is first
+    natkey("d/e/f")
+    assert natkey("a1/b")[0] is not first
+    assert natkey("a1/b")[0] == first
+    natsort_keygen.cache_clear()
@@ -4,10 +4,21 @@ Here are a collection of examples of how this module can be used.
 See the README or the natsort homepage for more details.
 """
 
-from operator import itemgetter
+import threading
+from operator import attrgetter, itemgetter, methodcaller
 
 import pytest
-from natsort import as_utf8, natsorted, ns
+from hypothesis import given
+from hypothesis.strategies import (
+    floats,
+    from_regex,
+    integers,
+    lists,
+    none,
+    sampled_from,
+)
+from natsort import as_utf8, index_natsorted, natsort_keygen, natsorted, ns
+from natsort.natsort import _parallel_order
 from pytest import raises
 
 
@@ -304,3 +315,197 @@ def test_natsorted_sorts_mixed_ascii_and_non_ascii_numbers():
         "street ۱۲",
     ]
     assert natsorted(given, alg=ns.IGNORECASE) == expected
+
+
+homogeneous_algs = [
+    ns.DEFAULT,
+    ns.FLOAT,
+    ns.REAL | ns.NANLAST,
+    ns.PATH,
+    ns.NUMAFTER,
+    ns.IGNORECASE | ns.GROUPLETTERS,
+]
+
+
+@pytest.mark.parametrize("alg", homogeneous_algs)
+@pytest.mark.parametrize("reverse", [False, True])
+@given(x=lists(floats() | integers(min_value=-(10 ** 30), max_value=10 ** 30)))
+def test_natsorted_of_numbers_is_same_as_sorting_with_natsort_key(x, alg, reverse):
+    expected = sorted(x, key=natsort_keygen(alg=alg), reverse=reverse)
+    # Use repr because NaN != NaN and to make sure stability is preserved.
+    assert list(map(repr, natsorted(x, alg=alg, reverse=reverse))) == list(
+        map(repr, expected)
+    )
+    assert index_natsorted(x, alg=alg, reverse=reverse) == sorted(
+        range(len(x)), key=lambda i: natsort_keygen(alg=alg)(x[i]), reverse=reverse
+    )
+
+
+@pytest.mark.parametrize("alg", homogeneous_algs)
+@given(x=lists(from_regex(r"\A[0-9]{1,25}\Z")))
+def test_natsorted_of_digit_strings_is_same_as_sorting_with_natsort_key(x, alg):
+    assert natsorted(x, alg=alg) == sorted(x, key=natsort_keygen(alg=alg))
+    assert index_natsorted(x, alg=alg) == sorted(
+        range(len(x)), key=lambda i: natsort_keygen(alg=alg)(x[i])
+    )
+
+
+def test_natsorted_and_index_natsorted_use_cache():
+    given = ["b2", "a10", "b2", "A10", "b2"]
+    cache = {}
+    assert natsorted(given, alg=ns.IGNORECASE, cache=cache) == natsorted(
+        given, alg=ns.IGNORECASE
+    )
+    assert sorted(cache) == [(str, "A10"), (str, "a10"), (str, "b2")]
+    assert index_natsorted(given, cache=10) == [3, 1, 0, 2, 4]
+
+
+@pytest.mark.parametrize("cache", [True, {}])
+def test_natsorted_cache_does_not_share_keys_between_types(cache):
+    given = [1.0, 1, "x"]
+    assert natsorted(given, key=repr, cache=cache) == [1, 1.0, "x"]
+
+
+@pytest.fixture
+def parallel(mocker):
+    """Use worker processes for any input, even on a single CPU."""
+    mocker.patch("natsort.natsort.PARALLEL_MIN_SIZE", 0)
+    mocker.patch("natsort.natsort.os.cpu_count", return_value=4)
+
+
+@pytest.mark.usefixtures("parallel")
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.REAL | ns.PATH | ns.IGNORECASE])
+def test_natsorted_and_index_natsorted_with_workers_are_same_as_serial(alg):
+    given = ["a10", "A2", "/p/b (1).txt", "a2", "a-5.5", 12, "b0", "a10", 1.5, "c"]
+    given = given * 3
+    for reverse in (False, True):
+        assert natsorted(
+            given, key=str, alg=alg, reverse=reverse, workers=2, chunksize=7
+        ) == natsorted(given, key=str, alg=alg, reverse=reverse)
+        assert index_natsorted(
+            given, key=str, alg=alg, reverse=reverse, workers=2
+        ) == index_natsorted(given, key=str, alg=alg, reverse=reverse)
+    assert natsorted(given, key=str, alg=alg, workers=2, offset=5, limit=3) == (
+        natsorted(given, key=str, alg=alg)[5:8]
+    )
+
+
+@pytest.mark.usefixtures("parallel")
+def test_natsorted_with_workers_stays_serial_for_unpicklable_key(mocker):
+    pool = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+    given = ["a10", "a2", "a1"]
+    assert natsorted(given, key=lambda x: x, workers=2) == ["a1", "a2", "a10"]
+    assert natsorted(given, workers=2, cache=True) == ["a1", "a2", "a10"]
+    assert not pool.called
+
+
+class Locked(object):
+    """An object that cannot be pickled, because it holds a lock."""
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+
+
+@pytest.mark.usefixtures("parallel")
+def test_natsorted_with_workers_stays_serial_for_unpicklable_elements():
+    given = [Locked(x) for x in ["a10", "a2", "a1"]]
+    result = natsorted(given, key=attrgetter("name"), workers=2)
+    assert [x.name for x in result] == ["a1", "a2", "a10"]
+
+
+@pytest.mark.usefixtures("parallel")
+def test_parallel_order_raises_errors_from_the_key_in_workers():
+    # The key's own errors are raised, not hidden by a serial retry.
+    with raises(AttributeError, match="lower"):
+        _parallel_order(["a", 1] * 5, methodcaller("lower"), ns.DEFAULT, False, 2, 3)
+
+
+@pytest.mark.parametrize("chunksize", [0, -1])
+def test_natsorted_with_non_positive_chunksize_raises_value_error(chunksize):
+    with raises(ValueError, match="'chunksize' must be positive"):
+        natsorted(["a1"], workers=2, chunksize=chunksize)
+    with raises(ValueError, match="'chunksize' must be positive"):
+        index_natsorted(["a1"], workers=2, chunksize=chunksize)
+
+
+def test_natsorted_with_workers_stays_serial_for_small_input(mocker):
+    pool = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+    assert natsorted(["a10", "a2", "a1"], workers=2) == ["a1", "a2", "a10"]
+    assert not pool.called
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@given(
+    x=lists(sampled_from(["a1", "a01", "A1", "a2", "b10", "b9", "", "1.5"])),
+    offset=integers(min_value=0, max_value=12),
+    limit=none() | integers(min_value=0, max_value=12),
+)
+def test_natsorted_and_index_natsorted_with_offset_and_limit_are_slices(
+    x, offset, limit, reverse
+):
+    stop = None if limit is None else offset + limit
+    expected = natsorted(x, reverse=reverse)[offset:stop]
+    assert natsorted(x, reverse=reverse, offset=offset, limit=limit) == expected
+    expected = index_natsorted(x, reverse=reverse)[offset:stop]
+    for dedupe in (False, True):
+        result = index_natsorted(
+            x, reverse=reverse, offset=offset, limit=limit, dedupe=dedupe
+        )
+        assert result == expected
+
+
+def test_natsorted_with_offset_and_limit_pages_through_large_input():
+    given = ["file{}.txt".format(i) for i in range(5000, 0, -1)] + [1.5, "a"]
+    expected = natsorted(given, key=str)
+    for offset in (0, 100, 2500, 4990, 6000):
+        result = natsorted(given, key=str, offset=offset, limit=20)
+        stop = offset + 20
+        assert result == expected[offset:stop]
+    assert natsorted(range(10), offset=8) == [8, 9]
+
+
+@pytest.mark.parametrize("offset, limit", [(-1, None), (0, -1)])
+def test_natsorted_with_negative_offset_or_limit_raises_value_error(offset, limit):
+    with raises(ValueError, match="non-negative"):
+        natsorted(["a1"], offset=offset, limit=limit)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize(
+    "alg", [ns.DEFAULT, ns.REAL | ns.IGNORECASE, ns.PATH, ns.LOCALE | ns.UNGROUPLETTERS]
+)
+@given(
+    x=lists(from_regex(r"\A[aA1./-]{1,10}\Z")),
+    key_prefix=sampled_from([True, 1, 2, 5]),
+)
+def test_natsorted_with_key_prefix_is_same_as_natsorted(x, key_prefix, alg, reverse):
+    expected = natsorted(x, reverse=reverse, alg=alg)
+    result = natsorted(x, reverse=reverse, alg=alg, key_prefix=key_prefix)
+    assert result == expected
+
+
+def test_natsorted_with_key_prefix_refines_only_tied_groups(mocker):
+    given = ["a1b{}".format(i) for i in range(10, 0, -1)] + ["b2", "a2", 1.5, "a"]
+    expected = natsorted(given, key=str)
+    key = mocker.Mock(side_effect=str)
+    assert natsorted(given, key=key, key_prefix=2) == expected
+    # Once for each element, and again for the ten that start with "a1".
+    assert key.call_count == len(given) + 10
+    assert natsorted(given, key=str, key_prefix=2, offset=3, limit=2) == expected[3:5]
+    assert natsorted(given, key=str, key_prefix=True) == expected
+
+
+def test_natsorted_with_key_prefix_chooses_length_from_sample():
+    from natsort.natsort import _choose_key_prefix
+
+    given = ["host{}/path/{}/x".format(i % 7, i) for i in range(2000)]
+    assert _choose_key_prefix(given, None, ns.DEFAULT) == 4
+    assert _choose_key_prefix(["a1"] * 5, None, ns.DEFAULT) == 1
+    assert _choose_key_prefix([], None, ns.DEFAULT) == 1
+
+
+@pytest.mark.parametrize("key_prefix", [0, -1])
+def test_natsorted_with_invalid_key_prefix_raises_value_error(key_prefix):
+    with raises(ValueError, match="'key_prefix' must be positive"):
+        natsorted(["a1"], key_prefix=key_prefix)
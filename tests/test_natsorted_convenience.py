@@ -7,14 +7,22 @@ See the README or the natsort homepage for more details.
 from operator import itemgetter
 
 import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, floats, integers, lists, sampled_from
 from natsort import (
     as_ascii,
     as_utf8,
     decoder,
     humansorted,
     index_humansorted,
+    index_natmerge,
     index_natsorted,
     index_realsorted,
+    natlargest,
+    natmerge,
+    natrank,
+    natsmallest,
+    natsort_keygen,
     natsorted,
     ns,
     order_by_index,
@@ -107,3 +115,100 @@ def test_order_by_index_returns_generator_with_iter_true():
     index = [2, 0, 1]
     assert order_by_index(given, index, True) != [given[i] for i in index]
     assert list(order_by_index(given, index, True)) == [given[i] for i in index]
+
+
+# Few distinct values, some of which have equal natsort keys.
+repeated_values = lists(
+    sampled_from(["a1", "a01", "A1", "a2", "b10", "b9", "", "1.5", "-1"])
+)
+
+
+@given(x=repeated_values, reverse=booleans(), alg=sampled_from([ns.INT, ns.REAL]))
+def test_index_natsorted_with_dedupe_is_same_as_without(x, reverse, alg):
+    expected = index_natsorted(x, reverse=reverse, alg=alg)
+    assert index_natsorted(x, reverse=reverse, alg=alg, dedupe=True) == expected
+
+
+@given(x=lists(floats()))
+def test_index_natsorted_with_dedupe_handles_nan(x):
+    assert index_natsorted(x, dedupe=True) == index_natsorted(x)
+
+
+# Values that compare equal, but whose repr differs.
+equal_but_distinct = lists(sampled_from([1, 1.0, True, 0, 0.0, -0.0, False, "1"]))
+
+
+@given(x=equal_but_distinct, reverse=booleans())
+def test_index_natsorted_with_dedupe_and_key_is_same_as_without(x, reverse):
+    expected = index_natsorted(x, key=repr, reverse=reverse)
+    assert index_natsorted(x, key=repr, reverse=reverse, dedupe=True) == expected
+
+
+def test_index_natsorted_with_dedupe_handles_unhashable_values():
+    given = [["a2"], ["a10"], ["a2"]]
+    assert index_natsorted(given, dedupe=True) == [0, 2, 1]
+
+
+@given(x=repeated_values)
+def test_natrank_gives_dense_ranks_in_natural_order(x):
+    natkey = natsort_keygen()
+    ranks = natrank(x)
+    distinct_keys = sorted(set(map(natkey, x)))
+    assert ranks == [distinct_keys.index(natkey(y)) for y in x]
+
+
+@given(x=equal_but_distinct)
+def test_natrank_with_key_ranks_by_the_key_of_each_element(x):
+    natkey = natsort_keygen(key=repr)
+    distinct_keys = sorted(set(map(natkey, x)))
+    assert natrank(x, key=repr) == [distinct_keys.index(natkey(y)) for y in x]
+
+
+def test_natrank_examples():
+    given = ["b10", "a2", "b9", "a02", "B10"]
+    assert natrank(given) == [3, 1, 2, 1, 0]
+    assert natrank(given, alg=ns.IGNORECASE) == [2, 0, 1, 0, 2]
+    assert natrank(given, reverse=True) == [0, 2, 1, 2, 3]
+    assert natrank(iter(given), key=len) == [1, 0, 0, 1, 1]
+    assert natrank([1, 1.0, True], key=repr) == [0, 1, 2]
+    assert natrank([]) == []
+
+
+@given(x=lists(repeated_values, max_size=5), reverse=booleans())
+def test_natmerge_is_same_as_natsorted_of_sorted_inputs(x, reverse):
+    shards = [natsorted(y, reverse=reverse, alg=ns.REAL) for y in x]
+    expected = natsorted(
+        [y for shard in shards for y in shard], reverse=reverse, alg=ns.REAL
+    )
+    assert list(natmerge(*shards, reverse=reverse, alg=ns.REAL)) == expected
+    index = list(index_natmerge(*shards, reverse=reverse, alg=ns.REAL))
+    assert [shards[i][j] for i, j in index] == expected
+
+
+def test_natmerge_is_lazy_and_computes_each_key_once(mocker):
+    key = mocker.Mock(side_effect=str.lower)
+    shards = [iter(["a1", "B2", "c3"]), iter(["A10", "b20"])]
+    result = natmerge(*shards, key=key)
+    assert next(result) == "a1"
+    assert key.call_count == 2
+    assert list(result) == ["A10", "B2", "b20", "c3"]
+    assert key.call_count == 5
+
+
+def test_index_natmerge_applies_key():
+    given = [["a1", "C3"], ["B2"]]
+    assert list(index_natmerge(*given, key=str.lower)) == [(0, 0), (1, 0), (0, 1)]
+
+
+@given(x=repeated_values, n=integers(min_value=0, max_value=12))
+def test_natsmallest_and_natlargest_are_same_as_slice_of_natsorted(x, n):
+    # Equal values like "a1" and "a01" must stay in their input order.
+    assert natsmallest(n, iter(x)) == natsorted(x)[:n]
+    assert natlargest(n, iter(x)) == natsorted(x, reverse=True)[:n]
+
+
+def test_natsmallest_and_natlargest_apply_key_and_alg():
+    given = ["a10", "A2", "a-5", "a1"]
+    assert natsmallest(2, given, alg=ns.SIGNED | ns.IGNORECASE) == ["a-5", "a1"]
+    assert natlargest(3, given, key=str.lower) == ["a-5", "a10", "A2"]
+    assert natsmallest(1, [], alg=ns.REAL) == []
@@ -9,7 +9,15 @@ from hypothesis.strategies import floats, integers, lists, text
 from natsort.compat.fastnumbers import fast_float
 from natsort.ns_enum import NS_DUMB, ns
 from natsort.utils import NumericalRegularExpressions as NumRegex
-from natsort.utils import parse_string_factory
+from natsort.utils import (
+    final_data_transform_factory,
+    input_string_transform_factory,
+    parse_string_factory,
+    parse_string_lazy_factory,
+    regex_chooser,
+    sep_inserter,
+    string_component_transform_factory,
+)
 
 
 class CustomTuple(tuple):
@@ -89,3 +97,78 @@ def test_parse_string_factory_invariance(x, parse_string_func, orig_func):
     # Original should have gone through the "input_transform"
     # which is uppercase in these tests.
     assert result.original == orig_func(unicodedata.normalize("NFD", value))
+
+
+def test_parse_string_factory_uses_ascii_splitter_only_for_ascii_input():
+    def fail(_):
+        raise AssertionError("This should never be reached!")
+
+    func = parse_string_factory(
+        ns.DEFAULT, "", fail, input_transform, fast_float, final_transform, str.split
+    )
+    assert func("a 5") == ("A", 5.0)
+    func = parse_string_factory(
+        ns.DEFAULT, "", str.split, input_transform, fast_float, final_transform, fail
+    )
+    assert func("\u00e9 5") == ("E\u0301", 5.0)
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.DEFAULT,
+        ns.FLOAT,
+        ns.REAL | ns.NANLAST,
+        ns.IGNORECASE,
+        ns.LOWERCASEFIRST | ns.GROUPLETTERS,
+        ns.COMPATIBILITYNORMALIZE,
+    ],
+)
+@given(x=text())
+def test_parse_string_factory_is_equivalent_to_chaining_the_transforms(alg, x):
+    sep = ""
+    input_xfrm = input_string_transform_factory(alg)
+    component_xfrm = string_component_transform_factory(alg)
+    final_xfrm = final_data_transform_factory(alg, sep, sep)
+    form = "NFKD" if alg & ns.COMPATIBILITYNORMALIZE else "NFD"
+    splitter = regex_chooser(alg).split
+    func = parse_string_factory(
+        alg, sep, splitter, input_xfrm, component_xfrm, final_xfrm
+    )
+
+    y = input_xfrm(unicodedata.normalize(form, x))
+    expected = final_xfrm(
+        sep_inserter(map(component_xfrm, filter(None, splitter(y))), sep), y
+    )
+    assert func(x) == expected
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.DEFAULT,
+        ns.FLOAT,
+        ns.REAL | ns.NANLAST,
+        ns.FLOAT | ns.NOEXP,
+        ns.IGNORECASE,
+        ns.LOWERCASEFIRST | ns.GROUPLETTERS,
+        ns.COMPATIBILITYNORMALIZE,
+    ],
+)
+@given(x=text())
+def test_parse_string_lazy_factory_yields_the_components_of_parse_string_factory(
+    alg, x
+):
+    sep = ""
+    input_xfrm = input_string_transform_factory(alg)
+    component_xfrm = string_component_transform_factory(alg)
+    final_xfrm = final_data_transform_factory(alg, sep, sep)
+    regex = regex_chooser(alg)
+    ascii_regex = regex_chooser(alg, ascii_only=True)
+    func = parse_string_factory(
+        alg, sep, regex.split, input_xfrm, component_xfrm, final_xfrm
+    )
+    lazy_func = parse_string_lazy_factory(
+        alg, sep, regex, input_xfrm, component_xfrm, ascii_regex
+    )
+    assert tuple(lazy_func(x)) == func(x)
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """These test the splitting regular expressions."""
 
+import re
+import string
+
 import pytest
+from hypothesis import given
+from hypothesis.strategies import text
 from natsort import ns, numeric_regex_chooser
+from natsort.utils import AsciiNumericalRegularExpressions as AsciiNumRegex
 from natsort.utils import NumericalRegularExpressions as NumRegex
+from natsort.utils import regex_chooser
 
 
 regex_names = {
@@ -117,3 +124,25 @@ def test_regex_splits_correctly(x, expected, regex):
 )
 def test_regex_chooser(given, expected):
     assert numeric_regex_chooser(given) == expected.pattern[1:-1]  # remove parens
+
+
+@pytest.mark.parametrize("regex", list(regex_names), ids=list(regex_names.values()))
+def test_regex_is_only_compiled_once(regex):
+    name = regex_names[regex]
+    assert getattr(NumRegex, name)() is regex
+
+
+@pytest.mark.parametrize("name", list(regex_names.values()))
+@given(x=text(alphabet=string.printable))
+def test_ascii_regex_splits_ascii_input_like_unicode_regex(name, x):
+    ascii_regex = getattr(AsciiNumRegex, name)()
+    assert ascii_regex.split(x) == getattr(NumRegex, name)().split(x)
+
+
+@pytest.mark.parametrize(
+    "alg", [ns.INT, ns.INT | ns.SIGNED, ns.FLOAT, ns.REAL, ns.REAL | ns.NOEXP]
+)
+def test_regex_chooser_can_choose_ascii_only_regex(alg):
+    ascii_regex = regex_chooser(alg, ascii_only=True)
+    assert ascii_regex.flags & re.ASCII
+    assert ascii_regex.split("a-5.2e3b") == regex_chooser(alg).split("a-5.2e3b")
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""\
+Test natural-order binary search and NatSortedList.
+"""
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+from natsort import (
+    NatSortedList,
+    bisect_left,
+    bisect_right,
+    insort,
+    natsort_keygen,
+    natsorted,
+    ns,
+)
+
+# Include values that are equal in natural order but are not equal.
+values = sampled_from(["a1", "a01", "A2", "a10", "b", "1", "x-2", "a1.5", ""])
+algs = sampled_from([ns.DEFAULT, ns.REAL | ns.IGNORECASE])
+
+
+@pytest.fixture
+def small_chunks(mocker):
+    """Use small chunks, so that splitting and removing chunks is tested."""
+    mocker.patch("natsort.sorted_list.SORTED_LIST_LOAD", 2)
+
+
+@given(x=lists(values), needle=values, alg=algs)
+def test_bisect_is_same_with_and_without_keys(x, needle, alg):
+    x = natsorted(x, alg=alg)
+    keys = list(map(natsort_keygen(alg=alg), x))
+    left = bisect_left(x, needle, alg=alg)
+    right = bisect_right(x, needle, alg=alg)
+    assert bisect_left(None, needle, keys=keys, alg=alg) == left
+    assert bisect_right(None, needle, keys=keys, alg=alg) == right
+    assert natsorted(x[:left] + [needle] + x[left:], alg=alg)[left] == needle
+    assert natsorted(x[:right] + [needle] + x[right:], alg=alg)[right] == needle
+
+
+def test_bisect_with_keys_parses_only_the_needle(mocker):
+    x = ["a2", "a10", "a20"]
+    keys = list(map(natsort_keygen(), x))
+    natkey = mocker.Mock(side_effect=natsort_keygen())
+    mocker.patch("natsort.sorted_list.natsort_keygen", return_value=natkey)
+    assert bisect_right(x, "a10", keys=keys) == 2
+    natkey.assert_called_once_with("a10")
+
+
+def test_bisect_applies_key_lo_and_hi():
+    x = [("b", "a1"), ("a", "a2"), ("c", "a10")]
+    assert bisect_left(x, ("z", "a5"), key=lambda x: x[1]) == 2
+    assert bisect_left(["a1", "a2", "a3"], "a3", hi=1) == 1
+    with pytest.raises(ValueError, match="'lo' must be non-negative"):
+        bisect_left(x, "a1", lo=-1)
+
+
+@given(x=lists(values), alg=algs)
+def test_insort_is_same_as_natsorted(x, alg):
+    a, b, keys = [], [], []
+    for value in x:
+        insort(a, value, alg=alg)
+        insort(b, value, keys=keys, alg=alg)
+    assert a == b == natsorted(x, alg=alg)
+    assert keys == list(map(natsort_keygen(alg=alg), a))
+
+
+@pytest.mark.usefixtures("small_chunks")
+@given(
+    initial=lists(values),
+    ops=lists(tuples(sampled_from(["add", "update", "remove", "pop"]), values)),
+    alg=algs,
+)
+def test_natsortedlist_is_same_as_natsorted(initial, ops, alg):
+    a = NatSortedList(initial, alg=alg)
+    expected = natsorted(initial, alg=alg)
+    for op, value in ops:
+        if op == "add":
+            a.add(value)
+            expected = natsorted(expected + [value], alg=alg)
+        elif op == "update":
+            a.update([value] * 3)
+            expected = natsorted(expected + [value] * 3, alg=alg)
+        elif op == "remove" and value in expected:
+            a.remove(value)
+            expected.remove(value)
+        elif op == "pop" and expected:
+            assert a.pop(len(expected) // 2) == expected.pop(len(expected) // 2)
+        assert list(a) == expected
+        assert len(a) == len(expected)
+    assert list(reversed(a)) == expected[::-1]
+    assert [a[i] for i in range(len(a))] == expected
+    assert a[1:-1] == expected[1:-1]
+    assert a[::2] == expected[::2]
+
+
+@pytest.mark.usefixtures("small_chunks")
+@given(x=lists(values), needle=values, alg=algs)
+def test_natsortedlist_searches_are_same_as_list(x, needle, alg):
+    a = NatSortedList(x, alg=alg)
+    expected = natsorted(x, alg=alg)
+    assert a.bisect_left(needle) == bisect_left(expected, needle, alg=alg)
+    assert a.bisect_right(needle) == bisect_right(expected, needle, alg=alg)
+    assert a.count(needle) == expected.count(needle)
+    assert (needle in a) is (needle in expected)
+    if needle in expected:
+        assert a.index(needle) == expected.index(needle)
+    else:
+        with pytest.raises(ValueError):
+            a.index(needle)
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_natsortedlist_count_does_not_iterate_from_the_start(mocker):
+    a = NatSortedList(["a{}".format(i) for i in range(100)] + ["a50", "a050"])
+    mocker.patch.object(NatSortedList, "__iter__", side_effect=AssertionError)
+    assert a.count("a50") == 2
+    assert a.count("a050") == 1
+    assert a.count("b") == 0
+
+
+@pytest.mark.usefixtures("small_chunks")
+@given(x=lists(integers(-10, 10)), lo=integers(-12, 12), hi=integers(-12, 12))
+def test_natsortedlist_irange(x, lo, hi):
+    a = NatSortedList(x)
+    assert list(a.irange(lo, hi)) == [v for v in sorted(x) if lo <= v <= hi]
+    exclusive = a.irange(lo, hi, inclusive=(False, False))
+    assert list(exclusive) == [v for v in sorted(x) if lo < v < hi]
+    assert list(a.irange(maximum=hi)) == [v for v in sorted(x) if v <= hi]
+    assert list(a.irange(minimum=lo)) == [v for v in sorted(x) if lo <= v]
+
+
+def test_natsortedlist_remove_finds_equal_value_among_naturally_equal():
+    a = NatSortedList(["a01", "a1", "a001", "a2"])
+    a.remove("a001")
+    assert list(a) == ["a01", "a1", "a2"]
+    a.discard("a0001")
+    with pytest.raises(ValueError, match="'a0001' is not in list"):
+        a.remove("a0001")
+
+
+def test_natsortedlist_applies_key_and_deletes():
+    a = NatSortedList(["C3", "a1", "B2", "d4"], key=str.lower)
+    assert list(a) == ["a1", "B2", "C3", "d4"]
+    del a[0]
+    del a[1:]
+    assert list(a) == ["B2"]
+    a.clear()
+    assert len(a) == 0
+    with pytest.raises(IndexError):
+        a[0]
+    assert repr(a) == "NatSortedList([])"
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""\
+Test natural sorting inside SQLite.
+"""
+
+import sqlite3
+
+import pytest
+from natsort import natsorted, ns
+from natsort.sqlite import create_collation, create_key_function
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE files (name TEXT)")
+    given = ["file10.txt", "file1.txt", "File2.txt", "file-1.5.txt", "file1.5.txt"]
+    conn.executemany("INSERT INTO files VALUES (?)", ((x,) for x in given))
+    yield conn
+    conn.close()
+
+
+def names(conn, order_by):
+    return [x for x, in conn.execute("SELECT name FROM files ORDER BY " + order_by)]
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.REAL | ns.IGNORECASE, ns.PATH])
+def test_create_collation_orders_rows_like_natsorted(conn, alg):
+    create_collation(conn, alg=alg)
+    expected = natsorted(names(conn, "name"), alg=alg)
+    assert names(conn, "name COLLATE NATSORT") == expected
+    assert names(conn, "name COLLATE NATSORT DESC") == expected[::-1]
+
+
+def test_create_collation_computes_each_key_once(conn):
+    collate = create_collation(conn, name="natural_cached")
+    names(conn, "name COLLATE natural_cached")
+    info = collate.cache_info()
+    assert info.misses == 5
+    assert info.hits > 0
+    collate.cache_clear()
+    assert collate.cache_info().currsize == 0
+
+
+def test_create_collation_applies_key(conn):
+    create_collation(conn, key=lambda x: x[4:])
+    expected = natsorted(names(conn, "name"), key=lambda x: x[4:])
+    assert names(conn, "name COLLATE NATSORT") == expected
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.REAL | ns.IGNORECASE, ns.PATH])
+def test_create_key_function_orders_rows_like_natsorted(conn, alg):
+    create_key_function(conn, alg=alg)
+    expected = natsorted(names(conn, "name"), alg=alg)
+    assert names(conn, "NATSORT_KEY(name)") == expected
+
+
+def test_create_key_function_can_be_used_in_an_index(conn):
+    create_key_function(conn)
+    conn.execute("INSERT INTO files VALUES (NULL)")
+    conn.execute("CREATE INDEX files_natural ON files (NATSORT_KEY(name))")
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT name FROM files ORDER BY NATSORT_KEY(name)"
+    ).fetchall()
+    assert "files_natural" in str(plan)
+    assert names(conn, "NATSORT_KEY(name)") == [None] + natsorted(
+        ["file10.txt", "file1.txt", "File2.txt", "file-1.5.txt", "file1.5.txt"]
+    )
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""\
+Test the lexicographically sortable text form of natsort keys.
+"""
+
+import sqlite3
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, lists, sampled_from, text
+from natsort import natsort_keygen, natsorted, normalized_string, ns
+
+# Strings made of characters that are interesting to natsort.
+natsort_strings = text(alphabet="ab A.,-+e0159\x00\x01\x02\x03\x04éß١", max_size=10)
+numbers = floats() | integers(min_value=-(10 ** 30), max_value=10 ** 30)
+
+exact_algs = [
+    ns.DEFAULT,
+    ns.FLOAT | ns.SIGNED,
+    ns.REAL | ns.NANLAST,
+    ns.REAL | ns.NOEXP,
+    ns.IGNORECASE | ns.NUMAFTER,
+    ns.LOWERCASEFIRST | ns.GROUPLETTERS,
+    ns.COMPATIBILITYNORMALIZE,
+]
+
+
+def cmp(a, b):
+    return (a > b) - (a < b)
+
+
+@given(
+    x=natsort_strings | numbers,
+    y=natsort_strings | numbers,
+    alg=sampled_from(exact_algs),
+)
+def test_normalized_string_has_the_same_order_as_natsort_keys(x, y, alg):
+    natkey = natsort_keygen(alg=alg)
+    expected = cmp(natkey(x), natkey(y))
+    assert cmp(normalized_string(x, alg), normalized_string(y, alg)) == expected
+
+
+@given(x=lists(text(alphabet="ab/.-_01 ", min_size=1, max_size=5), min_size=1))
+def test_normalized_string_has_the_same_order_as_natsort_keys_for_paths(x):
+    x = ["/" + "/".join(x[:i]) for i in range(1, len(x) + 1)]
+    result = sorted(x, key=lambda y: normalized_string(y, alg=ns.PATH | ns.REAL))
+    assert result == natsorted(x, alg=ns.PATH | ns.REAL)
+
+
+def test_normalized_string_gives_equal_strings_for_equal_keys():
+    assert normalized_string("a1") == normalized_string("a01")
+    assert normalized_string(5) == normalized_string(5.0)
+    assert normalized_string(0.0) == normalized_string(-0.0)
+
+
+def test_normalized_string_does_not_contain_nul_characters():
+    assert "\x00" not in normalized_string("a\x00b-0.5", alg=ns.REAL)
+
+
+def test_normalized_string_transforms_each_element_of_an_iterable():
+    given = ["a10", "a9", ("a", "b2")]
+    expected = [normalized_string(given[0]), normalized_string(given[1])]
+    result = normalized_string(iter(given))
+    assert result[:2] == expected
+    assert result[2] == "a\x01b\x02311112.\x01"
+
+
+def test_normalized_string_can_sort_in_sqlite():
+    given = ["file10.txt", "file1.txt", "File2.txt", "file-1.txt", "file1.5.txt"]
+    with sqlite3.connect(":memory:") as conn:
+        conn.execute("CREATE TABLE files (name TEXT, norm TEXT)")
+        conn.executemany(
+            "INSERT INTO files VALUES (?, ?)",
+            zip(given, normalized_string(given, alg=ns.IGNORECASE)),
+        )
+        result = conn.execute("SELECT name FROM files ORDER BY norm").fetchall()
+    assert [x for x, in result] == natsorted(given, alg=ns.IGNORECASE)
+
+
+def test_normalized_string_raises_value_error_for_locale():
+    with pytest.raises(ValueError, match="locale"):
+        normalized_string("a1", alg=ns.LOCALE)
+
+
+def test_normalized_string_transforms_a_tuple_as_one_value():
+    assert normalized_string(("a", "b2")) == "a\x01b\x02311112.\x01"
+
+
+@pytest.mark.parametrize("given", [[b"a1"], b"a1"])
+def test_normalized_string_raises_type_error_for_bytes(given):
+    with pytest.raises(TypeError, match="bytes"):
+        normalized_string(given)
@@ -3,9 +3,13 @@
 Test the Unicode numbers module.
 """
 
+import subprocess
+import sys
 import unicodedata
 
+import pytest
 from natsort.unicode_numbers import (
+    construct_numeric_strings,
     decimal_chars,
     decimals,
     digit_chars,
@@ -13,9 +17,10 @@ from natsort.unicode_numbers import (
     digits_no_decimals,
     numeric,
     numeric_chars,
-    numeric_hex,
     numeric_no_decimals,
 )
+from natsort.unicode_numeric_hex import numeric_hex
+from natsort.unicode_numeric_tables import numeric_tables
 
 
 def test_numeric_chars_contains_only_valid_unicode_numeric_characters():
@@ -66,3 +71,17 @@ def test_combined_string_contains_all_characters_in_list():
     assert numeric == "".join(numeric_chars)
     assert digits == "".join(digit_chars)
     assert decimals == "".join(decimal_chars)
+
+
+def test_numeric_strings_match_strings_constructed_from_unicodedata():
+    assert (decimals, digits, numeric) == construct_numeric_strings()
+
+
+@pytest.mark.skipif(
+    unicodedata.unidata_version not in numeric_tables,
+    reason="no pre-built unicode tables for this unicode database version",
+)
+def test_importing_unicode_numbers_does_not_construct_numeric_strings():
+    code = "import sys, natsort; print('natsort.unicode_numeric_hex' in sys.modules)"
+    out = subprocess.check_output([sys.executable, "-c", code])
+    assert out.strip() == b"False"
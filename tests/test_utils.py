@@ -10,7 +10,7 @@ from operator import neg as op_neg
 import pytest
 from hypothesis import given
 from hypothesis.strategies import integers, lists, sampled_from, text
-from natsort import utils
+from natsort import natsort_keygen, utils
 from natsort.ns_enum import ns
 
 
@@ -72,6 +72,38 @@ def test_ns_enum_values_and_aliases(alg, value_or_alias):
     assert alg == value_or_alias
 
 
+@pytest.mark.parametrize(
+    "given, alg, expected",
+    [
+        ([5, 2.5, float("nan")], ns.DEFAULT, [float("-inf"), 2.5, 5]),
+        ([5, 2.5, float("nan")], ns.NANLAST, [2.5, 5, float("inf")]),
+        (["10", "007", "9"], ns.DEFAULT, [7, 9, 10]),
+        (["10", "007", "9"], ns.FLOAT, [7.0, 9.0, 10.0]),
+    ],
+)
+def test_homogeneous_input_key_gives_numeric_key_for_numeric_input(
+    given, alg, expected
+):
+    key = utils.homogeneous_input_key(given, alg)
+    assert sorted(map(key, given)) == expected
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        [5, "6"],
+        [True, 5],
+        ["5", "a6"],
+        ["5", ""],
+        ["5", "\u0665"],  # Arabic-Indic 5
+        ["5", "5" * 1000],
+        [b"5", b"6"],
+    ],
+)
+def test_homogeneous_input_key_returns_none_for_other_input(given):
+    assert utils.homogeneous_input_key(given, ns.DEFAULT) is None
+
+
 def test_chain_functions_is_a_no_op_if_no_functions_are_given():
     x = 2345
     assert utils.chain_functions([])(x) is x
@@ -155,3 +187,56 @@ def test_path_splitter_splits_path_string_by_separator_and_removes_extension(x):
         pathlib.Path(z).stem,
         pathlib.Path(z).suffix,
     )
+
+
+@given(text(alphabet="/.a1 -"))
+def test_path_splitter_splits_str_same_as_pure_path(x):
+    # A str is split with string operations, and a path object with pathlib.
+    expected = tuple(utils.path_splitter(pathlib.PurePath(x)))
+    assert tuple(utils.path_splitter(x)) == expected
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX path rules")
+@pytest.mark.parametrize(
+    "given, expected",
+    [
+        ("", ()),
+        (".", ()),
+        ("//a/./b", ("//", "a", "b")),
+        ("///a//b.", ("/", "a", "b.")),
+        ("a/.bashrc", ("a", ".bashrc")),
+        ("a/.b.tar.gz", ("a", ".b", ".tar", ".gz")),
+        ("a/../b.1.5", ("a", "..", "b.1.5")),
+    ],
+)
+def test_path_splitter_handles_special_path_strings(given, expected):
+    assert tuple(utils.path_splitter(given)) == expected
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@given(
+    x=lists(integers(min_value=0, max_value=5), max_size=40),
+    start=integers(min_value=0, max_value=45),
+    size=integers(min_value=0, max_value=45),
+)
+def test_select_order_is_same_as_slice_of_stable_argsort(x, start, size, reverse):
+    stop = start + size
+    expected = sorted(range(len(x)), key=x.__getitem__, reverse=reverse)[start:stop]
+    assert utils.select_order(x, start, stop, reverse) == expected
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("start, stop", [(0, 5), (20, 30), (2000, 2100), (2900, None)])
+def test_select_order_partitions_large_input(start, stop, reverse):
+    # Few distinct keys, so that many are equal to each pivot.
+    x = [(i * 7919) % 50 for i in range(3000)]
+    expected = sorted(range(len(x)), key=x.__getitem__, reverse=reverse)[start:stop]
+    assert utils.select_order(x, start, stop, reverse) == expected
+
+
+@given(x=lists(integers(-20, 20) | text(alphabet="ab12", max_size=3)))
+def test_dense_ranks_is_the_position_among_the_sorted_distinct_keys(x):
+    natkey = natsort_keygen()
+    distinct_keys = sorted(set(map(natkey, x)))
+    expected = [distinct_keys.index(natkey(y)) for y in x]
+    assert utils.dense_ranks(x, natkey) == expected